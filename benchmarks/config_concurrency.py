@@ -0,0 +1,123 @@
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Throughput of rendering Sizes with per-thread configurations.
+
+    Compares SizeConfig.using with the workaround of setting the
+    global configuration while holding a lock.
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from bytesize import Size
+from bytesize import SizeConfig
+from bytesize import StrConfig
+
+_LOCK = threading.Lock()
+
+def render_locked(sizes, config):
+    """
+    Render sizes, setting the global configuration under a lock.
+
+    :param sizes: the sizes
+    :type sizes: list of Size
+    :param StrConfig config: the configuration
+    """
+    for size in sizes:
+        with _LOCK:
+            previous = SizeConfig.STR_CONFIG
+            SizeConfig.set_str_config(config)
+            try:
+                str(size)
+            finally:
+                SizeConfig.set_str_config(previous)
+
+def render_using(sizes, config):
+    """
+    Render sizes in a context-local configuration.
+
+    :param sizes: the sizes
+    :type sizes: list of Size
+    :param StrConfig config: the configuration
+    """
+    with SizeConfig.using(str_config=config):
+        for size in sizes:
+            str(size)
+
+def measure(render, threads, sizes):
+    """
+    Time rendering sizes in each of several threads.
+
+    :param render: the function that renders
+    :param int threads: the number of threads
+    :param sizes: the sizes
+    :type sizes: list of Size
+    :returns: the elapsed time in seconds
+    :rtype: float
+    """
+    workers = [
+       threading.Thread(
+          target=render,
+          args=(sizes, StrConfig(max_places=i % 4, binary_units=i % 2 == 0))
+       ) for i in range(threads)
+    ]
+    start = time.time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.time() - start
+
+def get_parser():
+    """
+    Generate an appropriate parser.
+
+    :returns: an argument parser
+    :rtype: `ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+       "--number",
+       default=20000,
+       help="number of sizes each thread renders",
+       type=int
+    )
+    parser.add_argument(
+       "--threads",
+       default=8,
+       help="number of threads",
+       type=int
+    )
+    return parser
+
+def main():
+    args = get_parser().parse_args()
+    sizes = [Size(i * 7919) for i in range(args.number)]
+
+    print("%-10s %14s" % ("method", "sizes/s"))
+    for (name, render) in [("lock", render_locked), ("using", render_using)]:
+        elapsed = measure(render, args.threads, sizes)
+        print("%-10s %14.0f" % (name, args.threads * args.number / elapsed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
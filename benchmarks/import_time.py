@@ -0,0 +1,127 @@
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+
+""" Time taken to import bytesize, checked against a budget.
+
+    Each statement is run in a fresh interpreter with -X importtime, and
+    the cumulative time of the imports it causes is taken from the
+    report, so that the time to start the interpreter is not counted.
+
+    The exit status is 1 if the least time for any statement exceeds its
+    budget.
+
+    Requires Python 3.7 or later, for -X importtime.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+STATEMENTS = [
+   ("import bytesize", 10.0),
+   ("from bytesize import Size", 60.0),
+   ("from bytesize import Size; str(Size(1))", 60.0)
+]
+""" Each statement and its budget in milliseconds. """
+
+_LINE = re.compile(
+   r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|"
+   r"(?P<indent>\s*)(?P<module>\S+)$"
+)
+
+def _report(statement):
+    """
+    Get the import time report for a statement.
+
+    :param str statement: the statement
+    :returns: the module and cumulative time of each top-level import
+    :rtype: list of tuple of str * int
+    :raises CalledProcessError: if the statement fails
+    """
+    output = subprocess.check_output(
+       [sys.executable, "-X", "importtime", "-c", statement],
+       stderr=subprocess.STDOUT,
+       universal_newlines=True
+    )
+    matches = (_LINE.match(line) for line in output.splitlines())
+    # Only top-level imports, i.e., those with the least indentation,
+    # so that each microsecond is counted once.
+    return [
+       (m.group("module"), int(m.group("cumulative"))) for m in matches \
+          if m is not None and m.group("indent") == " "
+    ]
+
+def import_time(statement):
+    """
+    Get the time taken by the imports caused by a statement.
+
+    :param str statement: the statement
+    :returns: the total time in milliseconds
+    :rtype: float
+    :raises CalledProcessError: if the statement fails
+
+    Imports which the interpreter does at startup are not counted.
+    """
+    startup = set(module for (module, _) in _report("pass"))
+    return sum(
+       time for (module, time) in _report(statement) \
+          if module not in startup
+    ) / 1000.0
+
+def get_parser():
+    """
+    Generate an appropriate parser.
+
+    :returns: an argument parser
+    :rtype: `ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+       "--repeat",
+       default=5,
+       help="number of times to run each statement",
+       type=int
+    )
+    parser.add_argument(
+       "--scale",
+       default=1.0,
+       help="multiplier for every budget, e.g., for a slow machine",
+       type=float
+    )
+    return parser
+
+def main():
+    args = get_parser().parse_args()
+
+    failed = False
+    print("%-45s %10s %10s" % ("statement", "ms", "budget"))
+    for (statement, budget) in STATEMENTS:
+        budget *= args.scale
+        elapsed = min(import_time(statement) for _ in range(args.repeat))
+        flag = ""
+        if elapsed > budget:
+            failed = True
+            flag = " !"
+        print("%-45s %10.2f %10.2f%s" % (statement, elapsed, budget, flag))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
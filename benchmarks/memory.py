@@ -0,0 +1,142 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Memory used per instance by the small value classes of bytesize.
+
+    Each class is measured as it is, and as an otherwise identical class
+    which keeps its attributes in a per-instance __dict__ rather than in
+    __slots__.
+
+    Configurations are interned, so constructing equal configurations
+    allocates nothing. To measure the objects themselves, configurations
+    are constructed directly, bypassing the intern table.
+
+    Requires Python 3.4 or later, for tracemalloc.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from bytesize import B
+from bytesize import Size
+from bytesize import DisplayConfig
+from bytesize import InputConfig
+from bytesize import ROUND_DOWN
+from bytesize import StrConfig
+
+from bytesize._constants import Unit
+from bytesize._constants import _RoundingMethod
+from bytesize._types import RadixNumber
+
+def config(cls, *values):
+    """
+    Construct a configuration without interning it.
+
+    :param type cls: a configuration class
+    :param values: the values, in the order of cls._FIELDS
+    :returns: a new configuration
+    """
+    # pylint: disable=protected-access
+    result = object.__new__(cls)
+    for (name, value) in zip(cls._FIELDS, values):
+        setattr(result, name, value)
+    return result
+
+FACTORIES = [
+   (Size, lambda cls, i: cls(i)),
+   (Unit, lambda cls, i: cls(i, "prefix", "abbr")),
+   (_RoundingMethod, lambda cls, i: cls("doc")),
+   (RadixNumber, lambda cls, i: cls(1, i, [], [])),
+   (StrConfig, lambda cls, i: config(cls, i, 1, True, False, None)),
+   (DisplayConfig, lambda cls, i: config(cls, False, True, "@")),
+   (InputConfig, lambda cls, i: config(cls, B, ROUND_DOWN)),
+]
+
+def unslotted(cls):
+    """
+    Get an equivalent class that stores its attributes in a __dict__.
+
+    :param type cls: a class that defines __slots__
+    :returns: a new class with the same methods but without __slots__
+    :rtype: type
+    """
+    excluded = set(cls.__slots__) | set(['__slots__'])
+    namespace = dict(
+       (k, v) for (k, v) in vars(cls).items() if k not in excluded
+    )
+    return type(cls.__name__, cls.__bases__, namespace)
+
+def bytes_per_instance(cls, factory, number):
+    """
+    Measure the memory allocated per instance.
+
+    :param type cls: the class to measure
+    :param factory: a function to construct an instance of cls
+    :param int number: the number of instances to construct
+    :returns: the number of bytes allocated per instance
+    :rtype: float
+
+    The arguments given to factory are allocated before measuring, so
+    that only the instances are counted.
+    """
+    args = [10 ** 12 + i for i in range(number)]
+    instances = [None] * number
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for (i, arg) in enumerate(args):
+        instances[i] = factory(cls, arg)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return float(after - before) / number
+
+def get_parser():
+    """
+    Generate an appropriate parser.
+
+    :returns: an argument parser
+    :rtype: `ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+       "--number",
+       default=100000,
+       help="number of instances to construct for each class",
+       type=int
+    )
+    return parser
+
+def main():
+    args = get_parser().parse_args()
+    print("%-16s %12s %12s" % ("class", "__dict__", "__slots__"))
+    for (cls, factory) in FACTORIES:
+        print(
+           "%-16s %12.1f %12.1f" % (
+              cls.__name__,
+              bytes_per_instance(unslotted(cls), factory, args.number),
+              bytes_per_instance(cls, factory, args.number)
+           )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Speedup of parallel formatting, parsing and rounding with workers.
+
+    Each operation is timed serially and then with an increasing number
+    of worker processes, on the same sizes. The speedup with n workers
+    should approach n, until the number of CPUs is reached.
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+
+from bytesize import MiB
+from bytesize import ROUND_UP
+from bytesize import Size
+from bytesize import formatSizes
+from bytesize import getSizesFromInput
+from bytesize import parallelFormatSizes
+from bytesize import parallelGetSizesFromInput
+from bytesize import parallelRoundSizes
+from bytesize import roundSizes
+
+def _operations(count):
+    """
+    Get the operations to time.
+
+    :param int count: the number of values
+    :returns: the name, serial function, and parallel function of each
+    :rtype: list of tuple of str * callable * callable
+    """
+    sizes = [Size(n * 7919 + 13) for n in range(count)]
+    values = ["%d.5 KiB" % n for n in range(count)]
+    return [
+       (
+          "format",
+          lambda: formatSizes(sizes),
+          lambda w, c: parallelFormatSizes(sizes, max_workers=w, chunksize=c)
+       ),
+       (
+          "parse",
+          lambda: getSizesFromInput(values),
+          lambda w, c: parallelGetSizesFromInput(
+             values,
+             max_workers=w,
+             chunksize=c
+          )
+       ),
+       (
+          "round",
+          lambda: roundSizes(sizes, MiB, ROUND_UP),
+          lambda w, c: parallelRoundSizes(
+             sizes,
+             MiB,
+             ROUND_UP,
+             max_workers=w,
+             chunksize=c
+          )
+       )
+    ]
+
+def _time(function):
+    """
+    Time consuming the values a function generates.
+
+    :param callable function: the function, of no arguments
+    :returns: the elapsed time in seconds
+    :rtype: float
+    """
+    start = time.time()
+    for _ in function():
+        pass
+    return time.time() - start
+
+def get_parser():
+    """
+    Generate an appropriate parser.
+
+    :returns: an argument parser
+    :rtype: `ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+       "--count",
+       default=1000000,
+       help="number of values",
+       type=int
+    )
+    parser.add_argument(
+       "--chunksize",
+       default=10000,
+       help="number of values in a chunk",
+       type=int
+    )
+    parser.add_argument(
+       "--workers",
+       default=multiprocessing.cpu_count(),
+       help="largest number of worker processes",
+       type=int
+    )
+    return parser
+
+def main():
+    args = get_parser().parse_args()
+    row = "%-10s %8s %10.2f %8.2f"
+    print("%-10s %8s %10s %8s" % ("operation", "workers", "seconds", "speedup"))
+    for (name, serial, parallel) in _operations(args.count):
+        base = _time(serial)
+        print(row % (name, "serial", base, 1.0))
+        workers = 1
+        while True:
+            elapsed = _time(lambda: parallel(workers, args.chunksize))
+            print(row % (name, workers, elapsed, base / elapsed))
+            if workers >= args.workers:
+                break
+            workers = min(workers * 2, args.workers)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Throughput of parsing human-readable sizes.
+
+    Compares getSizeFromInput with a parser that matches each string
+    against a regular expression and looks up the unit in a list.
+"""
+
+import argparse
+import re
+import sys
+import timeit
+
+from fractions import Fraction
+
+from bytesize import getSizeFromInput
+from bytesize import Size
+from bytesize import SizeConfig
+from bytesize import UNITS
+
+INPUTS = ["10 GiB", "1.5MB", "512k", "4096", "3 mebibytes", "0.25 TiB"]
+
+_REGEX = re.compile(r"^\s*([-+]?[0-9./]+)\s*([A-Za-z]*)\s*$")
+
+def naive_parse(text):
+    """
+    Parse text with a regular expression.
+
+    :param str text: the text
+    :returns: the size
+    :rtype: Size
+    """
+    (number, suffix) = _REGEX.match(text).groups()
+    suffix = suffix.lower()
+    for unit in UNITS():
+        names = (
+           unit.abbr.lower(),
+           str(unit).lower(),
+           unit.prefix + "byte",
+           unit.prefix + "bytes"
+        )
+        if suffix in names:
+            break
+    else:
+        raise ValueError(text)
+    config = SizeConfig.INPUT_CONFIG
+    return Size(Fraction(number), unit).roundTo(config.unit, config.method)
+
+def get_parser():
+    """
+    Generate an appropriate parser.
+
+    :returns: an argument parser
+    :rtype: `ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+       "--number",
+       default=100000,
+       help="number of strings to parse in each measurement",
+       type=int
+    )
+    parser.add_argument(
+       "--repeat",
+       default=3,
+       help="number of times to repeat each measurement",
+       type=int
+    )
+    return parser
+
+def main():
+    args = get_parser().parse_args()
+    texts = (INPUTS * (args.number // len(INPUTS) + 1))[:args.number]
+
+    print("%-20s %14s" % ("parser", "strings/s"))
+    for (name, parse) in [
+       ("getSizeFromInput", getSizeFromInput),
+       ("regex", naive_parse)
+    ]:
+        elapsed = min(
+           timeit.repeat(
+              lambda p=parse: [p(t) for t in texts],
+              number=1,
+              repeat=args.repeat
+           )
+        )
+        print("%-20s %14.0f" % (name, args.number / elapsed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Time to compute repeating decimal expansions for hard denominators.
+
+    The denominators are chosen so that the repeating part of the
+    expansion is very long, as happens when a Size is divided by a
+    large odd number.
+"""
+
+import argparse
+import sys
+import timeit
+
+from fractions import Fraction
+
+from bytesize import Size
+
+from bytesize._util.math_util import get_repeating_fraction
+
+DENOMINATORS = [
+   ("7", 7),
+   ("prime 9973", 9973),
+   ("prime 99991", 99991),
+   ("prime 999983", 999983),
+   ("2^20 * 999983", 2 ** 20 * 999983),
+   ("5^12 * 3 * 99991", 5 ** 12 * 3 * 99991),
+]
+
+def get_parser():
+    """
+    Generate an appropriate parser.
+
+    :returns: an argument parser
+    :rtype: `ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+       "--repeat",
+       default=3,
+       help="number of times to repeat each measurement",
+       type=int
+    )
+    return parser
+
+def main():
+    args = get_parser().parse_args()
+    print(
+       "%-20s %10s %14s %14s" %
+       ("denominator", "period", "fraction (s)", "repr (s)")
+    )
+    for (name, denominator) in DENOMINATORS:
+        (_, period) = get_repeating_fraction(1, denominator)
+        fraction = min(
+           timeit.repeat(
+              lambda d=denominator: get_repeating_fraction(1, d),
+              number=1,
+              repeat=args.repeat
+           )
+        )
+        size = Size(Fraction(1, denominator))
+        rep = min(
+           timeit.repeat(lambda s=size: repr(s), number=1, repeat=args.repeat)
+        )
+        print("%-20s %10d %14.4f %14.4f" % (name, period, fraction, rep))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
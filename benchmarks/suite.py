@@ -0,0 +1,266 @@
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+
+""" Timings of the operations of Size, saved and compared as JSON.
+
+    Measures construction, every binary operator, string conversion,
+    components, rounding, parsing and the _util.misc helpers, the last
+    with denominators chosen to give long decimal expansions.
+
+    To catch regressions, save a baseline and compare with it later:
+
+        python benchmarks/suite.py --output baseline.json
+        python benchmarks/suite.py --baseline baseline.json
+
+    The exit status is 1 if any operation is slower than in the baseline
+    by more than the tolerance.
+"""
+
+import argparse
+import json
+import platform
+import re
+import sys
+import timeit
+
+from decimal import Decimal
+from fractions import Fraction
+
+from bytesize import getSizeFromInput
+from bytesize import GiB
+from bytesize import KiB
+from bytesize import MiB
+from bytesize import ROUND_HALF_UP
+from bytesize import ROUND_UP
+from bytesize import Size
+from bytesize import SizeConfig
+from bytesize import StrConfig
+
+from bytesize._util.misc import convert_magnitude
+from bytesize._util.misc import get_decimal_info
+from bytesize._util.misc import get_string_info
+
+_SMALL = Size(3, GiB)
+_OTHER = Size(7, MiB)
+_FRACTIONAL = Size(Fraction(1, 3), KiB)
+
+_ADVERSARIAL = [
+   # The decimal expansion repeats with period 9972.
+   ("prime", Fraction(1, 9973)),
+   # The decimal expansion has 80 digits before it terminates.
+   ("power", Fraction(1, 2 ** 80)),
+   # A long non-repeating part followed by a long period.
+   ("mixed", Fraction(10 ** 30 + 1, 2 ** 40 * 9973))
+]
+
+def _cases():
+    """
+    Get the operations to measure.
+
+    :returns: the name and a callable of no arguments for each operation
+    :rtype: list of tuple of str * callable
+    """
+    # pylint: disable=unnecessary-lambda
+    exact = StrConfig(max_places=None)
+    display = SizeConfig.DISPLAY_CONFIG
+    cases = [
+       ("init.int", lambda: Size(1024)),
+       ("init.int.units", lambda: Size(3, GiB)),
+       ("init.str", lambda: Size("1024.5")),
+       ("init.decimal", lambda: Size(Decimal("1.25"), MiB)),
+       ("init.fraction", lambda: Size(Fraction(1, 3), KiB)),
+       ("init.size", lambda: Size(_SMALL)),
+       ("op.add", lambda: _SMALL + _OTHER),
+       ("op.sub", lambda: _SMALL - _OTHER),
+       ("op.mul", lambda: _SMALL * 3),
+       ("op.rmul", lambda: 3 * _SMALL),
+       ("op.truediv.size", lambda: _SMALL / _OTHER),
+       ("op.truediv.number", lambda: _SMALL / 3),
+       ("op.floordiv.size", lambda: _SMALL // _OTHER),
+       ("op.floordiv.number", lambda: _SMALL // 3),
+       ("op.mod.size", lambda: _SMALL % _OTHER),
+       ("op.mod.number", lambda: _SMALL % 3),
+       ("op.divmod.size", lambda: divmod(_SMALL, _OTHER)),
+       ("op.divmod.number", lambda: divmod(_SMALL, 3)),
+       ("op.eq", lambda: _SMALL == _OTHER),
+       ("op.lt", lambda: _SMALL < _OTHER),
+       ("op.add.fractional", lambda: _FRACTIONAL + _OTHER),
+       ("str", lambda: str(_SMALL)),
+       ("str.fractional", lambda: str(_FRACTIONAL)),
+       ("repr", lambda: repr(_SMALL)),
+       ("repr.fractional", lambda: repr(_FRACTIONAL)),
+       ("components", lambda: _SMALL.components()),
+       ("componentsList", lambda: list(_SMALL.componentsList())),
+       ("roundTo", lambda: _SMALL.roundTo(MiB, ROUND_UP)),
+       ("roundTo.fractional", lambda: _FRACTIONAL.roundTo(KiB, ROUND_HALF_UP)),
+       ("getSizeFromInput.number", lambda: getSizeFromInput(4096)),
+       ("getSizeFromInput.str", lambda: getSizeFromInput("1.5 GiB")),
+    ]
+    for (name, value) in _ADVERSARIAL:
+        info = get_decimal_info(value)
+        cases.extend([
+           (
+              "misc.get_decimal_info.%s" % name,
+              lambda v=value: get_decimal_info(v)
+           ),
+           (
+              "misc.get_string_info.%s" % name,
+              lambda v=value: get_string_info(v, places=2)
+           ),
+           (
+              "misc.convert_magnitude.%s" % name,
+              lambda i=info: convert_magnitude(
+                 i.left,
+                 i.non_repeating,
+                 i.repeating,
+                 places=20
+              )
+           ),
+           (
+              "str.exact.%s" % name,
+              lambda v=Size(value): v.getString(exact, display)
+           )
+        ])
+    return cases
+
+def measure(function, repeat, minimum):
+    """
+    Measure the time a function takes.
+
+    :param callable function: the function, of no arguments
+    :param int repeat: the number of measurements
+    :param float minimum: the least time in seconds for a measurement
+    :returns: the least time in seconds for one call
+    :rtype: float
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < minimum:
+        number *= 10
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results with a baseline.
+
+    :param dict results: time per call for each operation
+    :param dict baseline: time per call for each operation in the baseline
+    :param float tolerance: the largest acceptable fraction slower
+    :returns: the names of the operations which are too much slower
+    :rtype: list of str
+    """
+    regressions = []
+    print("%-40s %12s %12s %8s" % ("operation", "baseline", "current", "ratio"))
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        ratio = results[name] / baseline[name]
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = " !"
+        print(
+           "%-40s %12.3g %12.3g %8.2f%s" % \
+              (name, baseline[name], results[name], ratio, flag)
+        )
+    return regressions
+
+def get_parser():
+    """
+    Generate an appropriate parser.
+
+    :returns: an argument parser
+    :rtype: `ArgumentParser`
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+       "--baseline",
+       help="JSON file of an earlier run to compare with"
+    )
+    parser.add_argument(
+       "--filter",
+       default="",
+       help="regular expression selecting the operations to measure"
+    )
+    parser.add_argument(
+       "--minimum",
+       default=0.05,
+       help="least time in seconds for each measurement",
+       type=float
+    )
+    parser.add_argument(
+       "--output",
+       help="JSON file in which to save the results"
+    )
+    parser.add_argument(
+       "--repeat",
+       default=5,
+       help="number of times to repeat each measurement",
+       type=int
+    )
+    parser.add_argument(
+       "--tolerance",
+       default=0.25,
+       help="largest acceptable fraction slower than the baseline",
+       type=float
+    )
+    return parser
+
+def main():
+    args = get_parser().parse_args()
+    selected = re.compile(args.filter)
+
+    results = dict()
+    for (name, function) in _cases():
+        if selected.search(name):
+            results[name] = measure(function, args.repeat, args.minimum)
+
+    if args.output is not None:
+        with open(args.output, "w") as output:
+            json.dump(
+               {
+                  "python" : platform.python_version(),
+                  "implementation" : platform.python_implementation(),
+                  "results" : results
+               },
+               output,
+               indent=2,
+               sort_keys=True
+            )
+
+    if args.baseline is None:
+        print("%-40s %12s" % ("operation", "s/call"))
+        for name in sorted(results):
+            print("%-40s %12.3g" % (name, results[name]))
+        return 0
+
+    with open(args.baseline) as baseline:
+        regressions = compare(
+           results,
+           json.load(baseline)["results"],
+           args.tolerance
+        )
+    if regressions:
+        print("slower than baseline: %s" % ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
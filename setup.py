@@ -57,4 +57,8 @@ setuptools.setup(
         ],
     package_dir={"": "src"},
     packages=setuptools.find_packages("src"),
+    extras_require={
+        'numpy': ['numpy'],
+        'parallel': ['futures; python_version < "3"'],
+        },
     )
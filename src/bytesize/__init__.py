@@ -63,6 +63,50 @@
     * Size classes:
        - Size: :class:`._size.Size`
        - AI: :class:`._sizes.AI`
+       - SizeArray: :class:`._array.SizeArray`, requires numpy
+
+    * Rounding and reading many Sizes:
+       - roundSizes: :func:`._sizes.roundSizes`
+       - getSizesFromInput: :func:`._sizes.getSizesFromInput`
+
+    * Encoding many Sizes compactly:
+       - encodeSizes: :func:`._serialize.encodeSizes`
+       - decodeSizes: :func:`._serialize.decodeSizes`
+
+    * Aligning Sizes:
+       - alignDown: :func:`._align.alignDown`
+       - alignUp: :func:`._align.alignUp`
+       - isAligned: :func:`._align.isAligned`
+       - alignedChunks: :func:`._align.alignedChunks`
+
+    * Formatting many Sizes:
+       - SizeFormatter: :class:`._formatter.SizeFormatter`
+       - formatSizes: :func:`._formatter.formatSizes`
+
+    * Converting very many Sizes in a pool of processes:
+       - parallelGetSizesFromInput: :func:`._parallel.parallelGetSizesFromInput`
+       - parallelRoundSizes: :func:`._parallel.parallelRoundSizes`
+       - parallelFormatSizes: :func:`._parallel.parallelFormatSizes`
+
+    * Caching string representations:
+       - enableRenderCache: :func:`._cache.enableRenderCache`
+       - disableRenderCache: :func:`._cache.disableRenderCache`
+       - getRenderCacheInfo: :func:`._cache.getRenderCacheInfo`
+
+    * Profiling operations on Sizes:
+       - enableProfiling: :func:`._profile.enableProfiling`
+       - disableProfiling: :func:`._profile.disableProfiling`
+       - getProfile: :func:`._profile.getProfile`
+       - resetProfile: :func:`._profile.resetProfile`
+       - profiling: :func:`._profile.profiling`
+
+    * Reading Sizes from text:
+       - readSizes: :func:`._reader.readSizes`
+       - totalSizes: :func:`._reader.totalSizes`
+
+    * Statistics of many Sizes:
+       - SizeStats: :class:`._stats.SizeStats`
+       - SizeHistogram: :class:`._histogram.SizeHistogram`
 
     All parts of the public interface of bytesize must be imported directly
     from the top-level bytesize module, as::
@@ -76,54 +120,193 @@
             s + 32
         except SizeError as e:
             raise e
+
+    The submodule which defines a name is imported only when the name is
+    first used, so that importing bytesize is cheap. In particular, numpy
+    is imported only if SizeArray is used.
+"""
+import importlib
+import sys
+
+_EXPORTS = {
+   # UNIT CONSTANTS
+   'B' : ('_constants', 'B'),
+   'KB' : ('_constants', 'DecimalUnits.KB'),
+   'MB' : ('_constants', 'DecimalUnits.MB'),
+   'GB' : ('_constants', 'DecimalUnits.GB'),
+   'TB' : ('_constants', 'DecimalUnits.TB'),
+   'PB' : ('_constants', 'DecimalUnits.PB'),
+   'EB' : ('_constants', 'DecimalUnits.EB'),
+   'ZB' : ('_constants', 'DecimalUnits.ZB'),
+   'YB' : ('_constants', 'DecimalUnits.YB'),
+   'KiB' : ('_constants', 'BinaryUnits.KiB'),
+   'MiB' : ('_constants', 'BinaryUnits.MiB'),
+   'GiB' : ('_constants', 'BinaryUnits.GiB'),
+   'TiB' : ('_constants', 'BinaryUnits.TiB'),
+   'PiB' : ('_constants', 'BinaryUnits.PiB'),
+   'EiB' : ('_constants', 'BinaryUnits.EiB'),
+   'ZiB' : ('_constants', 'BinaryUnits.ZiB'),
+   'YiB' : ('_constants', 'BinaryUnits.YiB'),
+   'UNITS' : ('_constants', 'UNITS'),
+
+   # ROUNDING CONSTANTS
+   'ROUND_DOWN' : ('_constants', 'RoundingMethods.ROUND_DOWN'),
+   'ROUND_HALF_DOWN' : ('_constants', 'RoundingMethods.ROUND_HALF_DOWN'),
+   'ROUND_HALF_UP' : ('_constants', 'RoundingMethods.ROUND_HALF_UP'),
+   'ROUND_UP' : ('_constants', 'RoundingMethods.ROUND_UP'),
+   'ROUNDING_METHODS' : ('_constants', 'ROUNDING_METHODS'),
+
+   # CONFIGURATION
+   'DisplayConfig' : ('_config', 'DisplayConfig'),
+   'InputConfig' : ('_config', 'InputConfig'),
+   'SizeConfig' : ('_config', 'SizeConfig'),
+   'StrConfig' : ('_config', 'StrConfig'),
+
+   # EXCEPTIONS
+   'SizeError' : ('_errors', 'SizeError'),
+
+   # SIZE
+   'Size' : ('_size', 'Size'),
+   'getSizeFromInput' : ('_sizes', 'getSizeFromInput'),
+   'getSizesFromInput' : ('_sizes', 'getSizesFromInput'),
+   'roundSizes' : ('_sizes', 'roundSizes'),
+   'AI' : ('_sizes', 'AI'),
+   'SizeArray' : ('_array', 'SizeArray'),
+
+   # SERIALIZATION
+   'decodeSizes' : ('_serialize', 'decodeSizes'),
+   'encodeSizes' : ('_serialize', 'encodeSizes'),
+
+   # ALIGNMENT
+   'alignDown' : ('_align', 'alignDown'),
+   'alignUp' : ('_align', 'alignUp'),
+   'alignedChunks' : ('_align', 'alignedChunks'),
+   'isAligned' : ('_align', 'isAligned'),
+
+   # FORMATTING
+   'SizeFormatter' : ('_formatter', 'SizeFormatter'),
+   'formatSizes' : ('_formatter', 'formatSizes'),
+
+   # PARALLEL CONVERSION
+   'parallelFormatSizes' : ('_parallel', 'parallelFormatSizes'),
+   'parallelGetSizesFromInput' : ('_parallel', 'parallelGetSizesFromInput'),
+   'parallelRoundSizes' : ('_parallel', 'parallelRoundSizes'),
+
+   # CACHING
+   'disableRenderCache' : ('_cache', 'disableRenderCache'),
+   'enableRenderCache' : ('_cache', 'enableRenderCache'),
+   'getRenderCacheInfo' : ('_cache', 'getRenderCacheInfo'),
+
+   # PROFILING
+   'disableProfiling' : ('_profile', 'disableProfiling'),
+   'enableProfiling' : ('_profile', 'enableProfiling'),
+   'getProfile' : ('_profile', 'getProfile'),
+   'profiling' : ('_profile', 'profiling'),
+   'resetProfile' : ('_profile', 'resetProfile'),
+
+   # READING
+   'readSizes' : ('_reader', 'readSizes'),
+   'totalSizes' : ('_reader', 'totalSizes'),
+
+   # STATISTICS
+   'SizeStats' : ('_stats', 'SizeStats'),
+   'SizeHistogram' : ('_histogram', 'SizeHistogram'),
+}
+""" The submodule and attribute which define each public name. """
+
+__all__ = sorted(_EXPORTS)
+
+_STATIC = False
+""" Never true. Static checkers, which can not follow __getattr__, read
+    the imports below to find the public names.
 """
-# pylint: disable=invalid-name
-# pylint: disable=wrong-import-position
-
-# UNIT CONSTANTS
-from ._constants import B
-
-from ._constants import DecimalUnits as _DecimalUnits
-KB = _DecimalUnits.KB
-MB = _DecimalUnits.MB
-GB = _DecimalUnits.GB
-TB = _DecimalUnits.TB
-PB = _DecimalUnits.PB
-EB = _DecimalUnits.EB
-ZB = _DecimalUnits.ZB
-YB = _DecimalUnits.YB
-
-from ._constants import BinaryUnits as _BinaryUnits
-KiB = _BinaryUnits.KiB
-MiB = _BinaryUnits.MiB
-GiB = _BinaryUnits.GiB
-TiB = _BinaryUnits.TiB
-PiB = _BinaryUnits.PiB
-EiB = _BinaryUnits.EiB
-ZiB = _BinaryUnits.ZiB
-YiB = _BinaryUnits.YiB
-
-from ._constants import UNITS
-
-# ROUNDING CONSTANTS
-from ._constants import RoundingMethods as _RoundingMethods
-ROUND_DOWN = _RoundingMethods.ROUND_DOWN
-ROUND_HALF_DOWN = _RoundingMethods.ROUND_HALF_DOWN
-ROUND_HALF_UP = _RoundingMethods.ROUND_HALF_UP
-ROUND_UP = _RoundingMethods.ROUND_UP
-
-from ._constants import ROUNDING_METHODS
-
-# CONFIGURATION
-from ._config import DisplayConfig
-from ._config import InputConfig
-from ._config import SizeConfig
-from ._config import StrConfig
-
-# EXCEPTIONS
-from ._errors import SizeError
-
-# SIZE
-from ._size import Size
-from ._sizes import getSizeFromInput
-from ._sizes import AI
+
+if _STATIC: # pragma: no cover
+    from ._align import alignDown
+    from ._align import alignedChunks
+    from ._align import alignUp
+    from ._align import isAligned
+    from ._array import SizeArray
+    from ._cache import disableRenderCache
+    from ._cache import enableRenderCache
+    from ._cache import getRenderCacheInfo
+    from ._config import DisplayConfig
+    from ._config import InputConfig
+    from ._config import SizeConfig
+    from ._config import StrConfig
+    from ._constants import B
+    from ._constants import BinaryUnits
+    from ._constants import DecimalUnits
+    from ._constants import ROUNDING_METHODS
+    from ._constants import RoundingMethods
+    from ._constants import UNITS
+    from ._errors import SizeError
+    from ._formatter import formatSizes
+    from ._formatter import SizeFormatter
+    from ._histogram import SizeHistogram
+    from ._parallel import parallelFormatSizes
+    from ._parallel import parallelGetSizesFromInput
+    from ._parallel import parallelRoundSizes
+    from ._profile import disableProfiling
+    from ._profile import enableProfiling
+    from ._profile import getProfile
+    from ._profile import profiling
+    from ._profile import resetProfile
+    from ._reader import readSizes
+    from ._reader import totalSizes
+    from ._serialize import decodeSizes
+    from ._serialize import encodeSizes
+    from ._size import Size
+    from ._sizes import AI
+    from ._sizes import getSizeFromInput
+    from ._sizes import getSizesFromInput
+    from ._sizes import roundSizes
+    from ._stats import SizeStats
+
+    KB = DecimalUnits.KB
+    MB = DecimalUnits.MB
+    GB = DecimalUnits.GB
+    TB = DecimalUnits.TB
+    PB = DecimalUnits.PB
+    EB = DecimalUnits.EB
+    ZB = DecimalUnits.ZB
+    YB = DecimalUnits.YB
+    KiB = BinaryUnits.KiB
+    MiB = BinaryUnits.MiB
+    GiB = BinaryUnits.GiB
+    TiB = BinaryUnits.TiB
+    PiB = BinaryUnits.PiB
+    EiB = BinaryUnits.EiB
+    ZiB = BinaryUnits.ZiB
+    YiB = BinaryUnits.YiB
+    ROUND_DOWN = RoundingMethods.ROUND_DOWN
+    ROUND_HALF_DOWN = RoundingMethods.ROUND_HALF_DOWN
+    ROUND_HALF_UP = RoundingMethods.ROUND_HALF_UP
+    ROUND_UP = RoundingMethods.ROUND_UP
+
+def __getattr__(name):
+    """ Import the submodule which defines a public name.
+
+        :param str name: the name
+        :returns: the value of the name
+        :raises AttributeError: if name is not public
+    """
+    try:
+        (module_name, path) = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+           "module %r has no attribute %r" % (__name__, name)
+        )
+    value = importlib.import_module("." + module_name, __name__)
+    for attr in path.split('.'):
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+# Module __getattr__ requires Python 3.7, so import everything otherwise.
+if sys.version_info < (3, 7): # pragma: no cover
+    for _name in __all__:
+        __getattr__(_name)
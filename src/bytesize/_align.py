@@ -0,0 +1,168 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Aligning Sizes, e.g., offsets and extents, to a unit. """
+
+from fractions import Fraction
+
+import six
+
+from ._constants import RoundingMethods
+
+from ._errors import SizeValueError
+
+from ._size import Size
+
+from ._util.math_util import round_quotient
+
+
+def _alignment(alignment):
+    # pylint: disable=line-too-long
+    """ Get the number of bytes in an alignment and, if it is a power of
+        two, a mask for the bits below it.
+
+        :param alignment: the alignment
+        :type alignment: any positive :class:`Size` or element in :func:`._constants.UNITS`
+        :returns: the number of bytes and the mask, or None
+        :rtype: tuple of (int or Fraction) * (int or NoneType)
+        :raises SizeValueError: if alignment is not positive
+    """
+    factor = getattr(alignment, 'magnitude', None) or int(alignment)
+    if factor <= 0:
+        raise SizeValueError(alignment, "alignment", "must be positive")
+    if factor.denominator != 1:
+        return (Fraction(factor), None)
+    factor = factor.numerator
+    mask = factor - 1
+    return (factor, mask if factor & mask == 0 else None)
+
+def _align(size, alignment, rounding):
+    """ Round a Size to a multiple of alignment.
+
+        :param Size size: the size
+        :param alignment: the alignment
+        :param rounding: ROUND_DOWN or ROUND_UP
+        :returns: the aligned size
+        :rtype: :class:`Size`
+        :raises SizeValueError: on unusable arguments
+    """
+    if not isinstance(size, Size):
+        raise SizeValueError(size, "size", "must be a Size")
+    (factor, mask) = _alignment(alignment)
+    # pylint: disable=protected-access
+    magnitude = size._magnitude
+    if mask is not None and isinstance(magnitude, six.integer_types):
+        if rounding is RoundingMethods.ROUND_UP:
+            magnitude += mask
+        return Size._fromMagnitude(magnitude & ~mask)
+    factor = Fraction(factor)
+    magnitude = Fraction(magnitude)
+    quotient = round_quotient(
+       magnitude.numerator * factor.denominator,
+       magnitude.denominator * factor.numerator,
+       rounding
+    )
+    return Size._fromMagnitude(quotient * factor)
+
+def alignDown(size, alignment):
+    # pylint: disable=line-too-long
+    """ Align a Size down to a multiple of alignment.
+
+        :param Size size: the size, e.g., an offset
+        :param alignment: the alignment
+        :type alignment: any positive :class:`Size` or element in :func:`._constants.UNITS`
+        :returns: the largest multiple of alignment no larger than size
+        :rtype: :class:`Size`
+        :raises SizeValueError: on unusable arguments
+
+        The result is the same as size.roundTo(alignment, ROUND_DOWN).
+        If alignment is a power of two bytes, as sectors, pages and
+        binary units are, the result is computed with a bit mask.
+    """
+    return _align(size, alignment, RoundingMethods.ROUND_DOWN)
+
+def alignUp(size, alignment):
+    # pylint: disable=line-too-long
+    """ Align a Size up to a multiple of alignment.
+
+        :param Size size: the size, e.g., an offset
+        :param alignment: the alignment
+        :type alignment: any positive :class:`Size` or element in :func:`._constants.UNITS`
+        :returns: the smallest multiple of alignment no smaller than size
+        :rtype: :class:`Size`
+        :raises SizeValueError: on unusable arguments
+
+        The result is the same as size.roundTo(alignment, ROUND_UP).
+        If alignment is a power of two bytes, as sectors, pages and
+        binary units are, the result is computed with a bit mask.
+    """
+    return _align(size, alignment, RoundingMethods.ROUND_UP)
+
+def isAligned(size, alignment):
+    # pylint: disable=line-too-long
+    """ Whether a Size is a multiple of alignment.
+
+        :param Size size: the size, e.g., an offset
+        :param alignment: the alignment
+        :type alignment: any positive :class:`Size` or element in :func:`._constants.UNITS`
+        :returns: True if size is a multiple of alignment, otherwise False
+        :rtype: bool
+        :raises SizeValueError: on unusable arguments
+    """
+    if not isinstance(size, Size):
+        raise SizeValueError(size, "size", "must be a Size")
+    (factor, mask) = _alignment(alignment)
+    # pylint: disable=protected-access
+    magnitude = size._magnitude
+    if mask is not None and isinstance(magnitude, six.integer_types):
+        return magnitude & mask == 0
+    return (magnitude / Fraction(factor)).denominator == 1
+
+def alignedChunks(start, end, alignment):
+    # pylint: disable=line-too-long
+    """ Split a range into chunks which do not cross multiples of alignment.
+
+        :param Size start: the start of the range, inclusive
+        :param Size end: the end of the range, exclusive
+        :param alignment: the alignment, i.e., the largest chunk
+        :type alignment: any positive :class:`Size` or element in :func:`._constants.UNITS`
+        :returns: a generator of the start and end of each chunk, in order
+        :rtype: generator of tuple of :class:`Size` * :class:`Size`
+        :raises SizeValueError: on unusable arguments
+
+        Every chunk but the first starts, and every chunk but the last
+        ends, at a multiple of alignment. If start is not less than end
+        there are no chunks.
+    """
+    if not isinstance(end, Size):
+        raise SizeValueError(end, "end", "must be a Size")
+    (factor, _) = _alignment(alignment)
+    boundary = alignDown(start, alignment)
+
+    def generate():
+        """ Generate the chunks. """
+        # pylint: disable=protected-access
+        (lower, upper) = (start._magnitude, end._magnitude)
+        current = boundary._magnitude + factor
+        while lower < upper:
+            following = min(current, upper)
+            yield (Size._fromMagnitude(lower), Size._fromMagnitude(following))
+            (lower, current) = (following, current + factor)
+
+    return generate()
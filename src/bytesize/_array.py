@@ -0,0 +1,668 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" SizeArray class, for computing with many Sizes at once.
+
+    Requires numpy, which is an optional dependency of bytesize.
+
+    A SizeArray stores the magnitudes of its elements in a numpy array.
+    If every magnitude is a whole number of bytes that fits in an int64
+    the array has dtype int64 and arithmetic is done by numpy. Otherwise,
+    the array has dtype object and holds the exact int or Fraction
+    magnitudes, just as Size does.
+
+    Arithmetic obeys the same rules as for Size, e.g., multiplying a
+    SizeArray by a Size or a SizeArray raises a SizePowerResultError.
+    A SizeArray must be the left operand of any operation with a Size.
+"""
+
+from fractions import Fraction
+
+try:
+    import numpy
+except ImportError: # pragma: no cover
+    numpy = None
+
+import six
+
+from ._config import SizeConfig
+
+from ._constants import B
+from ._constants import PRECISE_NUMERIC_TYPES
+from ._constants import RoundingMethods
+
+from ._errors import SizeFractionalResultError
+from ._errors import SizeNonsensicalBinOpError
+from ._errors import SizeNonsensicalBinOpValueError
+from ._errors import SizePowerResultError
+from ._errors import SizeValueError
+
+from ._size import Size
+from ._size import _as_number
+
+from ._util.math_util import is_exact_decimal
+from ._util.math_util import round_fraction
+from ._util.misc import get_string_info
+from ._util.units import get_unit_table
+
+# The least int64 is excluded, so that negating or taking the absolute
+# value of an int64 magnitude can never overflow.
+_INT64_MAX = 2 ** 63 - 1
+_INT64_MIN = -_INT64_MAX
+
+def _in_range(*values):
+    """ Whether all values can be stored in an int64 magnitude array.
+
+        :param values: ints
+        :rtype: bool
+    """
+    return all(_INT64_MIN <= v <= _INT64_MAX for v in values)
+
+def _is_int64(value):
+    """ Whether value is an int64 array or an int that fits in one.
+
+        :param value: an array or a number
+        :rtype: bool
+    """
+    if isinstance(value, numpy.ndarray):
+        return value.dtype == numpy.int64
+    return isinstance(value, six.integer_types) and _in_range(value)
+
+def _bounds(value):
+    """ The least and greatest of value.
+
+        :param value: a non-empty int64 array or an int
+        :returns: the least and greatest value
+        :rtype: tuple of int * int
+    """
+    if isinstance(value, numpy.ndarray):
+        return (int(value.min()), int(value.max()))
+    return (value, value)
+
+def _to_object(value):
+    """ Convert an array to an object array of Python numbers.
+
+        :param value: an array or a number
+        :returns: value, with any array converted to an object array
+    """
+    if isinstance(value, numpy.ndarray) and value.dtype != object:
+        return value.astype(object)
+    return value
+
+def _to_array(values):
+    """ Convert a sequence to a one-dimensional object array.
+
+        :param values: a sequence of objects
+        :returns: an array of the objects
+        :rtype: numpy array of object
+    """
+    result = numpy.empty(len(values), dtype=object)
+    result[:] = values
+    return result
+
+def _is_zero(value):
+    """ Whether value is, or contains, a zero.
+
+        :param value: an array or a number
+        :rtype: bool
+    """
+    if isinstance(value, numpy.ndarray):
+        return bool((value == 0).any())
+    return value == 0
+
+def _factor(spec):
+    """ The number of bytes in a unit specifier.
+
+        :param spec: a unit specifier
+        :type spec: a unit or :class:`Size`
+        :returns: the number of bytes
+        :rtype: int or Fraction
+    """
+    factor = getattr(spec, 'magnitude', None) or int(spec)
+    return factor.numerator if factor.denominator == 1 else factor
+
+_FRACTION = numpy.frompyfunc(Fraction, 2, 1) if numpy is not None else None
+
+
+class SizeArray(object):
+    """ Class for instantiating arrays of Size objects. """
+    # pylint: disable=protected-access
+
+    __slots__ = ('_magnitudes',)
+
+    __hash__ = None
+
+    def __init__(self, values=(), units=None):
+        """ Initialize a new SizeArray object.
+
+            :param values: the size values, default is no values
+            :type values: SizeArray, or an iterable of values for Size
+            :param units: the units of every value, default is None
+            :type units: any of the publicly defined units constants or a Size
+            :raises SizeValueError: on bad parameters
+
+            Every value is interpreted just as by Size(value, units).
+            A numpy array of integers is converted without constructing
+            any Size objects.
+        """
+        if numpy is None: # pragma: no cover
+            raise ImportError("SizeArray requires the numpy package")
+
+        if isinstance(values, SizeArray):
+            if units is not None:
+                raise SizeValueError(
+                   units,
+                   "units",
+                   "meaningless when SizeArray value is passed"
+                )
+            self._magnitudes = values._magnitudes.copy()
+            return
+
+        if isinstance(values, numpy.ndarray) and \
+           values.dtype.kind in ('i', 'u'):
+            units = B if units is None else units
+            magnitudes = values.astype(object) * _factor(units)
+        else:
+            magnitudes = _to_array([Size(v, units)._magnitude for v in values])
+        self._magnitudes = self._normalize(magnitudes)
+
+    @staticmethod
+    def _normalize(magnitudes):
+        """ Get the canonical representation of an array of magnitudes.
+
+            :param magnitudes: numbers of bytes
+            :type magnitudes: a one-dimensional numpy array
+            :returns: an int64 array if every magnitude is an int in range
+            :rtype: numpy array of int64 or of object
+            :raises SizeFractionalResultError: if fractional and STRICT
+        """
+        if magnitudes.dtype == numpy.int64:
+            return magnitudes
+
+        integral = True
+        for (i, magnitude) in enumerate(magnitudes):
+            if not isinstance(magnitude, six.integer_types):
+                if magnitude.denominator == 1:
+                    magnitudes[i] = magnitude.numerator
+                elif SizeConfig.STRICT is True:
+                    raise SizeFractionalResultError()
+                else:
+                    integral = False
+
+        if integral and \
+           (len(magnitudes) == 0 or _in_range(*_bounds(magnitudes))):
+            return magnitudes.astype(numpy.int64)
+        return magnitudes
+
+    @classmethod
+    def _fromMagnitudes(cls, magnitudes):
+        """ Construct a SizeArray directly from an array of magnitudes.
+
+            :param magnitudes: numbers of bytes
+            :type magnitudes: a one-dimensional numpy array
+            :returns: a new SizeArray
+            :rtype: :class:`SizeArray`
+            :raises SizeFractionalResultError: if fractional and STRICT
+        """
+        result = object.__new__(cls)
+        result._magnitudes = cls._normalize(magnitudes)
+        return result
+
+    @property
+    def magnitudes(self):
+        """
+        :returns: the number of bytes of each element, read-only
+        :rtype: numpy array of int64 or of object
+        """
+        result = self._magnitudes.view()
+        result.flags.writeable = False
+        return result
+
+    def __len__(self):
+        return len(self._magnitudes)
+
+    def __iter__(self):
+        return (Size._fromMagnitude(m) for m in self._magnitudes.tolist())
+
+    def __getitem__(self, index):
+        result = self._magnitudes[index]
+        if isinstance(result, numpy.ndarray):
+            return SizeArray._fromMagnitudes(result.copy())
+        return Size._fromMagnitude(
+           int(result) if isinstance(result, numpy.integer) else result
+        )
+
+    def __repr__(self):
+        return "SizeArray([%s])" % ", ".join(repr(s) for s in self)
+
+    def __deepcopy__(self, memo):
+        # pylint: disable=unused-argument
+        return SizeArray(self)
+
+    def tolist(self):
+        """ Get the elements as Size objects.
+
+            :returns: the elements
+            :rtype: list of :class:`Size`
+        """
+        return list(self)
+
+    def _operand(self, other, operator):
+        """ Get the magnitude or magnitudes of a Size or SizeArray.
+
+            :param other: the other operand
+            :type other: :class:`Size` or :class:`SizeArray`
+            :param str operator: the operator, for error messages
+            :returns: the magnitude or the magnitudes of other
+            :rtype: int, Fraction or numpy array
+            :raises SizeNonsensicalBinOpValueError: if lengths differ
+        """
+        if isinstance(other, SizeArray):
+            if len(other) != len(self):
+                raise SizeNonsensicalBinOpValueError(operator, other)
+            return other._magnitudes
+        return other._magnitude
+
+    def _apply(self, operation, other, bounds=None):
+        """ Apply operation to the magnitudes of self and to other.
+
+            :param operation: a function of two arguments
+            :param other: the other operand
+            :type other: int, Fraction or numpy array
+            :param bounds: computes the extreme results, or None
+            :type bounds: function or NoneType
+            :returns: the result of applying the operation
+            :rtype: numpy array
+
+            If both operands are int64, and bounds, applied to the least
+            and greatest values of each operand, shows that all results
+            fit in an int64, the operation is done by numpy in int64.
+            Otherwise it is done on Python ints and Fractions.
+        """
+        mine = self._magnitudes
+        if bounds is not None and \
+           _is_int64(mine) and _is_int64(other) and \
+           (len(mine) == 0 or
+            _in_range(*bounds(_bounds(mine), _bounds(other)))):
+            return operation(mine, other)
+        return operation(_to_object(mine), _to_object(other))
+
+    def _compare(self, operation, other, operator):
+        """ Compare the magnitudes of self and other.
+
+            :param operation: a comparison function of two arguments
+            :param other: the other operand
+            :param str operator: the operator, for error messages
+            :returns: the result of each comparison
+            :rtype: numpy array of bool
+            :raises SizeNonsensicalBinOpError: if other is not a Size
+        """
+        if not isinstance(other, (Size, SizeArray)):
+            raise SizeNonsensicalBinOpError(operator, other)
+        result = self._apply(
+           operation,
+           self._operand(other, operator),
+           lambda x, y: ()
+        )
+        return numpy.asarray(result, dtype=bool)
+
+    # UNARY OPERATIONS
+
+    def __abs__(self):
+        return SizeArray._fromMagnitudes(abs(self._magnitudes))
+
+    def __neg__(self):
+        return SizeArray._fromMagnitudes(-self._magnitudes)
+
+    def __pos__(self):
+        return SizeArray(self)
+
+    # BINARY OPERATIONS
+
+    def __add__(self, other):
+        if not isinstance(other, (Size, SizeArray)):
+            raise SizeNonsensicalBinOpError("+", other)
+        return SizeArray._fromMagnitudes(
+           self._apply(
+              lambda x, y: x + y,
+              self._operand(other, "+"),
+              lambda x, y: (x[0] + y[0], x[1] + y[1])
+           )
+        )
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if not isinstance(other, (Size, SizeArray)):
+            raise SizeNonsensicalBinOpError("-", other)
+        return SizeArray._fromMagnitudes(
+           self._apply(
+              lambda x, y: x - y,
+              self._operand(other, "-"),
+              lambda x, y: (x[0] - y[1], x[1] - y[0])
+           )
+        )
+
+    def __rsub__(self, other):
+        raise SizeNonsensicalBinOpError("rsub", other)
+
+    def __mul__(self, other):
+        if isinstance(other, PRECISE_NUMERIC_TYPES):
+            try:
+                other = _as_number(other)
+            except (TypeError, ValueError):
+                raise SizeNonsensicalBinOpError("*", other)
+            return SizeArray._fromMagnitudes(
+               self._apply(
+                  lambda x, y: x * y,
+                  other,
+                  lambda x, y: (x[0] * y[0], x[1] * y[0])
+               )
+            )
+        if isinstance(other, (Size, SizeArray)):
+            raise SizePowerResultError()
+        raise SizeNonsensicalBinOpError("*", other)
+    __rmul__ = __mul__
+
+    def __pow__(self, other):
+        # pylint: disable=no-self-use
+        if not isinstance(other, PRECISE_NUMERIC_TYPES):
+            raise SizeNonsensicalBinOpError("**", other)
+        raise SizePowerResultError()
+
+    def __rpow__(self, other):
+        raise SizeNonsensicalBinOpError("rpow", other)
+
+    def _divisor(self, other, operator):
+        """ Get the divisor for a division-like operation.
+
+            :param other: the other operand
+            :param str operator: the operator, for error messages
+            :returns: the divisor
+            :rtype: int, Fraction or numpy array
+            :raises SizeNonsensicalBinOpValueError: on zero divisor
+            :raises SizeNonsensicalBinOpError: if other is unusable
+        """
+        if isinstance(other, (Size, SizeArray)):
+            divisor = self._operand(other, operator)
+        elif isinstance(other, PRECISE_NUMERIC_TYPES):
+            try:
+                divisor = _as_number(other)
+            except (TypeError, ValueError):
+                raise SizeNonsensicalBinOpValueError(operator, other)
+        else:
+            raise SizeNonsensicalBinOpError(operator, other)
+
+        if _is_zero(divisor):
+            raise SizeNonsensicalBinOpValueError(operator, other)
+        return divisor
+
+    def __floordiv__(self, other):
+        # T(floor) = SizeArray, if T(other) is numeric
+        #          = array of int, if T(other) is Size or SizeArray
+        divisor = self._divisor(other, "floordiv")
+        result = self._apply(
+           lambda x, y: x // y,
+           divisor,
+           lambda x, y: (x[0], x[1], -x[0], -x[1])
+        )
+        if isinstance(other, (Size, SizeArray)):
+            return result
+        return SizeArray._fromMagnitudes(result)
+
+    def __rfloordiv__(self, other):
+        raise SizeNonsensicalBinOpError("rfloordiv", other)
+
+    def __mod__(self, other):
+        # T(mod) = SizeArray
+        divisor = self._divisor(other, "%")
+        return SizeArray._fromMagnitudes(
+           self._apply(
+              lambda x, y: x % y,
+              divisor,
+              lambda x, y: (y[0], y[1], -y[0], -y[1])
+           )
+        )
+
+    def __rmod__(self, other):
+        raise SizeNonsensicalBinOpError("rmod", other)
+
+    def __divmod__(self, other):
+        return (self // other, self % other)
+
+    def __rdivmod__(self, other):
+        raise SizeNonsensicalBinOpError("rdivmod", other)
+
+    def __truediv__(self, other):
+        # T(truediv) = SizeArray, if T(other) is numeric
+        #            = array of Fraction, if T(other) is Size or SizeArray
+        divisor = self._divisor(other, "truediv")
+        if isinstance(other, (Size, SizeArray)):
+            return _FRACTION(_to_object(self._magnitudes), _to_object(divisor))
+
+        if _is_int64(self._magnitudes) and _is_int64(divisor):
+            (quotient, remainder) = numpy.divmod(self._magnitudes, divisor)
+            if not remainder.any():
+                return SizeArray._fromMagnitudes(quotient)
+        return SizeArray._fromMagnitudes(
+           _FRACTION(_to_object(self._magnitudes), divisor)
+        )
+
+    __div__ = __truediv__
+
+    def __rtruediv__(self, other):
+        raise SizeNonsensicalBinOpError("rtruediv", other)
+
+    __rdiv__ = __rtruediv__
+
+    # COMPARISONS
+
+    def __eq__(self, other):
+        if not isinstance(other, (Size, SizeArray)):
+            return numpy.zeros(len(self), dtype=bool)
+        return self._compare(lambda x, y: x == y, other, "==")
+
+    def __ne__(self, other):
+        if not isinstance(other, (Size, SizeArray)):
+            return numpy.ones(len(self), dtype=bool)
+        return self._compare(lambda x, y: x != y, other, "!=")
+
+    def __ge__(self, other):
+        return self._compare(lambda x, y: x >= y, other, ">=")
+
+    def __gt__(self, other):
+        return self._compare(lambda x, y: x > y, other, ">")
+
+    def __le__(self, other):
+        return self._compare(lambda x, y: x <= y, other, "<=")
+
+    def __lt__(self, other):
+        return self._compare(lambda x, y: x < y, other, "<")
+
+    # NAMED METHODS
+
+    def convertTo(self, spec=None):
+        """ Return the sizes in the units indicated by the specifier.
+
+            :param spec: a units specifier
+            :type spec: a units specifier or :class:`Size`
+            :returns: numeric values in the units indicated by the specifier
+            :rtype: numpy array of :class:`fractions.Fraction`
+            :raises SizeValueError: if unit specifier is non-positive
+        """
+        spec = B if spec is None else spec
+        factor = _factor(spec)
+
+        if factor <= 0:
+            raise SizeValueError(
+               factor,
+               "factor",
+               "can not convert to non-positive unit %s"
+            )
+
+        return _FRACTION(_to_object(self._magnitudes), factor)
+
+    def roundTo(self, unit, rounding):
+        # pylint: disable=line-too-long
+        """ Rounds every element to a unit, a named constant or a Size.
+
+            :param unit: a unit specifier
+            :type unit: any non-negative :class:`Size` or element in :func:`._constants.UNITS`
+            :keyword rounding: rounding mode to use
+            :type rounding: a field of :class:`._constants.RoundingMethods`
+            :returns: appropriately rounded SizeArray
+            :rtype: :class:`SizeArray`
+            :raises SizeValueError: on unusable arguments
+
+            The result is the same as for rounding every element with
+            :meth:`Size.roundTo`.
+        """
+        factor = _factor(unit)
+
+        if factor < 0:
+            raise SizeValueError(factor, "factor")
+
+        if factor == 0:
+            return SizeArray._fromMagnitudes(
+               numpy.zeros(len(self), dtype=numpy.int64)
+            )
+
+        magnitudes = self._magnitudes
+        if _is_int64(magnitudes) and _is_int64(factor) and len(magnitudes):
+            (quotient, remainder) = numpy.divmod(magnitudes, factor)
+            # 0 <= remainder < factor, so factor - remainder can not
+            # overflow, but 2 * remainder can.
+            if rounding == RoundingMethods.ROUND_UP:
+                quotient += remainder != 0
+            elif rounding == RoundingMethods.ROUND_HALF_UP:
+                quotient += remainder >= factor - remainder
+            elif rounding == RoundingMethods.ROUND_HALF_DOWN:
+                quotient += remainder > factor - remainder
+            elif rounding != RoundingMethods.ROUND_DOWN and \
+               remainder.any():
+                raise SizeValueError(rounding, "rounding")
+
+            (least, greatest) = _bounds(quotient)
+            if _in_range(least * factor, greatest * factor):
+                return SizeArray._fromMagnitudes(quotient * factor)
+            return SizeArray._fromMagnitudes(quotient.astype(object) * factor)
+
+        rounded = numpy.frompyfunc(
+           lambda m: round_fraction(Fraction(m, factor), rounding) * factor,
+           1,
+           1
+        )(_to_object(magnitudes))
+        return SizeArray._fromMagnitudes(numpy.asarray(rounded, dtype=object))
+
+    def components(self, config=None):
+        """ Return a representation of every size, decomposed into a
+            Fraction value and a unit specifier.
+
+            :param StrConfig config: configuration, default is None
+            :returns: a pair of an array of values and an array of units
+            :rtype: tuple of numpy array * numpy array
+
+            If config is None the current SizeConfig.STR_CONFIG is used.
+            Each element of the result is as for :meth:`Size.components`.
+        """
+        config = SizeConfig.STR_CONFIG if config is None else config
+
+        if config.unit is not None:
+            units = numpy.empty(len(self), dtype=object)
+            units.fill(config.unit)
+            return (self.convertTo(config.unit), units)
+
+        table = get_unit_table(config.binary_units, config.min_value)
+        magnitudes = self._magnitudes
+        if _is_int64(magnitudes):
+            indices = numpy.zeros(len(self), dtype=numpy.intp)
+            absolute = abs(magnitudes)
+            for limit in table.limits:
+                # For an integer m, m >= limit iff m >= ceil(limit).
+                limit = -(-limit.numerator // limit.denominator)
+                if limit > _INT64_MAX:
+                    break
+                indices += absolute >= limit
+        else:
+            indices = numpy.frompyfunc(table.select, 1, 1)(magnitudes)
+            indices = indices.astype(numpy.intp)
+
+        if config.exact_value:
+            indices = self._exactIndices(table, indices, config.max_places)
+
+        factors = numpy.array([int(u) for u in table.units], dtype=object)
+        units = _to_array(table.units)
+        return (
+           _FRACTION(_to_object(magnitudes), factors[indices]),
+           units[indices]
+        )
+
+    def _exactIndices(self, table, indices, places):
+        """ Find the largest unit no larger than the one already selected
+            in which each size has an exact representation.
+
+            :param UnitTable table: the table of units
+            :param indices: the indices of the selected units
+            :type indices: numpy array of int
+            :param places: the number of decimal places, or None
+            :type places: int or NoneType
+            :returns: the indices of the units with exact values
+            :rtype: numpy array of int
+        """
+        magnitudes = _to_object(self._magnitudes)
+        result = numpy.zeros(len(self), dtype=numpy.intp)
+        unsettled = numpy.ones(len(self), dtype=bool)
+        for index in range(len(table.units) - 1, 0, -1):
+            candidates = unsettled & (indices >= index)
+            if not candidates.any():
+                continue
+            values = _FRACTION(magnitudes[candidates], int(table.units[index]))
+            exact = [is_exact_decimal(v, places) for v in values]
+            settled = numpy.zeros(len(self), dtype=bool)
+            settled[candidates] = exact
+            result[settled] = index
+            unsettled &= ~settled
+        return result
+
+    def getStrings(self, config=None, display=None):
+        """ Return a string representation of every size.
+
+            :param StrConfig config: representation configuration
+            :param DisplayConfig display: configuration for display
+            :returns: a string representation of each element
+            :rtype: list of str
+
+            If config or display is None the current configuration in
+            :class:`SizeConfig` is used. Each string is the same as
+            :meth:`Size.getString` would give.
+        """
+        config = SizeConfig.STR_CONFIG if config is None else config
+        display = SizeConfig.DISPLAY_CONFIG if display is None else display
+
+        (values, units) = self.components(config)
+        result = []
+        for (value, unit) in zip(values, units):
+            (exact, sign, left, right) = \
+               get_string_info(value, places=config.max_places)
+            result.append(
+               Size._formatStringInfo(
+                  (not exact, sign, left, right, unit),
+                  display
+               )
+            )
+        return result
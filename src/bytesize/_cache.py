@@ -0,0 +1,149 @@
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" An optional cache of the string representations of Sizes. """
+
+import threading
+
+from collections import namedtuple
+from collections import OrderedDict
+
+import six
+
+from ._errors import SizeValueError
+
+RenderCacheInfo = namedtuple(
+   'RenderCacheInfo',
+   ['hits', 'misses', 'evictions', 'maxsize', 'currsize']
+)
+""" Statistics of the render cache. """
+
+class _RenderCache(object):
+    """ A bounded cache, which evicts the least recently used entry. """
+
+    __slots__ = (
+       '_entries',
+       '_evictions',
+       '_hits',
+       '_lock',
+       '_maxsize',
+       '_misses'
+    )
+
+    def __init__(self, maxsize):
+        """ Initializer.
+
+            :param int maxsize: the largest number of entries
+        """
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def lookup(self, key, compute):
+        """ Get the value for key, computing it if it is not cached.
+
+            :param key: the key
+            :type key: any hashable value
+            :param compute: computes the value
+            :type compute: a function with no arguments
+            :returns: the value
+        """
+        with self._lock:
+            try:
+                # reinsert to make the entry the most recently used
+                value = self._entries.pop(key)
+                self._entries[key] = value
+                self._hits += 1
+                return value
+            except KeyError:
+                self._misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def clear(self):
+        """ Remove all entries. """
+        with self._lock:
+            self._entries.clear()
+
+    def info(self):
+        """ Get statistics of the cache.
+
+            :returns: the statistics
+            :rtype: RenderCacheInfo
+        """
+        with self._lock:
+            return RenderCacheInfo(
+               self._hits,
+               self._misses,
+               self._evictions,
+               self._maxsize,
+               len(self._entries)
+            )
+
+RENDER_CACHE = None
+""" The render cache, None if it is not enabled. """
+
+def invalidate_render_cache():
+    """ Remove all entries from the render cache, if it is enabled. """
+    cache = RENDER_CACHE
+    if cache is not None:
+        cache.clear()
+
+def enableRenderCache(maxsize=1024):
+    """ Enable a new, empty, render cache.
+
+        :param int maxsize: the largest number of entries, default is 1024
+        :raises SizeValueError: if maxsize is not a positive int
+
+        While the cache is enabled, the results of :meth:`Size.getString`,
+        and so of str(), and of :meth:`Size.components` are cached,
+        keyed on the magnitude of the Size and the configurations.
+        The cache is emptied whenever the configuration is changed with
+        any of the set_* methods of :class:`SizeConfig`.
+    """
+    # pylint: disable=global-statement
+    global RENDER_CACHE
+    if not isinstance(maxsize, six.integer_types) or \
+       isinstance(maxsize, bool) or maxsize < 1:
+        raise SizeValueError(maxsize, "maxsize", "must be a positive int")
+    RENDER_CACHE = _RenderCache(maxsize)
+
+def disableRenderCache():
+    """ Disable the render cache, discarding its entries. """
+    # pylint: disable=global-statement
+    global RENDER_CACHE
+    RENDER_CACHE = None
+
+def getRenderCacheInfo():
+    """ Get statistics of the render cache.
+
+        :returns: the statistics or None if the cache is not enabled
+        :rtype: RenderCacheInfo or NoneType
+    """
+    cache = RENDER_CACHE
+    return None if cache is None else cache.info()
@@ -18,33 +18,124 @@
 
 """ Configuration of the bytesize package. """
 
+import threading
+
+from contextlib import contextmanager
+
+from six import with_metaclass
+
+from . import _cache
+
 from ._constants import B
 from ._constants import PRECISE_NUMERIC_TYPES
 from ._constants import RoundingMethods
-from ._constants import UNITS
+from ._constants import ALL_UNITS
+from ._constants import UNIT_SET
 
 from ._errors import SizeValueError
 
-class DisplayConfig(object):
+class _Config(object):
+    """ Base class for immutable configuration objects.
+
+        Configurations are interned: constructing a configuration equal
+        to one that already exists returns the existing object, so that
+        equal configurations are usually identical and any validation is
+        done only once for each distinct configuration.
+    """
+
+    __slots__ = ()
+
+    _FIELDS = ()
+    """ Names of the attributes, in the order of the arguments. """
+
+    _INTERNED = dict()
+    _MAX_INTERNED = 256
+
+    @classmethod
+    def _intern(cls, values):
+        """ Get the configuration with these values.
+
+            :param tuple values: the values, in the order of _FIELDS
+            :returns: the unique configuration with these values
+            :raises SizeValueError: if the values are not valid
+        """
+        # Values of different types may be equal, e.g., 1 and Decimal(1),
+        # but are displayed differently, so the types are part of the key.
+        key = (cls, values, tuple(map(type, values)))
+        try:
+            config = cls._INTERNED.get(key)
+        except TypeError:
+            raise SizeValueError(values, "values", "must be hashable")
+
+        if config is None:
+            cls._validate(*values)
+            config = object.__new__(cls)
+            for (name, value) in zip(cls._FIELDS, values):
+                setattr(config, name, value)
+            if len(cls._INTERNED) >= cls._MAX_INTERNED:
+                cls._INTERNED.clear()
+            config = cls._INTERNED.setdefault(key, config)
+        return config
+
+    @classmethod
+    def _validate(cls, *values):
+        """ Check that the values are valid.
+
+            :raises SizeValueError: if the values are not valid
+        """
+
+    def _key(self):
+        """ The values which distinguish this configuration. """
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __reduce__(self):
+        return (type(self), self._key())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # pylint: disable=unused-argument
+        return self
+
+class DisplayConfig(_Config):
     """
     Superficial aspects of display.
     """
     # pylint: disable=too-few-public-methods
 
+    __slots__ = ('_strip', '_show_approx_str', '_approx_symbol')
+
+    _FIELDS = __slots__
+
     _FMT_STR = ", ".join([
        "approx_symbol=%(approx_symbol)s",
        "show_approx_str=%(show_approx_str)s",
        "strip=%(strip)s",
     ])
 
-    def __init__(
-       self,
+    def __new__(
+       cls,
        strip=False,
        show_approx_str=True,
        approx_symbol='@'
     ):
         """
-        Initializer.
+        Constructor.
 
         :param bool strip: True if trailing zeros are to be stripped.
         :param bool show_approx_str: distinguish approximate str values
@@ -56,9 +147,7 @@ class DisplayConfig(object):
         The default for strip is False, so that precision is always shown
         to max_places.
         """
-        self._strip = strip
-        self._show_approx_str = show_approx_str
-        self._approx_symbol = approx_symbol
+        return cls._intern((strip, show_approx_str, approx_symbol))
 
     def __str__(self):
         values = {
@@ -74,7 +163,7 @@ class DisplayConfig(object):
     strip = property(lambda s: s._strip)
     show_approx_str = property(lambda s: s._show_approx_str)
 
-class StrConfig(object):
+class StrConfig(_Config):
     """ Configuration for __str__ method.
 
         If max_places is set to None, all non-zero digits after the
@@ -91,6 +180,16 @@ class StrConfig(object):
     """
     # pylint: disable=too-few-public-methods
 
+    __slots__ = (
+       '_max_places',
+       '_min_value',
+       '_binary_units',
+       '_exact_value',
+       '_unit'
+    )
+
+    _FIELDS = __slots__
+
     _FMT_STR = ", ".join([
        "binary_units=%(binary_units)s",
        "exact_value=%(exact_value)s",
@@ -99,15 +198,15 @@ class StrConfig(object):
        "unit=%(unit)s"
     ])
 
-    def __init__(
-       self,
+    def __new__(
+       cls,
        max_places=2,
        min_value=1,
        binary_units=True,
        exact_value=False,
        unit=None
     ):
-        """ Initializer.
+        """ Constructor.
 
             :param max_places: number of decimal places to use, default is 2
             :type max_places: an integer type or NoneType
@@ -118,6 +217,14 @@ class StrConfig(object):
             :param unit: use the specified unit, overrides other options
         """
         # pylint: disable=too-many-arguments
+        return cls._intern(
+           (max_places, min_value, binary_units, exact_value, unit)
+        )
+
+    @classmethod
+    def _validate(cls, *values):
+        # pylint: disable=arguments-differ
+        (_, min_value, _, _, unit) = values
         if min_value < 0 or \
            not isinstance(min_value, PRECISE_NUMERIC_TYPES):
             raise SizeValueError(
@@ -126,19 +233,13 @@ class StrConfig(object):
                "must be a precise positive numeric value."
             )
 
-        if unit is not None and unit not in UNITS():
+        if unit is not None and unit not in UNIT_SET:
             raise SizeValueError(
                unit,
                "unit",
-               "must be one of %s" % ", ".join(str(x) for x in UNITS())
+               "must be one of %s" % ", ".join(str(x) for x in ALL_UNITS)
             )
 
-        self._max_places = max_places
-        self._min_value = min_value
-        self._binary_units = binary_units
-        self._exact_value = exact_value
-        self._unit = unit
-
     def __str__(self):
         values = {
            'binary_units' : self.binary_units,
@@ -157,7 +258,7 @@ class StrConfig(object):
     binary_units = property(lambda s: s._binary_units)
     unit = property(lambda s: s._unit)
 
-class InputConfig(object):
+class InputConfig(_Config):
     """ Configuration for input of Sizes.
 
         Specifies rounding unit and method for Sizes constructed from
@@ -165,18 +266,21 @@ class InputConfig(object):
     """
     # pylint: disable=too-few-public-methods
 
+    __slots__ = ('_unit', '_method')
+
+    _FIELDS = __slots__
+
     _FMT_STR = ", ".join(["method=%(method)s", "unit=%(unit)s"])
 
-    def __init__(self, unit=B, method=RoundingMethods.ROUND_DOWN):
-        """ Initializer.
+    def __new__(cls, unit=B, method=RoundingMethods.ROUND_DOWN):
+        """ Constructor.
 
             :param unit: unit to round to, default is B
             :type unit: an instance of :func:`._constants.UNITS`
             :param method: rounding method, default is ROUND_DOWN
             :type method: instance of :func:`._constants.ROUNDING_METHODS`
         """
-        self._unit = unit
-        self._method = method
+        return cls._intern((unit, method))
 
     def __str__(self):
         values = {'method' : self.method, 'unit' : self.unit}
@@ -188,15 +292,117 @@ class InputConfig(object):
     unit = property(lambda s: s._unit)
 
 
-class SizeConfig(object):
-    """ Configuration for :class:`Size` class. """
+class _ThreadLocalVar(object):
+    """ A substitute for contextvars.ContextVar where it is unavailable.
+
+        The value is local to a thread, rather than to a context.
+    """
+
+    def __init__(self, name, default=None):
+        """ Initializer.
+
+            :param str name: the name of the variable
+            :param object default: the value if none has been set
+        """
+        self.name = name
+        self._default = default
+        self._local = threading.local()
+
+    def get(self):
+        """ Get the value in the current thread. """
+        return getattr(self._local, 'value', self._default)
+
+    def set(self, value):
+        """ Set the value in the current thread.
+
+            :param object value: the new value
+            :returns: a token for restoring the previous value
+        """
+        token = self.get()
+        self._local.value = value
+        return token
 
-    DISPLAY_CONFIG = DisplayConfig(False, True, '@')
+    def reset(self, token):
+        """ Restore the value that preceded a call to set().
+
+            :param object token: the value returned by set()
+        """
+        self._local.value = token
 
-    STR_CONFIG = StrConfig(2, 1, True, False, None)
+try:
+    from contextvars import ContextVar as _ContextVar
+except ImportError: # pragma: no cover
+    _ContextVar = _ThreadLocalVar
+
+
+def _context_property(local, name, doc):
+    """ Make a property for a context-local configuration.
+
+        :param local: the configuration set in the current context
+        :type local: ContextVar or _ThreadLocalVar
+        :param str name: the name of the configuration
+        :param str doc: the docstring for the property
+        :returns: a property
+        :rtype: property
+    """
+    default = "_DEFAULT_" + name
+
+    def get(cls):
+        """ Get the configuration in the current context. """
+        config = local.get()
+        return getattr(cls, default) if config is None else config
+
+    def set_default(cls, config):
+        """ Set the global configuration. """
+        setattr(cls, default, config)
+        _cache.invalidate_render_cache()
+
+    return property(get, set_default, doc=doc)
+
+class _SizeConfigMeta(type):
+    """ Metaclass which makes the configurations of :class:`SizeConfig`
+        context-local.
+
+        A configuration set by :meth:`SizeConfig.using` overrides the
+        global configuration within its context, i.e., its thread or
+        asyncio task. Reading a configuration requires no locking.
+    """
+
+    _DISPLAY_CONFIG = _ContextVar('DISPLAY_CONFIG', default=None)
+    _STR_CONFIG = _ContextVar('STR_CONFIG', default=None)
+    _INPUT_CONFIG = _ContextVar('INPUT_CONFIG', default=None)
+
+    DISPLAY_CONFIG = _context_property(
+       _DISPLAY_CONFIG,
+       'DISPLAY_CONFIG',
+       "Configuration for superficial aspects of display."
+    )
+    STR_CONFIG = _context_property(
+       _STR_CONFIG,
+       'STR_CONFIG',
+       "Configuration for string display."
+    )
+    INPUT_CONFIG = _context_property(
+       _INPUT_CONFIG,
+       'INPUT_CONFIG',
+       "Configuration for interpreting input values."
+    )
+
+class SizeConfig(with_metaclass(_SizeConfigMeta, object)):
+    """ Configuration for :class:`Size` class.
+
+        DISPLAY_CONFIG, STR_CONFIG, and INPUT_CONFIG are the configurations
+        in the current context. The set_* methods set the global
+        configurations, which apply wherever :meth:`using` has not set
+        a configuration.
+    """
+
+    _DEFAULT_DISPLAY_CONFIG = DisplayConfig(False, True, '@')
+
+    _DEFAULT_STR_CONFIG = StrConfig(2, 1, True, False, None)
     """ Default configuration for string display. """
 
-    INPUT_CONFIG = InputConfig(B, RoundingMethods.ROUND_DOWN)
+    _DEFAULT_INPUT_CONFIG = InputConfig(B, RoundingMethods.ROUND_DOWN)
     """ Default configuration for interpreting input values. """
 
     STRICT = False
@@ -208,11 +414,12 @@ class SizeConfig(object):
 
         :param DisplayConfig config: a configuration object
         """
-        cls.DISPLAY_CONFIG = DisplayConfig(
+        cls._DEFAULT_DISPLAY_CONFIG = DisplayConfig(
             approx_symbol=config.approx_symbol,
             show_approx_str=config.show_approx_str,
             strip=config.strip
         )
+        _cache.invalidate_render_cache()
 
     @classmethod
     def set_str_config(cls, config):
@@ -220,13 +427,14 @@ class SizeConfig(object):
 
             :param :class:`StrConfig` config: a configuration object
         """
-        cls.STR_CONFIG = StrConfig(
+        cls._DEFAULT_STR_CONFIG = StrConfig(
             binary_units=config.binary_units,
             max_places=config.max_places,
             min_value=config.min_value,
             exact_value=config.exact_value,
             unit=config.unit
         )
+        _cache.invalidate_render_cache()
 
     @classmethod
     def set_input_config(cls, config):
@@ -234,7 +442,38 @@ class SizeConfig(object):
 
             :param :class:`.InputConfig` config: a configuration object
         """
-        cls.INPUT_CONFIG = InputConfig(
+        cls._DEFAULT_INPUT_CONFIG = InputConfig(
             method=config.method,
             unit=config.unit
         )
+
+    @classmethod
+    @contextmanager
+    def using(cls, str_config=None, display_config=None, input_config=None):
+        """ Use the given configurations in the current context.
+
+            :param StrConfig str_config: configuration for string display
+            :param DisplayConfig display_config: configuration for display
+            :param InputConfig input_config: configuration for input
+
+            A configuration that is None is not changed. For example::
+
+                with SizeConfig.using(str_config=StrConfig(max_places=0)):
+                    text = str(size)
+
+            The configurations are restored on exit. Other threads and
+            asyncio tasks are unaffected.
+        """
+        # pylint: disable=protected-access
+        tokens = [
+           (local, local.set(config)) for (local, config) in [
+              (_SizeConfigMeta._STR_CONFIG, str_config),
+              (_SizeConfigMeta._DISPLAY_CONFIG, display_config),
+              (_SizeConfigMeta._INPUT_CONFIG, input_config)
+           ] if config is not None
+        ]
+        try:
+            yield
+        finally:
+            for (local, token) in reversed(tokens):
+                local.reset(token)
@@ -32,6 +32,8 @@ class _RoundingMethod(object):
     """ Class to generate rounding method enumeration. """
     # pylint: disable=too-few-public-methods
 
+    __slots__ = ('_doc',)
+
     def __init__(self, doc):
         """ Initializer.
 
@@ -43,6 +45,9 @@ class _RoundingMethod(object):
         return self.doc
     __repr__ = __str__
 
+    def __reduce__(self):
+        return (_get_rounding_method, (self._doc,))
+
     # pylint: disable=protected-access
     doc = property(lambda s: s._doc, doc="explanation of rounding method")
 
@@ -66,6 +71,8 @@ class Unit(object):
     """ Class to encapsulate unit information. """
     # pylint: disable=too-few-public-methods
 
+    __slots__ = ('_factor', '_prefix', '_abbr')
+
     def __init__(self, factor, prefix, abbr):
         self._factor = factor
         self._prefix = prefix
@@ -75,6 +82,9 @@ class Unit(object):
         return self.abbr + "B"
     __repr__ = __str__
 
+    def __reduce__(self):
+        return (_get_unit, (self._abbr,))
+
     # pylint: disable=protected-access
     factor = property(lambda s: s._factor, doc="numeric multiple of bytes")
     abbr = property(
@@ -105,12 +115,12 @@ class DecimalUnits(object):
     ZB = Unit(FACTOR ** 7, "zetta", "Z")
     YB = Unit(FACTOR ** 8, "yotta", "Y")
 
-    _UNITS = [KB, MB, GB, TB, PB, EB, ZB, YB]
+    _UNITS = (KB, MB, GB, TB, PB, EB, ZB, YB)
 
     @classmethod
     def UNITS(cls):
         """ Units of this class. """
-        return cls._UNITS[:]
+        return list(cls._UNITS)
 
 class BinaryUnits(object):
     """ Class to store binary unit constants. """
@@ -127,17 +137,56 @@ class BinaryUnits(object):
     ZiB = Unit(FACTOR ** 7, "zebi", "Zi")
     YiB = Unit(FACTOR ** 8, "yobi", "Yi")
 
-    _UNITS = [KiB, MiB, GiB, TiB, PiB, EiB, ZiB, YiB]
+    _UNITS = (KiB, MiB, GiB, TiB, PiB, EiB, ZiB, YiB)
 
     @classmethod
     def UNITS(cls):
         """ Units of this class. """
-        return cls._UNITS[:]
+        return list(cls._UNITS)
+
+BINARY_UNITS = (B,) + tuple(BinaryUnits.UNITS())
+""" B and the binary units, smallest first. """
+
+DECIMAL_UNITS = (B,) + tuple(DecimalUnits.UNITS())
+""" B and the decimal units, smallest first. """
+
+ALL_UNITS = BINARY_UNITS + DECIMAL_UNITS[1:]
+""" All unit constants, in the order of :func:`UNITS`. """
+
+UNIT_SET = frozenset(ALL_UNITS)
+""" All unit constants, for membership tests. """
+
+UNITS_BY_ABBR = dict((unit.abbr, unit) for unit in ALL_UNITS)
+""" Map from abbreviation to unit constant. """
 
 def UNITS():
     """ All unit constants. """
-    return [B] + BinaryUnits.UNITS() + DecimalUnits.UNITS()
+    return list(ALL_UNITS)
 
 ROUNDING_METHODS = RoundingMethods.METHODS
 
+def _get_unit(abbr):
+    """ Get the unit constant with the given abbreviation.
+
+        Units are compared by identity, so copying or unpickling a unit
+        must give back the constant.
+
+        :param str abbr: the abbreviation
+        :returns: the unit
+        :rtype: Unit
+    """
+    return UNITS_BY_ABBR[abbr]
+
+def _get_rounding_method(doc):
+    """ Get the rounding method constant with the given explanation.
+
+        Rounding methods are compared by identity, so copying or
+        unpickling a method must give back the constant.
+
+        :param str doc: the explanation
+        :returns: the rounding method
+        :rtype: _RoundingMethod
+    """
+    return next(m for m in ROUNDING_METHODS() if m.doc == doc)
+
 PRECISE_NUMERIC_TYPES = (six.integer_types, Decimal, Rational)
@@ -0,0 +1,175 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Formatting many Sizes with a single configuration. """
+
+from fractions import Fraction
+
+import six
+
+from ._config import SizeConfig
+
+from ._util.math_util import is_exact_decimal
+from ._util.math_util import round_scaled
+from ._util.misc import get_string_info
+from ._util.units import get_unit_table
+
+
+class SizeFormatter(object):
+    """ Formats Sizes according to a fixed configuration.
+
+        Everything that depends only on the configuration, e.g., the
+        table for choosing units and the text that follows the number,
+        is computed once, when the formatter is constructed.
+
+        The result of formatting a Size is the same as the result of
+        :meth:`Size.getString` with the same configuration.
+    """
+    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-many-instance-attributes
+
+    __slots__ = (
+       '_approx',
+       '_exact_value',
+       '_factors',
+       '_places',
+       '_scale',
+       '_strip',
+       '_suffixes',
+       '_table'
+    )
+
+    def __init__(self, config=None, display=None):
+        """ Initializer.
+
+            :param StrConfig config: representation configuration
+            :param DisplayConfig display: configuration for display
+
+            If config or display is None the current configuration in
+            :class:`SizeConfig` is used.
+        """
+        config = SizeConfig.STR_CONFIG if config is None else config
+        display = SizeConfig.DISPLAY_CONFIG if display is None else display
+
+        if config.unit is None:
+            self._table = get_unit_table(config.binary_units, config.min_value)
+            units = self._table.units
+        else:
+            self._table = None
+            units = (config.unit,)
+
+        self._exact_value = config.exact_value and config.unit is None
+        self._factors = tuple(int(u) for u in units)
+        self._suffixes = tuple(" %sB" % u.abbr for u in units)
+
+        self._places = config.max_places
+        self._scale = 10 ** config.max_places \
+           if config.max_places is not None else None
+
+        self._approx = display.approx_symbol if display.show_approx_str else ""
+        self._strip = display.strip
+
+    def _exactIndex(self, magnitude, index):
+        """ Find the largest unit no larger than the unit at ``index``
+            in which ``magnitude`` has an exact representation.
+
+            :param magnitude: the magnitude
+            :type magnitude: int or Fraction
+            :param int index: the index of the largest unit to try
+            :returns: the index of the unit, 0 if there is none
+            :rtype: int
+        """
+        integral = isinstance(magnitude, six.integer_types) and \
+           self._scale is not None
+        for candidate in range(index, 0, -1):
+            factor = self._factors[candidate]
+            if integral:
+                exact = magnitude * self._scale % factor == 0
+            else:
+                exact = is_exact_decimal(
+                   Fraction(magnitude, factor),
+                   self._places
+                )
+            if exact:
+                return candidate
+        return 0
+
+    def format(self, size):
+        """ Return a string representation of the size.
+
+            :param :class:`Size` size: the size
+            :returns: a string representation
+            :rtype: str
+        """
+        # pylint: disable=protected-access
+        magnitude = size._magnitude
+
+        if self._table is None:
+            index = 0
+        else:
+            index = self._table.select(magnitude)
+            if self._exact_value:
+                index = self._exactIndex(magnitude, index)
+        factor = self._factors[index]
+
+        if self._scale is None:
+            (exact, sign, left, right) = \
+               get_string_info(Fraction(magnitude, factor), places=None)
+            sign = "-" if sign == -1 else ""
+        else:
+            if isinstance(magnitude, six.integer_types):
+                (numerator, denominator) = (magnitude, factor)
+            else:
+                (numerator, denominator) = \
+                   (magnitude.numerator, magnitude.denominator * factor)
+            sign = "-" if numerator < 0 else ""
+            (digits, exact) = \
+               round_scaled(abs(numerator), denominator, self._scale)
+            (left, right) = divmod(digits, self._scale)
+            left = str(left)
+            right = str(right).zfill(self._places) if self._places else ""
+
+        if self._strip:
+            right = right.rstrip('0')
+
+        return "".join([
+           "" if exact else self._approx,
+           sign,
+           left,
+           "." if right else "",
+           right,
+           self._suffixes[index]
+        ])
+
+def formatSizes(sizes, config=None, display=None):
+    """ Generate a string representation of every size.
+
+        :param sizes: the sizes
+        :type sizes: any iterable of :class:`Size`
+        :param StrConfig config: representation configuration
+        :param DisplayConfig display: configuration for display
+        :returns: a generator of string representations
+        :rtype: generator of str
+
+        If config or display is None the current configuration in
+        :class:`SizeConfig` is used. Sizes are consumed one at a time,
+        so sizes may be an arbitrarily long generator.
+    """
+    formatter = SizeFormatter(config, display)
+    return (formatter.format(size) for size in sizes)
@@ -0,0 +1,261 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Histograms of Sizes with logarithmically growing buckets. """
+
+import six
+
+from ._errors import SizeValueError
+
+from ._formatter import SizeFormatter
+
+from ._size import Size
+
+
+_POWERS_OF_TEN = [1]
+""" Powers of ten, extended as needed. """
+
+def _power_of_ten(exponent):
+    """ Get a power of ten.
+
+        :param int exponent: the exponent, non-negative
+        :returns: 10 ** exponent
+        :rtype: int
+    """
+    while len(_POWERS_OF_TEN) <= exponent:
+        _POWERS_OF_TEN.append(_POWERS_OF_TEN[-1] * 10)
+    return _POWERS_OF_TEN[exponent]
+
+def _decimal_length(value, bit_length):
+    """ Get the number of decimal digits in a non-negative int.
+
+        :param int value: the value
+        :param int bit_length: value.bit_length()
+        :returns: the number of decimal digits, 0 for 0
+        :rtype: int
+
+        1233 / 4096 is a close lower bound for log10(2), so the estimate
+        is nearly always right and never too large.
+    """
+    length = (bit_length * 1233) >> 12
+    while value >= _power_of_ten(length):
+        length += 1
+    return length
+
+
+class SizeHistogram(object):
+    """ A histogram of Sizes, whose buckets grow exponentially.
+
+        The lower bound of every bucket has a fixed number of significant
+        binary or decimal digits. With one significant binary digit the
+        bounds are powers of two, and every unit in BinaryUnits is a
+        bound. With one significant decimal digit the bounds are 1, 2,
+        ..., 9 times a power of ten, and every unit in DecimalUnits is a
+        bound. More significant digits give finer buckets.
+
+        A Size is counted in the bucket of the integral part of its
+        magnitude, found in constant time from its bit length. The
+        buckets of negative Sizes mirror those of positive Sizes.
+
+        Histograms with the same buckets can be merged, and a histogram
+        can be converted to and from a dict of plain ints, for storage.
+    """
+
+    __slots__ = ('_binary_units', '_count', '_counts', '_significant')
+
+    def __init__(self, sizes=(), binary_units=True, significant=1):
+        """ Initializer.
+
+            :param sizes: sizes to add, default is none
+            :type sizes: an iterable of :class:`Size`
+            :param bool binary_units: binary digits if True, else decimal
+            :param int significant: significant digits in a lower bound
+            :raises SizeValueError: if significant is not positive
+        """
+        if not isinstance(significant, six.integer_types) or significant < 1:
+            raise SizeValueError(
+               significant,
+               "significant",
+               "must be a positive integer"
+            )
+        self._binary_units = binary_units
+        self._significant = significant
+        self._counts = dict()
+        self._count = 0
+        self.update(sizes)
+
+    def __str__(self):
+        return "SizeHistogram(count=%s, buckets=%s)" % \
+           (self._count, len(self._counts))
+    __repr__ = __str__
+
+    def _lower(self, value):
+        """ Get the lower bound of the bucket for a non-negative int.
+
+            :param int value: the value
+            :returns: the lower bound of its bucket
+            :rtype: int
+        """
+        bit_length = value.bit_length()
+        if self._binary_units:
+            shift = bit_length - self._significant
+            return value if shift <= 0 else value >> shift << shift
+        shift = _decimal_length(value, bit_length) - self._significant
+        if shift <= 0:
+            return value
+        factor = _power_of_ten(shift)
+        return value // factor * factor
+
+    def _width(self, lower):
+        """ Get the width of the bucket with a non-negative lower bound.
+
+            :param int lower: the lower bound
+            :returns: the width of the bucket
+            :rtype: int
+        """
+        if self._binary_units:
+            shift = lower.bit_length() - self._significant
+            return 1 if shift <= 0 else 1 << shift
+        shift = _decimal_length(lower, lower.bit_length()) - self._significant
+        return 1 if shift <= 0 else _power_of_ten(shift)
+
+    def add(self, size):
+        """ Add a Size.
+
+            :param Size size: the size
+            :raises SizeValueError: if size is not a Size
+        """
+        if not isinstance(size, Size):
+            raise SizeValueError(size, "size", "must be a Size")
+        # pylint: disable=protected-access
+        value = int(size._magnitude)
+        key = self._lower(value) if value >= 0 else -self._lower(-value)
+        self._counts[key] = self._counts.get(key, 0) + 1
+        self._count += 1
+
+    def update(self, sizes):
+        """ Add some Sizes.
+
+            :param sizes: the sizes
+            :type sizes: an iterable of :class:`Size`, e.g., a generator
+            :raises SizeValueError: if an element is not a Size
+        """
+        for size in sizes:
+            self.add(size)
+
+    def merge(self, other):
+        """ Add the counts of another histogram with the same buckets.
+
+            :param SizeHistogram other: the other histogram, unchanged
+            :raises SizeValueError: if the buckets differ
+        """
+        # pylint: disable=protected-access
+        if (other._binary_units, other._significant) != \
+           (self._binary_units, self._significant):
+            raise SizeValueError(other, "other", "buckets differ")
+        for (key, count) in other._counts.items():
+            self._counts[key] = self._counts.get(key, 0) + count
+        self._count += other._count
+
+    @property
+    def count(self):
+        """
+        :returns: the number of sizes
+        :rtype: int
+        """
+        return self._count
+
+    def buckets(self):
+        """ Get the non-empty buckets, smallest first.
+
+            :returns: the lower bound, upper bound and count of each bucket
+            :rtype: list of tuple of :class:`Size` * :class:`Size` * int
+
+            The lower bound of a bucket for positive Sizes is inclusive
+            and the upper bound exclusive. For negative Sizes, the
+            reverse. The bucket from 0 to 1 byte holds every Size less
+            than one byte in absolute value.
+        """
+        # pylint: disable=protected-access
+        result = []
+        for key in sorted(self._counts):
+            width = self._width(abs(key))
+            if key < 0:
+                (lower, upper) = (key - width, key)
+            else:
+                (lower, upper) = (key, key + width)
+            result.append((
+               Size._fromMagnitude(lower),
+               Size._fromMagnitude(upper),
+               self._counts[key]
+            ))
+        return result
+
+    def labels(self, config=None, display=None):
+        """ Get a label and a count for each non-empty bucket.
+
+            :param StrConfig config: representation configuration
+            :param DisplayConfig display: configuration for display
+            :returns: a label and a count for each bucket, smallest first
+            :rtype: list of tuple of str * int
+
+            A label is the lower and upper bound of a bucket, formatted
+            as by :meth:`Size.getString`. If config or display is None
+            the current configuration in :class:`SizeConfig` is used.
+        """
+        formatter = SizeFormatter(config, display)
+        return [
+           (
+              "%s - %s" % (formatter.format(lower), formatter.format(upper)),
+              count
+           ) for (lower, upper, count) in self.buckets()
+        ]
+
+    def asDict(self):
+        """ Get the contents of the histogram as a dict of plain values.
+
+            :returns: a dict, which may be serialized as JSON
+            :rtype: dict
+        """
+        return {
+           'binary_units' : self._binary_units,
+           'significant' : self._significant,
+           'counts' : sorted(self._counts.items())
+        }
+
+    @classmethod
+    def fromDict(cls, values):
+        """ Construct a histogram from the result of :meth:`asDict`.
+
+            :param dict values: the contents of a histogram
+            :returns: the histogram
+            :rtype: :class:`SizeHistogram`
+            :raises SizeValueError: if values can not be interpreted
+        """
+        try:
+            histogram = cls(
+               binary_units=values['binary_units'],
+               significant=values['significant']
+            )
+            for (key, count) in values['counts']:
+                histogram._counts[int(key)] = int(count)
+                histogram._count += int(count)
+        except (KeyError, TypeError, ValueError):
+            raise SizeValueError(values, "values")
+        return histogram
@@ -0,0 +1,301 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Converting very many Sizes in parallel, in a pool of processes.
+
+    The values are split into chunks, which are converted by worker
+    processes and reassembled in order. Chunks of Sizes are passed to
+    and from the workers as lists of magnitudes, which pickle to less
+    than half as many bytes as Sizes do, and are pickled and unpickled
+    in C. The encoding of :func:`._serialize.encodeSizes` is as compact,
+    but is decoded in Python, which would take longer than the work.
+
+    Workers do not share the configuration of the caller, so the
+    configurations in effect when a function is called, and the value
+    of :attr:`SizeConfig.STRICT`, are passed to the workers explicitly.
+
+    Under Python 2, requires the futures package.
+"""
+
+import collections
+import itertools
+import multiprocessing
+
+import six
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError: # pragma: no cover
+    ProcessPoolExecutor = None
+
+from ._array import SizeArray
+
+from ._config import SizeConfig
+
+from ._errors import SizeValueError
+
+from ._formatter import SizeFormatter
+
+from ._size import Size
+
+from ._sizes import _magnitudeRounder
+from ._sizes import getSizesFromInput
+
+_CHUNKSIZE = 10000
+""" The default number of values in a chunk. """
+
+# pylint: disable=protected-access
+
+def _parse_chunk(values, strict, units, config):
+    """ Get the magnitudes of Sizes from input values, in a worker. """
+    SizeConfig.STRICT = strict
+    return [s._magnitude for s in getSizesFromInput(values, units, config)]
+
+def _round_chunk(magnitudes, strict, unit, rounding):
+    """ Round magnitudes, in a worker. """
+    SizeConfig.STRICT = strict
+    round_magnitude = _magnitudeRounder(unit, rounding)
+    return [round_magnitude(m)._magnitude for m in magnitudes]
+
+def _format_chunk(magnitudes, strict, config, display):
+    """ Format magnitudes, in a worker. """
+    SizeConfig.STRICT = strict
+    formatter = SizeFormatter(config, display)
+    return [formatter.format(Size._fromMagnitude(m)) for m in magnitudes]
+
+def _magnitudes(chunk):
+    """ Get the magnitudes of a chunk of Sizes.
+
+        :param chunk: the sizes
+        :type chunk: a list of :class:`Size` or a SizeArray
+        :returns: the magnitudes
+        :rtype: list of int or Fraction
+        :raises SizeValueError: if an element is not a Size
+    """
+    if isinstance(chunk, SizeArray):
+        return chunk.magnitudes.tolist()
+    for size in chunk:
+        if not isinstance(size, Size):
+            raise SizeValueError(size, "size", "must be a Size")
+    return [size._magnitude for size in chunk]
+
+def _sizes(results):
+    """ Get the Sizes from the results of the workers.
+
+        :param results: the magnitudes computed for each chunk
+        :type results: iterable of list of int or Fraction
+        :returns: the sizes, in order
+        :rtype: generator of :class:`Size`
+    """
+    for magnitudes in results:
+        for magnitude in magnitudes:
+            yield Size._fromMagnitude(magnitude)
+
+def _chunks(values, chunksize):
+    """ Split values into chunks.
+
+        :param values: the values
+        :type values: any iterable, e.g., a SizeArray
+        :param int chunksize: the number of values in a chunk
+        :returns: the chunks, in order
+        :rtype: generator of sequences
+
+        Slices values if it is a list, tuple, or SizeArray, so that a
+        chunk of a SizeArray is a SizeArray.
+    """
+    if isinstance(values, (list, tuple, SizeArray)):
+        for start in range(0, len(values), chunksize):
+            yield values[start:start + chunksize]
+        return
+
+    iterator = iter(values)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+def _workers(max_workers, chunksize):
+    """ Get the number of worker processes.
+
+        :param max_workers: the number of workers, None for one per CPU
+        :type max_workers: int or NoneType
+        :param int chunksize: the number of values in a chunk
+        :returns: the number of workers
+        :rtype: int
+        :raises SizeValueError: if an argument is not a positive int
+    """
+    if ProcessPoolExecutor is None: # pragma: no cover
+        raise ImportError("parallel conversion requires the futures package")
+
+    if not isinstance(chunksize, six.integer_types) or \
+       isinstance(chunksize, bool) or chunksize < 1:
+        raise SizeValueError(chunksize, "chunksize", "must be a positive int")
+    if max_workers is None:
+        return multiprocessing.cpu_count()
+    if not isinstance(max_workers, six.integer_types) or \
+       isinstance(max_workers, bool) or max_workers < 1:
+        raise SizeValueError(
+           max_workers,
+           "max_workers",
+           "must be a positive int or None"
+        )
+    return max_workers
+
+def _run(function, chunks, args, workers):
+    """ Apply function to every chunk in a pool of processes.
+
+        :param function: converts a chunk, given args
+        :type function: a module level function
+        :param chunks: the chunks
+        :type chunks: an iterable of picklable values
+        :param tuple args: the remaining arguments of function
+        :param int workers: the number of worker processes
+        :returns: the result for each chunk, in order
+        :rtype: generator
+
+        At most two chunks for each worker are in flight, so chunks may
+        be an arbitrarily long generator.
+    """
+    pending = collections.deque()
+    with ProcessPoolExecutor(workers) as executor:
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(function, chunk, *args))
+                if len(pending) > 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+def parallelGetSizesFromInput(
+   values,
+   units=None,
+   config=None,
+   max_workers=None,
+   chunksize=_CHUNKSIZE
+):
+    """ Get a Size object from every input value, in parallel.
+
+        :param values: the size values, each picklable
+        :type values: any iterable of values accepted by getSizeFromInput
+        :param units: the units of every size, default is None
+        :type units: any of the defined units constants or Size or NoneType
+        :param config: configures interpretation of inputs
+        :type config: a member of :class:`InputConfig` or NoneType
+        :param max_workers: the number of worker processes, default is one
+           for each CPU
+        :type max_workers: int or NoneType
+        :param int chunksize: the number of values in a chunk
+        :returns: a generator of Size objects, in order
+        :rtype: generator of :class:`Size`
+        :raises SizeValueError: on bad parameters
+
+        Each result is the same as the result of
+        :func:`._sizes.getSizesFromInput` for the value.
+    """
+    workers = _workers(max_workers, chunksize)
+    config = config or SizeConfig.INPUT_CONFIG
+    _magnitudeRounder(config.unit, config.method)
+
+    results = _run(
+       _parse_chunk,
+       (list(chunk) for chunk in _chunks(values, chunksize)),
+       (SizeConfig.STRICT, units, config),
+       workers
+    )
+    return _sizes(results)
+
+def parallelRoundSizes(
+   sizes,
+   unit,
+   rounding,
+   max_workers=None,
+   chunksize=_CHUNKSIZE
+):
+    # pylint: disable=line-too-long
+    """ Round every size to a unit, in parallel.
+
+        :param sizes: the sizes
+        :type sizes: any iterable of :class:`Size`, e.g., a SizeArray
+        :param unit: a unit specifier
+        :type unit: any non-negative :class:`Size` or element in :func:`._constants.UNITS`
+        :param rounding: rounding mode to use
+        :type rounding: a field of :class:`._constants.RoundingMethods`
+        :param max_workers: the number of worker processes, default is one
+           for each CPU
+        :type max_workers: int or NoneType
+        :param int chunksize: the number of sizes in a chunk
+        :returns: a generator of rounded sizes, in order
+        :rtype: generator of :class:`Size`
+        :raises SizeValueError: on unusable arguments, or if an element
+           is not a Size
+
+        Each result is the same as the result of :meth:`Size.roundTo`.
+    """
+    workers = _workers(max_workers, chunksize)
+    _magnitudeRounder(unit, rounding)
+
+    results = _run(
+       _round_chunk,
+       (_magnitudes(chunk) for chunk in _chunks(sizes, chunksize)),
+       (SizeConfig.STRICT, unit, rounding),
+       workers
+    )
+    return _sizes(results)
+
+def parallelFormatSizes(
+   sizes,
+   config=None,
+   display=None,
+   max_workers=None,
+   chunksize=_CHUNKSIZE
+):
+    """ Generate a string representation of every size, in parallel.
+
+        :param sizes: the sizes
+        :type sizes: any iterable of :class:`Size`, e.g., a SizeArray
+        :param StrConfig config: representation configuration
+        :param DisplayConfig display: configuration for display
+        :param max_workers: the number of worker processes, default is one
+           for each CPU
+        :type max_workers: int or NoneType
+        :param int chunksize: the number of sizes in a chunk
+        :returns: a generator of string representations, in order
+        :rtype: generator of str
+        :raises SizeValueError: on bad parameters, or if an element is
+           not a Size
+
+        If config or display is None the current configuration in
+        :class:`SizeConfig` is used. Each result is the same as the
+        result of :func:`._formatter.formatSizes`.
+    """
+    workers = _workers(max_workers, chunksize)
+    config = SizeConfig.STR_CONFIG if config is None else config
+    display = SizeConfig.DISPLAY_CONFIG if display is None else display
+
+    results = _run(
+       _format_chunk,
+       (_magnitudes(chunk) for chunk in _chunks(sizes, chunksize)),
+       (SizeConfig.STRICT, config, display),
+       workers
+    )
+    return itertools.chain.from_iterable(results)
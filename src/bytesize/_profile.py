@@ -0,0 +1,278 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Optional counting and timing of the operations of Sizes. """
+
+import functools
+import importlib
+import sys
+import threading
+import time
+
+from collections import namedtuple
+from contextlib import contextmanager
+
+from ._config import _ContextVar
+
+from ._size import Size
+
+from ._util import math_util
+from ._util import misc
+
+ProfileEntry = namedtuple('ProfileEntry', ['calls', 'seconds'])
+""" The number of calls to an operation and the total time they took. """
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+_SIZE_METHODS = (
+   '__init__',
+   '__abs__',
+   '__neg__',
+   '__pos__',
+   '__add__',
+   '__radd__',
+   '__sub__',
+   '__rsub__',
+   '__mul__',
+   '__rmul__',
+   '__truediv__',
+   '__rtruediv__',
+   '__div__',
+   '__rdiv__',
+   '__floordiv__',
+   '__rfloordiv__',
+   '__mod__',
+   '__rmod__',
+   '__divmod__',
+   '__rdivmod__',
+   '__pow__',
+   '__rpow__',
+   'getString',
+   'components',
+   'roundTo'
+)
+""" The methods of Size which are profiled. """
+
+_HELPER_MODULES = (math_util, misc)
+""" The modules whose public functions are profiled. """
+
+_USING_MODULES = ('_align', '_formatter', '_sizes')
+""" Modules which import helpers by name, and which are imported before
+    profiling is enabled, so that their names for the helpers are
+    replaced. _array is not, since it requires numpy.
+"""
+
+_COUNTERS = dict()
+""" Calls and seconds for each operation, as a list of two numbers. """
+
+_COUNTERS_LOCK = threading.Lock()
+""" Guards the numbers in _COUNTERS. """
+
+_ORIGINALS = []
+""" The namespace, name and original value of every replaced attribute,
+    empty if profiling is not enabled.
+"""
+
+_LOCK = threading.Lock()
+""" Guards _ORIGINALS, _ENABLED and _BLOCKS. """
+
+_ENABLED = False
+""" Whether profiling was enabled by enableProfiling. """
+
+_BLOCKS = 0
+""" The number of profiling() blocks which have not ended. """
+
+_PROFILES = _ContextVar('PROFILES', default=())
+""" The counters of the profiling() blocks open in the current context,
+    each a dict like _COUNTERS.
+"""
+
+def _profiled(name, function):
+    """ Wrap a function so that its calls are counted and timed.
+
+        :param str name: the name of the operation
+        :param function: the function
+        :returns: the wrapped function
+    """
+    with _COUNTERS_LOCK:
+        counter = _COUNTERS.setdefault(name, [0, 0.0])
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        # pylint: disable=missing-docstring
+        start = _clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = _clock() - start
+            with _COUNTERS_LOCK:
+                counter[0] += 1
+                counter[1] += elapsed
+            # The counters of a block are used only in its context.
+            for counters in _PROFILES.get():
+                block_counter = counters.setdefault(name, [0, 0.0])
+                block_counter[0] += 1
+                block_counter[1] += elapsed
+
+    return wrapper
+
+def _targets():
+    """ Get the operations to profile.
+
+        :returns: the namespace, name, and qualified name of each
+        :rtype: list of tuple of object * str * str
+    """
+    targets = [
+       (Size, name, "Size.%s" % name) for name in _SIZE_METHODS \
+          if name in vars(Size)
+    ]
+    for module in _HELPER_MODULES:
+        prefix = module.__name__.split('.', 1)[1]
+        targets.extend(
+           (module, name, "%s.%s" % (prefix, name)) \
+              for (name, value) in sorted(vars(module).items()) \
+              if callable(value) and not name.startswith('_') and \
+                 getattr(value, '__module__', None) == module.__name__
+        )
+    return targets
+
+def _install():
+    """ Replace the profiled operations with wrappers, unless they have
+        been replaced already. Must be called with _LOCK held.
+    """
+    if _ORIGINALS:
+        return
+
+    for name in _USING_MODULES:
+        importlib.import_module("." + name, __package__)
+    modules = [
+       m for (n, m) in list(sys.modules.items()) \
+          if m is not None and (n == 'bytesize' or n.startswith('bytesize.'))
+    ]
+    for (namespace, name, qualified) in _targets():
+        original = vars(namespace)[name]
+        wrapper = _profiled(qualified, original)
+        # A helper function may have been imported into other modules.
+        namespaces = [namespace] if namespace is Size else \
+           [m for m in modules if vars(m).get(name) is original]
+        for owner in namespaces:
+            _ORIGINALS.append((owner, name, original))
+            setattr(owner, name, wrapper)
+
+def _uninstall():
+    """ Restore the profiled operations. Must be called with _LOCK held. """
+    while _ORIGINALS:
+        (owner, name, original) = _ORIGINALS.pop()
+        setattr(owner, name, original)
+
+def enableProfiling():
+    """ Start counting and timing operations of Sizes.
+
+        While profiling is enabled, every call to the initializer, the
+        arithmetic operators, :meth:`Size.getString`,
+        :meth:`Size.components` and :meth:`Size.roundTo` of
+        :class:`Size`, and to the helper functions in _util, is counted
+        and timed. Times include the time of any profiled operations
+        called within an operation. Counts are shared by all threads.
+
+        Profiling replaces these methods and functions with wrappers,
+        and disabling it restores the originals, so there is no cost
+        when it is not enabled. Enabling it when it is enabled already
+        has no effect. Helpers used by SizeArray are profiled only if
+        SizeArray has been imported when profiling is enabled.
+    """
+    # pylint: disable=global-statement
+    global _ENABLED
+    with _LOCK:
+        _ENABLED = True
+        _install()
+
+def disableProfiling():
+    """ Stop counting and timing operations of Sizes.
+
+        Profiling remains enabled until every :func:`profiling` block
+        has ended. The counts are kept until :func:`resetProfile` is
+        called.
+    """
+    # pylint: disable=global-statement
+    global _ENABLED
+    with _LOCK:
+        _ENABLED = False
+        if _BLOCKS == 0:
+            _uninstall()
+
+def resetProfile():
+    """ Set every count and time to zero. """
+    with _COUNTERS_LOCK:
+        for counter in _COUNTERS.values():
+            counter[:] = [0, 0.0]
+
+def getProfile():
+    """ Get a snapshot of the counts and times of the operations.
+
+        :returns: the entry for each operation which has been called
+        :rtype: dict of str * ProfileEntry
+    """
+    with _COUNTERS_LOCK:
+        return dict(
+           (name, ProfileEntry(calls, seconds)) \
+              for (name, (calls, seconds)) in _COUNTERS.items() \
+              if calls != 0
+        )
+
+@contextmanager
+def profiling():
+    """ Profile the operations done within a block.
+
+        :returns: a dict, filled on exit with the entry for each
+           operation which was called within the block
+
+        For example::
+
+            with profiling() as profile:
+                handle(request)
+            log(profile)
+
+        Profiling is enabled for the block if it is not enabled already,
+        and stays enabled until the last open block ends. The profile
+        includes only the operations done in the context of the block,
+        i.e., in its thread or asyncio task, so that blocks for requests
+        handled concurrently count only their own operations. The
+        operations are also counted in :func:`getProfile`.
+    """
+    # pylint: disable=global-statement
+    global _BLOCKS
+    with _LOCK:
+        _BLOCKS += 1
+        _install()
+    counters = dict()
+    token = _PROFILES.set(_PROFILES.get() + (counters,))
+    profile = dict()
+    try:
+        yield profile
+    finally:
+        _PROFILES.reset(token)
+        with _LOCK:
+            _BLOCKS -= 1
+            if _BLOCKS == 0 and not _ENABLED:
+                _uninstall()
+        profile.update(
+           (name, ProfileEntry(calls, seconds)) \
+              for (name, (calls, seconds)) in counters.items()
+        )
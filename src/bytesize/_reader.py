@@ -0,0 +1,88 @@
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Reading Sizes from columns of text, e.g., the output of du. """
+
+from ._size import Size
+from ._sizes import getSizesFromInput
+
+
+def _fields(lines, column, separator):
+    """ Generate the field in column of every non-blank line.
+
+        :param lines: the lines
+        :type lines: an iterable of str, e.g., a file object
+        :param int column: the index of the column
+        :param separator: the separator, None for any whitespace
+        :type separator: str or NoneType
+        :returns: a generator of fields
+        :rtype: generator of str
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield line.split(separator)[column]
+
+def readSizes(lines, column=0, separator=None, units=None, config=None):
+    """ Generate a Size from a column of every non-blank line.
+
+        :param lines: the lines
+        :type lines: an iterable of str, e.g., a file object
+        :param int column: the index of the column, default is 0
+        :param separator: the separator, None, the default, for whitespace
+        :type separator: str or NoneType
+        :param units: the units of the values, default is None
+        :type units: any of the defined units constants or NoneType
+        :param config: configures interpretation of inputs
+        :type config: a member of :class:`InputConfig` or NoneType
+        :returns: a generator of sizes
+        :rtype: generator of :class:`Size`
+        :raises SizeValueError: on a bad value
+        :raises IndexError: if a line has too few columns
+
+        Each value is interpreted as by :func:`getSizeFromInput`, so if
+        units is None a value may include its units, e.g., "10GiB", or
+        "10 GiB" if separator is not None.
+
+        Lines are consumed one at a time, so lines may be a file object
+        or a generator of any length, and no more than one line is
+        held in memory at once.
+    """
+    return getSizesFromInput(_fields(lines, column, separator), units, config)
+
+def totalSizes(lines, column=0, separator=None, units=None, config=None):
+    """ Get the total of the Sizes in a column of every non-blank line.
+
+        :param lines: the lines
+        :type lines: an iterable of str, e.g., a file object
+        :param int column: the index of the column, default is 0
+        :param separator: the separator, None, the default, for whitespace
+        :type separator: str or NoneType
+        :param units: the units of the values, default is None
+        :type units: any of the defined units constants or NoneType
+        :param config: configures interpretation of inputs
+        :type config: a member of :class:`InputConfig` or NoneType
+        :returns: the total
+        :rtype: :class:`Size`
+        :raises SizeValueError: on a bad value
+        :raises IndexError: if a line has too few columns
+
+        Each value is read as by :func:`readSizes`, and rounded before
+        it is added to the total.
+    """
+    return Size.sum(readSizes(lines, column, separator, units, config))
@@ -0,0 +1,108 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Encoding many Sizes compactly as bytes. """
+
+from fractions import Fraction
+
+from ._array import SizeArray
+
+from ._errors import SizeValueError
+
+from ._size import Size
+
+from ._util.varint import FORMAT_VERSION
+from ._util.varint import read_magnitude
+from ._util.varint import read_varint
+from ._util.varint import write_magnitude
+from ._util.varint import write_varint
+
+_MAGIC = b"BSZ"
+""" The bytes that begin every encoding of many Sizes. """
+
+def encodeSizes(sizes):
+    """ Encode some Sizes.
+
+        :param sizes: the sizes
+        :type sizes: an iterable of :class:`Size`, e.g., a SizeArray
+        :returns: the encoded sizes
+        :rtype: bytes
+        :raises SizeValueError: if an element is not a Size
+
+        The encoding is the magic bytes b"BSZ", a version byte, the number
+        of sizes as a varint, and then one record for each size, as
+        described in :mod:`._util.varint`. Every magnitude is encoded
+        exactly.
+    """
+    # pylint: disable=protected-access
+    records = bytearray()
+    count = 0
+    if isinstance(sizes, SizeArray):
+        for magnitude in sizes.magnitudes.tolist():
+            write_magnitude(magnitude, records)
+            count += 1
+    else:
+        for size in sizes:
+            if not isinstance(size, Size):
+                raise SizeValueError(size, "size", "must be a Size")
+            write_magnitude(size._magnitude, records)
+            count += 1
+
+    buf = bytearray(_MAGIC)
+    buf.append(FORMAT_VERSION)
+    write_varint(count, buf)
+    buf.extend(records)
+    return bytes(buf)
+
+def decodeSizes(data):
+    """ Decode Sizes encoded by :func:`encodeSizes`.
+
+        :param data: the encoded sizes
+        :type data: bytes or any object supporting the buffer protocol,
+           e.g., an mmap
+        :returns: the sizes, in order
+        :rtype: generator of :class:`Size`
+        :raises SizeValueError: if data is not encoded sizes
+
+        The header is checked immediately. The records are decoded in
+        place, as the generator is consumed, so data is never copied;
+        it must not be changed or closed until the generator is done.
+    """
+    # pylint: disable=protected-access
+    view = memoryview(data)
+    if bytes(view[:len(_MAGIC)]) != _MAGIC:
+        raise SizeValueError(data, "data", "not encoded sizes")
+    offset = len(_MAGIC)
+    if len(view) == offset or bytearray(view[offset:offset + 1])[0] != \
+       FORMAT_VERSION:
+        raise SizeValueError(data, "data", "unknown format version")
+    (count, offset) = read_varint(view, offset + 1)
+
+    def decode(offset):
+        """ Decode the records. """
+        for _ in range(count):
+            (numerator, denominator, offset) = read_magnitude(view, offset)
+            yield Size._fromMagnitude(
+               numerator if denominator == 1 else \
+                  Fraction(numerator, denominator)
+            )
+        if offset != len(view):
+            raise SizeValueError(data, "data", "extra bytes follow the sizes")
+
+    return decode(offset)
@@ -29,6 +29,8 @@ from fractions import Fraction
 
 import six
 
+from . import _cache
+
 from ._config import SizeConfig
 
 from ._errors import SizeFractionalResultError
@@ -38,19 +40,59 @@ from ._errors import SizePowerResultError
 from ._errors import SizeValueError
 
 from ._constants import B
-from ._constants import BinaryUnits
-from ._constants import DecimalUnits
+from ._constants import BINARY_UNITS
+from ._constants import DECIMAL_UNITS
 from ._constants import PRECISE_NUMERIC_TYPES
 
+from ._util.math_util import is_exact_decimal
 from ._util.math_util import round_fraction
 
 from ._util.misc import get_decimal_info
 from ._util.misc import get_string_info
 
+from ._util.units import get_unit_table
+
+from ._util.varint import FORMAT_VERSION
+from ._util.varint import read_magnitude
+from ._util.varint import write_magnitude
+
 _BYTES_SYMBOL = "B"
 
+def _as_number(value):
+    """ Convert a precise numeric value to an int or a Fraction.
+
+        :param value: the value
+        :type value: any precise numeric type
+        :returns: the value as an int, if it is an int, otherwise a Fraction
+        :rtype: int or Fraction
+        :raises TypeError: if value is not a numeric type
+        :raises ValueError: if value can not be converted to a Fraction
+    """
+    if isinstance(value, six.integer_types):
+        return value
+    return Fraction(value)
+
+def _get_size(numerator, denominator=1):
+    """ Get the Size with the given magnitude.
+
+        Used to unpickle Sizes, so does no checking, and ignores STRICT.
+
+        :param int numerator: the numerator of the magnitude
+        :param int denominator: the denominator, if the magnitude is fractional
+        :returns: the size
+        :rtype: :class:`Size`
+    """
+    size = object.__new__(Size)
+    # pylint: disable=protected-access
+    size._magnitude = \
+       numerator if denominator == 1 else Fraction(numerator, denominator)
+    return size
+
 class Size(object):
     """ Class for instantiating Size objects. """
+    # pylint: disable=protected-access
+
+    __slots__ = ('_magnitude',)
 
     _FMT_STR = "".join([
        "%(approx)s",
@@ -82,7 +124,7 @@ class Size(object):
             try:
                 units = B if units is None else units
                 factor = getattr(units, 'magnitude', None) or int(units)
-                magnitude = Fraction(value) * factor
+                magnitude = _as_number(value) * factor
             except (ValueError, TypeError):
                 raise SizeValueError(value, "value")
 
@@ -93,13 +135,110 @@ class Size(object):
                    "units",
                    "meaningless when Size value is passed"
                 )
-            magnitude = value.magnitude # pylint: disable=no-member
+            magnitude = value._magnitude
         else:
             raise SizeValueError(value, "value")
 
-        if SizeConfig.STRICT is True and magnitude.denominator != 1:
+        self._magnitude = self._normalize(magnitude)
+
+    @staticmethod
+    def _normalize(magnitude):
+        """ Get the canonical representation of a number of bytes.
+
+            :param magnitude: the number of bytes
+            :type magnitude: int or Fraction
+            :returns: an int if magnitude is integral, otherwise a Fraction
+            :rtype: int or Fraction
+            :raises SizeFractionalResultError: if fractional and STRICT
+
+            Nearly all sizes are whole numbers of bytes, so these are
+            stored as ints, which are much cheaper to compute with than
+            Fractions.
+        """
+        if isinstance(magnitude, six.integer_types):
+            return magnitude
+        if magnitude.denominator == 1:
+            return magnitude.numerator
+        if SizeConfig.STRICT is True:
             raise SizeFractionalResultError()
-        self._magnitude = magnitude
+        return magnitude
+
+    @classmethod
+    def _fromMagnitude(cls, magnitude):
+        """ Construct a Size directly from a number of bytes.
+
+            :param magnitude: the number of bytes
+            :type magnitude: int or Fraction
+            :returns: a new Size
+            :rtype: :class:`Size`
+            :raises SizeFractionalResultError: if fractional and STRICT
+
+            Skips the argument checking done by the initializer.
+        """
+        size = object.__new__(cls)
+        size._magnitude = cls._normalize(magnitude)
+        return size
+
+    @classmethod
+    def sum(cls, sizes):
+        """ Get the total of some Sizes.
+
+            :param sizes: the sizes
+            :type sizes: an iterable of :class:`Size`, e.g., a generator
+            :returns: the total, Size(0) if there are no sizes
+            :rtype: :class:`Size`
+            :raises SizeNonsensicalBinOpError: if an element is not a Size
+            :raises SizeFractionalResultError: if fractional and STRICT
+
+            Equivalent to sum(sizes, Size(0)), but only one Size is
+            constructed. Integral magnitudes are added as ints, and
+            the rare fractional magnitudes are added separately.
+        """
+        total = 0
+        fractional = 0
+        for size in sizes:
+            if not isinstance(size, Size):
+                raise SizeNonsensicalBinOpError("+", size)
+            magnitude = size._magnitude
+            if isinstance(magnitude, six.integer_types):
+                total += magnitude
+            else:
+                fractional += magnitude
+        return cls._fromMagnitude(total + fractional)
+
+    def toBytes(self):
+        """ Encode this size compactly.
+
+            :returns: a version byte followed by the encoded magnitude
+            :rtype: bytes
+
+            The magnitude is encoded exactly, as a varint if it is
+            integral, or as a numerator and denominator otherwise. The
+            encoding is stable; see :mod:`._util.varint`.
+        """
+        buf = bytearray([FORMAT_VERSION])
+        write_magnitude(self._magnitude, buf)
+        return bytes(buf)
+
+    @classmethod
+    def fromBytes(cls, data):
+        """ Decode a size encoded by :meth:`toBytes`.
+
+            :param data: the encoded size
+            :type data: bytes or any object supporting the buffer protocol
+            :returns: the size
+            :rtype: :class:`Size`
+            :raises SizeValueError: if data is not an encoded size
+        """
+        view = memoryview(data)
+        if len(view) == 0 or bytearray(view[:1])[0] != FORMAT_VERSION:
+            raise SizeValueError(data, "data", "unknown format version")
+        (numerator, denominator, offset) = read_magnitude(view, 1)
+        if offset != len(view):
+            raise SizeValueError(data, "data", "extra bytes follow the size")
+        return cls._fromMagnitude(
+           numerator if denominator == 1 else Fraction(numerator, denominator)
+        )
 
     @property
     def magnitude(self):
@@ -107,7 +246,7 @@ class Size(object):
         :returns: the number of bytes
         :rtype: Fraction
         """
-        return self._magnitude
+        return Fraction(self._magnitude)
 
     def getDecimalInfo(self, config):
         """
@@ -150,7 +289,7 @@ class Size(object):
         5. a unit specifier
 
         """
-        (magnitude, units) = self.components(config)
+        (magnitude, units) = self._components(config)
         (exact, sign, left, right) = get_string_info(
            magnitude,
            places=config.max_places
@@ -166,7 +305,24 @@ class Size(object):
             :returns: a string representation
             :rtype: str
         """
-        (approx, sign, left, right, units) = self.getStringInfo(config)
+        cache = _cache.RENDER_CACHE
+        if cache is None:
+            return self._formatStringInfo(self.getStringInfo(config), display)
+        return cache.lookup(
+           (self._magnitude, config, display),
+           lambda: self._formatStringInfo(self.getStringInfo(config), display)
+        )
+
+    @classmethod
+    def _formatStringInfo(cls, info, display):
+        """ Format the result of getStringInfo as a string.
+
+            :param tuple info: a result of getStringInfo
+            :param DisplayConfig display: configuration for display
+            :returns: a string representation
+            :rtype: str
+        """
+        (approx, sign, left, right, units) = info
         approx_str = display.approx_symbol \
            if approx and display.show_approx_str else ""
 
@@ -183,7 +339,7 @@ class Size(object):
            'bytes' : _BYTES_SYMBOL
         }
 
-        return self._FMT_STR % result
+        return cls._FMT_STR % result
 
     def __str__(self):
         return self.getString(SizeConfig.STR_CONFIG, SizeConfig.DISPLAY_CONFIG)
@@ -204,9 +360,19 @@ class Size(object):
         return "Size(%s%s.%s(%s))" % \
            (sign, radix_num.left, non_repeating, repeating)
 
+    def __reduce__(self):
+        magnitude = self._magnitude
+        if isinstance(magnitude, six.integer_types):
+            return (_get_size, (magnitude,))
+        return (_get_size, (magnitude.numerator, magnitude.denominator))
+
+    # Sizes are immutable, so a copy may be the Size itself.
+    def __copy__(self):
+        return self
+
     def __deepcopy__(self, memo):
         # pylint: disable=unused-argument
-        return Size(self._magnitude)
+        return self
 
     def __nonzero__(self):
         return self._magnitude != 0
@@ -224,19 +390,19 @@ class Size(object):
     # UNARY OPERATIONS
 
     def __abs__(self):
-        return Size(abs(self._magnitude))
+        return Size._fromMagnitude(abs(self._magnitude))
 
     def __neg__(self):
-        return Size(-(self._magnitude))
+        return Size._fromMagnitude(-(self._magnitude))
 
     def __pos__(self):
-        return Size(self._magnitude)
+        return Size._fromMagnitude(self._magnitude)
 
     # BINARY OPERATIONS
     def __add__(self, other):
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError("+", other)
-        return Size(self._magnitude + other.magnitude)
+        return Size._fromMagnitude(self._magnitude + other._magnitude)
     __radd__ = __add__
 
     def __divmod__(self, other):
@@ -246,14 +412,14 @@ class Size(object):
         #                   = Fraction, if T(other) is Size
         if isinstance(other, Size):
             try:
-                (div, rem) = divmod(self._magnitude, other.magnitude)
-                return (div, Size(rem))
+                (div, rem) = divmod(self._magnitude, other._magnitude)
+                return (div, Size._fromMagnitude(rem))
             except ZeroDivisionError:
                 raise SizeNonsensicalBinOpValueError("divmod", other)
         if isinstance(other, PRECISE_NUMERIC_TYPES):
             try:
-                (div, rem) = divmod(self._magnitude, Fraction(other))
-                return (Size(div), Size(rem))
+                (div, rem) = divmod(self._magnitude, _as_number(other))
+                return (Size._fromMagnitude(div), Size._fromMagnitude(rem))
             except (TypeError, ValueError, ZeroDivisionError):
                 raise SizeNonsensicalBinOpValueError("divmod", other)
         raise SizeNonsensicalBinOpError("divmod", other)
@@ -266,14 +432,14 @@ class Size(object):
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError("rdivmod", other)
         try:
-            (div, rem) = divmod(other.magnitude, self._magnitude)
-            return (div, Size(rem))
+            (div, rem) = divmod(other._magnitude, self._magnitude)
+            return (div, Size._fromMagnitude(rem))
         except ZeroDivisionError:
             raise SizeNonsensicalBinOpValueError("rdivmod", other)
 
     def __eq__(self, other):
         return isinstance(other, Size) and \
-           self._magnitude == other.magnitude
+           self._magnitude == other._magnitude
 
     def __floordiv__(self, other):
         # other * floor + rem = self
@@ -281,12 +447,14 @@ class Size(object):
         #                     = int, if T(other) is Size
         if isinstance(other, Size):
             try:
-                return self._magnitude.__floordiv__(other.magnitude)
+                return self._magnitude // other._magnitude
             except ZeroDivisionError:
                 raise SizeNonsensicalBinOpValueError("floordiv", other)
         if isinstance(other, PRECISE_NUMERIC_TYPES):
             try:
-                return Size(self._magnitude.__floordiv__(Fraction(other)))
+                return Size._fromMagnitude(
+                   self._magnitude // _as_number(other)
+                )
             except (TypeError, ValueError, ZeroDivisionError):
                 raise SizeNonsensicalBinOpValueError("floordiv", other)
         raise SizeNonsensicalBinOpError("floordiv", other)
@@ -297,41 +465,43 @@ class Size(object):
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError("rfloordiv", other)
         try:
-            return other.magnitude.__floordiv__(self._magnitude)
+            return other._magnitude // self._magnitude
         except ZeroDivisionError:
             raise SizeNonsensicalBinOpValueError("rfloordiv", other)
 
     def __ge__(self, other):
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError(">=", other)
-        return self._magnitude >= other.magnitude
+        return self._magnitude >= other._magnitude
 
     def __gt__(self, other):
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError(">", other)
-        return self._magnitude > other.magnitude
+        return self._magnitude > other._magnitude
 
     def __le__(self, other):
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError("<=", other)
-        return self._magnitude <= other.magnitude
+        return self._magnitude <= other._magnitude
 
     def __lt__(self, other):
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError("<", other)
-        return self._magnitude < other.magnitude
+        return self._magnitude < other._magnitude
 
     def __mod__(self, other):
         # other * div + mod = self
         # Therefore, T(mod) = Size
         if isinstance(other, Size):
             try:
-                return Size(self._magnitude % other.magnitude)
+                return Size._fromMagnitude(self._magnitude % other._magnitude)
             except ZeroDivisionError:
                 raise SizeNonsensicalBinOpValueError('%', other)
         if isinstance(other, PRECISE_NUMERIC_TYPES):
             try:
-                return Size(self._magnitude % Fraction(other))
+                return Size._fromMagnitude(
+                   self._magnitude % _as_number(other)
+                )
             except (TypeError, ValueError, ZeroDivisionError):
                 raise SizeNonsensicalBinOpValueError('%', other)
         raise SizeNonsensicalBinOpError("%", other)
@@ -342,7 +512,7 @@ class Size(object):
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError("rmod", other)
         try:
-            return Size(other.magnitude % Fraction(self._magnitude))
+            return Size._fromMagnitude(other._magnitude % self._magnitude)
         except (TypeError, ValueError, ZeroDivisionError):
             raise SizeNonsensicalBinOpValueError("rmod", other)
 
@@ -351,7 +521,7 @@ class Size(object):
         # Therefore, T(mul) = Size and T(other) is a numeric type.
         if isinstance(other, PRECISE_NUMERIC_TYPES):
             try:
-                return Size(self._magnitude * Fraction(other))
+                return Size._fromMagnitude(self._magnitude * _as_number(other))
             except (TypeError, ValueError):
                 raise SizeNonsensicalBinOpError("*", other)
         if isinstance(other, Size):
@@ -372,33 +542,35 @@ class Size(object):
 
     def __ne__(self, other):
         return not isinstance(other, Size) or \
-           self._magnitude != other.magnitude
+           self._magnitude != other._magnitude
 
     def __sub__(self, other):
         # self - other = sub
         # Therefore, T(sub) = T(self) = Size and T(other) = Size.
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError("-", other)
-        return Size(self._magnitude - other.magnitude)
+        return Size._fromMagnitude(self._magnitude - other._magnitude)
 
     def __rsub__(self, other):
         # other - self = sub
         # Therefore, T(sub) = T(self) = Size and T(other) = Size.
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError("rsub", other)
-        return Size(other.magnitude - self._magnitude)
+        return Size._fromMagnitude(other._magnitude - self._magnitude)
 
     def __truediv__(self, other):
         # other * truediv = self
         # Therefore, T(truediv) = Fraction, if T(other) is Size
         if isinstance(other, Size):
             try:
-                return self._magnitude.__truediv__(other.magnitude)
+                return Fraction(self._magnitude, other._magnitude)
             except ZeroDivisionError:
                 raise SizeNonsensicalBinOpValueError("truediv", other)
         elif isinstance(other, PRECISE_NUMERIC_TYPES):
             try:
-                return Size(self._magnitude.__truediv__(Fraction(other)))
+                return Size._fromMagnitude(
+                   Fraction(self._magnitude, _as_number(other))
+                )
             except (TypeError, ValueError, ZeroDivisionError):
                 raise SizeNonsensicalBinOpValueError("truediv", other)
         raise SizeNonsensicalBinOpError("truediv", other)
@@ -411,7 +583,7 @@ class Size(object):
         if not isinstance(other, Size):
             raise SizeNonsensicalBinOpError("rtruediv", other)
         try:
-            return other.magnitude.__truediv__(self._magnitude)
+            return Fraction(other._magnitude, self._magnitude)
         except ZeroDivisionError:
             raise SizeNonsensicalBinOpValueError("rtruediv", self)
 
@@ -436,7 +608,7 @@ class Size(object):
                "can not convert to non-positive unit %s"
             )
 
-        return self._magnitude / factor
+        return Fraction(self._magnitude, factor)
 
     def componentsList(self, binary_units=True):
         """ Yield a representation of this size for every unit,
@@ -445,26 +617,45 @@ class Size(object):
 
             :param bool binary_units: binary units if True, else SI
         """
-        units = BinaryUnits if binary_units else DecimalUnits
+        units = BINARY_UNITS if binary_units else DECIMAL_UNITS
 
-        for unit in [B] + units.UNITS():
+        for unit in units:
             yield (self.convertTo(unit), unit)
 
-    def components(self, config=SizeConfig.STR_CONFIG):
+    def components(self, config=None):
         """ Return a representation of this size, decomposed into a
             Fraction value and a unit specifier tuple.
 
-            :param StrConfig config: configuration
+            :param config: configuration, default is None
+            :type config: :class:`StrConfig` or NoneType
 
             :returns: a pair of a decimal value and a unit
             :rtype: tuple of Fraction and unit
             :raises SizeValueError: if min_value is not usable
 
             The meaning of the parameters is the same as for
-            :class:`._config.StrConfig`.
+            :class:`._config.StrConfig`. If config is None, the current
+            configuration in :class:`SizeConfig` is used.
         """
-        units = BinaryUnits if config.binary_units else DecimalUnits
+        config = SizeConfig.STR_CONFIG if config is None else config
+        cache = _cache.RENDER_CACHE
+        if cache is None:
+            return self._components(config)
+        return cache.lookup(
+           (self._magnitude, config),
+           lambda: self._components(config)
+        )
+
+    def _components(self, config):
+        """ Return a representation of this size, decomposed into a
+            Fraction value and a unit specifier tuple.
+
+            :param StrConfig config: configuration
+            :returns: a pair of a decimal value and a unit
+            :rtype: tuple of Fraction and unit
 
+            Never uses the render cache.
+        """
         if config.unit is not None:
             return (self.convertTo(config.unit), config.unit)
 
@@ -472,22 +663,17 @@ class Size(object):
         # FACTOR * min_value to the left of the decimal point.
         # If the number is so large that no prefix will satisfy this
         # requirement use the largest prefix.
-        limit = units.FACTOR * Fraction(config.min_value)
-        tried = []
-        for (value, unit) in self.componentsList(
-           binary_units=config.binary_units
-        ):
-            tried.append((value, unit))
-            if abs(value) < limit:
-                break
+        table = get_unit_table(config.binary_units, config.min_value)
+        index = table.select(self._magnitude)
+        unit = table.units[index]
+        value = Fraction(self._magnitude, int(unit))
 
         if config.exact_value:
-            for (value, unit) in reversed(tried):
-                (exact, _, _, _) = get_string_info(value, config.max_places)
-                if exact is True:
+            for unit in reversed(table.units[:index + 1]):
+                value = Fraction(self._magnitude, int(unit))
+                if is_exact_decimal(value, config.max_places):
                     break
 
-        # pylint: disable=undefined-loop-variable
         return (value, unit)
 
     def roundTo(self, unit, rounding):
@@ -512,6 +698,6 @@ class Size(object):
         if factor == 0:
             return Size(0)
 
-        magnitude = self._magnitude / factor
+        magnitude = Fraction(self._magnitude, factor)
         rounded = round_fraction(magnitude, rounding)
-        return Size(rounded * factor)
+        return Size._fromMagnitude(rounded * factor)
@@ -18,10 +18,21 @@
 
 """ Class for methods that do not properly belong in the Size class. """
 
+from fractions import Fraction
+
+import six
+
 from ._config import SizeConfig
 
+from ._constants import ROUNDING_METHODS
+
+from ._errors import SizeValueError
+
 from ._size import Size
 
+from ._util.math_util import round_quotient
+from ._util.parse import parse_size
+
 def getSizeFromInput(value=0, units=None, config=None):
     """ Get a Size object from an input value and units.
 
@@ -34,9 +45,135 @@ def getSizeFromInput(value=0, units=None, config=None):
         :returns: a Size object
         :rtype: :class:`Size`
         :raises SizeValueError: on bad parameters
+
+        If value is a str and units is None, value may include its units,
+        e.g., "10 GiB", "1.5MB", "512k", or "3 mebibytes". An abbreviation
+        may be in any case, but a following 'B' must be upper case.
     """
     config = config or SizeConfig.INPUT_CONFIG
 
+    if units is None and isinstance(value, six.string_types):
+        (value, units) = parse_size(value)
+
     return Size(value, units).roundTo(config.unit, config.method)
 
+def _magnitudeRounder(unit, rounding):
+    # pylint: disable=line-too-long
+    """ Get a function which rounds a magnitude to a unit.
+
+        :param unit: a unit specifier
+        :type unit: any non-negative :class:`Size` or element in :func:`._constants.UNITS`
+        :param rounding: rounding mode to use
+        :type rounding: a field of :class:`._constants.RoundingMethods`
+        :returns: a function from a magnitude to a rounded Size
+        :rtype: callable
+        :raises SizeValueError: on unusable arguments
+
+        The factor is computed once, so rounding each magnitude costs
+        one integer division.
+    """
+    # pylint: disable=protected-access
+    factor = getattr(unit, 'magnitude', None) or int(unit)
+
+    if factor < 0:
+        raise SizeValueError(factor, "factor")
+
+    if rounding not in ROUNDING_METHODS():
+        raise SizeValueError(rounding, "rounding")
+
+    if factor == 0:
+        return lambda magnitude: Size._fromMagnitude(0)
+
+    factor = Fraction(factor)
+    (numerator, denominator) = (factor.numerator, factor.denominator)
+    if denominator == 1:
+        factor = numerator
+
+    def round_magnitude(magnitude):
+        """ Round a magnitude to the unit.
+
+            :param magnitude: the magnitude
+            :type magnitude: int or Fraction
+            :returns: the rounded Size
+            :rtype: :class:`Size`
+        """
+        if isinstance(magnitude, six.integer_types):
+            quotient = round_quotient(
+               magnitude * denominator,
+               numerator,
+               rounding
+            )
+        else:
+            quotient = round_quotient(
+               magnitude.numerator * denominator,
+               magnitude.denominator * numerator,
+               rounding
+            )
+        return Size._fromMagnitude(quotient * factor)
+
+    return round_magnitude
+
+def roundSizes(sizes, unit, rounding):
+    # pylint: disable=line-too-long
+    """ Round every size to a unit specified as a named constant or a Size.
+
+        :param sizes: the sizes
+        :type sizes: any iterable of :class:`Size`
+        :param unit: a unit specifier
+        :type unit: any non-negative :class:`Size` or element in :func:`._constants.UNITS`
+        :param rounding: rounding mode to use
+        :type rounding: a field of :class:`._constants.RoundingMethods`
+        :returns: a generator of rounded sizes
+        :rtype: generator of :class:`Size`
+        :raises SizeValueError: on unusable arguments, or if an element
+           is not a Size
+
+        Each result is the same as the result of :meth:`Size.roundTo`,
+        but the factor is computed once for all the sizes and rounding
+        uses only integer division. To round a :class:`SizeArray` use
+        :meth:`SizeArray.roundTo`.
+    """
+    round_magnitude = _magnitudeRounder(unit, rounding)
+
+    def generate():
+        """ Generate the rounded sizes. """
+        # pylint: disable=protected-access
+        for size in sizes:
+            if not isinstance(size, Size):
+                raise SizeValueError(size, "size", "must be a Size")
+            yield round_magnitude(size._magnitude)
+
+    return generate()
+
+def getSizesFromInput(values, units=None, config=None):
+    """ Get a Size object from every input value.
+
+        :param values: the size values
+        :type values: any iterable of values accepted by getSizeFromInput
+        :param units: the units of every size, default is None
+        :type units: any of the defined units constants or Size or NoneType
+        :param config: configures interpretation of inputs
+        :type config: a member of :class:`InputConfig` or NoneType
+        :returns: a generator of Size objects
+        :rtype: generator of :class:`Size`
+        :raises SizeValueError: on bad parameters
+
+        Each result is the same as the result of :func:`getSizeFromInput`
+        for the value, but the rounding factor is computed once for all
+        the values.
+    """
+    config = config or SizeConfig.INPUT_CONFIG
+    round_magnitude = _magnitudeRounder(config.unit, config.method)
+
+    def generate():
+        """ Generate the sizes. """
+        # pylint: disable=protected-access
+        for value in values:
+            value_units = units
+            if units is None and isinstance(value, six.string_types):
+                (value, value_units) = parse_size(value)
+            yield round_magnitude(Size(value, value_units)._magnitude)
+
+    return generate()
+
 AI = Size(0) # pragma: no cover
@@ -0,0 +1,216 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Statistics of many Sizes, accumulated one Size at a time. """
+
+from fractions import Fraction
+
+from ._errors import SizeValueError
+
+from ._size import Size
+
+from ._util.sketch import QuantileSketch
+
+
+class SizeStats(object):
+    """ Accumulates statistics of a stream of Sizes.
+
+        The count, total, minimum, maximum, mean and variance are exact.
+        Quantiles are approximated by a sketch, which holds a number of
+        values that grows only logarithmically with the number of Sizes.
+
+        Accumulators for different streams, e.g., in different worker
+        processes, can be pickled and merged.
+    """
+    # pylint: disable=protected-access
+
+    __slots__ = ('_count', '_max', '_min', '_sketch', '_squares', '_total')
+
+    def __init__(self, sizes=(), k=200):
+        """ Initializer.
+
+            :param sizes: sizes to add, default is none
+            :type sizes: an iterable of :class:`Size`
+            :param int k: accuracy of quantiles, default is 200
+
+            The error in the rank of a quantile is roughly 1.7 / k of
+            the number of sizes.
+        """
+        self._count = 0
+        self._total = 0
+        self._squares = 0
+        self._min = None
+        self._max = None
+        self._sketch = QuantileSketch(k)
+        self.update(sizes)
+
+    def __str__(self):
+        if self._count == 0:
+            return "SizeStats(count=0)"
+        return "SizeStats(count=%s, min=%s, mean=%s, max=%s)" % \
+           (self._count, self.min, self.mean, self.max)
+    __repr__ = __str__
+
+    def add(self, size):
+        """ Add a Size.
+
+            :param Size size: the size
+            :raises SizeValueError: if size is not a Size
+        """
+        if not isinstance(size, Size):
+            raise SizeValueError(size, "size", "must be a Size")
+        magnitude = size._magnitude
+        self._count += 1
+        self._total += magnitude
+        self._squares += magnitude * magnitude
+        if self._min is None or magnitude < self._min:
+            self._min = magnitude
+        if self._max is None or magnitude > self._max:
+            self._max = magnitude
+        self._sketch.add(magnitude)
+
+    def update(self, sizes):
+        """ Add some Sizes.
+
+            :param sizes: the sizes
+            :type sizes: an iterable of :class:`Size`, e.g., a generator
+            :raises SizeValueError: if an element is not a Size
+        """
+        for size in sizes:
+            self.add(size)
+
+    def merge(self, other):
+        """ Add all the Sizes added to another accumulator.
+
+            :param SizeStats other: the other accumulator, unchanged
+        """
+        if other._count == 0:
+            return
+        self._count += other._count
+        self._total += other._total
+        self._squares += other._squares
+        if self._min is None or other._min < self._min:
+            self._min = other._min
+        if self._max is None or other._max > self._max:
+            self._max = other._max
+        self._sketch.merge(other._sketch)
+
+    @property
+    def count(self):
+        """
+        :returns: the number of sizes
+        :rtype: int
+        """
+        return self._count
+
+    @property
+    def total(self):
+        """
+        :returns: the total of the sizes
+        :rtype: :class:`Size`
+        """
+        return Size._fromMagnitude(self._total)
+
+    @property
+    def min(self):
+        """
+        :returns: the smallest size, None if there are no sizes
+        :rtype: :class:`Size` or NoneType
+        """
+        if self._min is None:
+            return None
+        return Size._fromMagnitude(self._min)
+
+    @property
+    def max(self):
+        """
+        :returns: the largest size, None if there are no sizes
+        :rtype: :class:`Size` or NoneType
+        """
+        if self._max is None:
+            return None
+        return Size._fromMagnitude(self._max)
+
+    @property
+    def mean(self):
+        """
+        :returns: the mean of the sizes, None if there are no sizes
+        :rtype: :class:`Size` or NoneType
+        :raises SizeFractionalResultError: if fractional and STRICT
+        """
+        if self._count == 0:
+            return None
+        return Size._fromMagnitude(Fraction(self._total, self._count))
+
+    @property
+    def variance(self):
+        """
+        :returns: the population variance, None if there are no sizes
+        :rtype: Fraction or NoneType
+
+        The variance is a number of bytes squared, which is not a Size.
+        """
+        if self._count == 0:
+            return None
+        return Fraction(
+           self._count * self._squares - self._total * self._total,
+           self._count * self._count
+        )
+
+    def quantiles(self, fractions):
+        """ Approximate quantiles of the sizes.
+
+            :param fractions: the fractions of the sizes, each in [0, 1]
+            :type fractions: sequence of a precise numeric type
+            :returns: for each fraction, the least size which is at least
+               that fraction of the sizes, approximately
+            :rtype: list of :class:`Size`, or of None if there are no sizes
+            :raises SizeValueError: if a fraction is not in [0, 1]
+
+            The quantile for 0 is exactly the minimum and the quantile
+            for 1 is exactly the maximum.
+        """
+        for fraction in fractions:
+            if not 0 <= fraction <= 1:
+                raise SizeValueError(fraction, "fraction", "not in [0, 1]")
+        if self._count == 0:
+            return [None for _ in fractions]
+
+        values = self._sketch.quantiles(fractions)
+        for (index, fraction) in enumerate(fractions):
+            if fraction == 0:
+                values[index] = self._min
+            elif fraction == 1:
+                values[index] = self._max
+        return [Size._fromMagnitude(value) for value in values]
+
+    def quantile(self, fraction):
+        """ Approximate a quantile of the sizes.
+
+            :param fraction: the fraction of the sizes, in [0, 1]
+            :type fraction: a precise numeric type
+            :returns: the least size which is at least that fraction of
+               the sizes, approximately, None if there are no sizes
+            :rtype: :class:`Size` or NoneType
+            :raises SizeValueError: if fraction is not in [0, 1]
+
+            For example, quantile(Fraction(99, 100)) approximates the
+            99th percentile.
+        """
+        return self.quantiles([fraction])[0]
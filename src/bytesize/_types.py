@@ -22,6 +22,8 @@ class RadixNumber(object):
     """ Represents a class with a radix and possibly repeating digits. """
     # pylint: disable=too-few-public-methods
 
+    __slots__ = ('sign', 'left', 'non_repeating', 'repeating')
+
     def __init__(self, sign, left, non_repeating, repeating):
         """
         Initializer.
@@ -26,6 +26,21 @@ from .._constants import PRECISE_NUMERIC_TYPES
 from .._errors import SizeValueError
 
 
+def _multiplicity(factor, value):
+    """
+    Get the number of times that ``factor`` divides ``value``.
+
+    :param int factor: the factor, greater than 1
+    :param int value: the value, greater than 0
+    :returns: the largest n such that factor ** n divides value
+    :rtype: int
+    """
+    count = 0
+    while value % factor == 0:
+        value //= factor
+        count += 1
+    return count
+
 def get_repeating_fraction(numerator, denominator):
     """
     Get the repeating decimal number corresponding to the ratio of
@@ -57,18 +72,73 @@ def get_repeating_fraction(numerator, denominator):
            "must be greater than numerator"
         )
 
-    rem = numerator
+    # The ratio is 1, so the single step of long division gives 10.
+    if numerator == denominator:
+        return ([10], 0)
+
+    fraction = Fraction(numerator, denominator)
+    (rem, denominator) = (fraction.numerator, fraction.denominator)
+
+    # The number of non-repeating digits is the larger of the
+    # multiplicities of 2 and 5 in the reduced denominator.
+    non_repeating_len = max(
+       _multiplicity(2, denominator),
+       _multiplicity(5, denominator)
+    )
 
     quotients = []
-    remainders = []
-    while rem != 0 and rem not in remainders:
-        remainders.append(rem)
+    for _ in range(non_repeating_len):
+        (quot, rem) = divmod(rem * 10, denominator)
+        quotients.append(quot)
+
+    if rem == 0:
+        return (quotients, 0)
+
+    # The remaining digits are purely periodic, so the first remainder
+    # to recur is the one at the start of the period.
+    start = rem
+    while True:
         (quot, rem) = divmod(rem * 10, denominator)
         quotients.append(quot)
+        if rem == start:
+            break
+
+    return (quotients, len(quotients) - non_repeating_len)
 
-    # if rem is not 0 this is a repeating decimal
-    repeat_len = 0 if rem == 0 else len(remainders) - remainders.index(rem)
-    return (quotients, repeat_len)
+def is_exact_decimal(value, places):
+    """
+    Whether ``value`` has an exact decimal representation in ``places``
+    digits to the right of the decimal point.
+
+    :param value: the value
+    :type value: any precise numeric quantity
+    :param places: the number of places, if None, any finite number
+    :type places: an integer type or NoneType
+    :returns: True if the representation is exact, otherwise False
+    :rtype: bool
+    """
+    denominator = Fraction(value).denominator
+    if places is None:
+        denominator //= 2 ** _multiplicity(2, denominator)
+        denominator //= 5 ** _multiplicity(5, denominator)
+        return denominator == 1
+    return 10 ** places % denominator == 0
+
+def round_scaled(numerator, denominator, scale):
+    """
+    Round the non-negative ratio of ``numerator`` and ``denominator``,
+    multiplied by ``scale``, to the nearest integer, down on a tie.
+
+    :param int numerator: the numerator, at least 0
+    :param int denominator: the denominator, greater than 0
+    :param int scale: the scale, e.g., 10 ** places
+    :returns: the rounded value and whether it is exact
+    :rtype: tuple of int * bool
+    """
+    (rounded, rem) = divmod(numerator * scale, denominator)
+    if 2 * rem > denominator:
+        rounded += 1
+    return (rounded, rem == 0)
 
 def long_decimal_division(divisor, dividend):
     """ Precise division of two precise quantities.
@@ -136,8 +206,22 @@ def round_fraction(value, rounding):
         :return: a rounded integer
         :rtype: int
     """
+    return round_quotient(value.numerator, value.denominator, rounding)
+
+def round_quotient(numerator, denominator, rounding):
+    """ Round the ratio of two integers according to rounding method.
+
+        :param int numerator: the numerator
+        :param int denominator: the denominator, greater than 0
+        :param rounding: rounding method
+        :type rounding: a member of RoundingMethods
+        :return: a rounded integer
+        :rtype: int
+
+        Uses only integer division, so no Fraction is constructed.
+    """
     # pylint: disable=too-many-return-statements
-    (base, rest) = divmod(value.numerator, value.denominator)
+    (base, rest) = divmod(numerator, denominator)
     if rest == 0:
         return base
 
@@ -152,12 +236,11 @@ def round_fraction(value, rounding):
        RoundingMethods.ROUND_HALF_DOWN
     )
     if rounding in half_methods:
-        fraction = Fraction(rest, value.denominator)
-        half = Fraction(1, 2)
+        twice = 2 * rest
 
-        if fraction < half:
+        if twice < denominator:
             return base
-        elif fraction > half:
+        elif twice > denominator:
             return base + 1
         else:
             if rounding == RoundingMethods.ROUND_HALF_UP:
@@ -26,7 +26,9 @@ from .._errors import SizeValueError
 
 from .._types import RadixNumber
 
+from .math_util import is_exact_decimal
 from .math_util import long_decimal_division
+from .math_util import round_scaled
 
 
 def get_decimal_info(value):
@@ -52,6 +54,21 @@ def get_decimal_info(value):
 
     return RadixNumber(sign, left, non_repeating, repeating)
 
+def _check_places(places):
+    """ Check that places is a usable number of decimal places.
+
+        :param places: number of decimal places
+        :type places: an integer type or NoneType
+        :raises SizeValueError: if places is not usable
+    """
+    if places is not None and \
+       (places < 0 or not isinstance(places, six.integer_types)):
+        raise SizeValueError(
+           places,
+           "places",
+           "must be None or a non-negative integer value"
+        )
+
 def convert_magnitude(left, non_repeating, repeating, places=2):
     """ Convert magnitude to a decimal string.
 
@@ -79,13 +96,7 @@ def convert_magnitude(left, non_repeating, repeating, places=2):
         is too large for the precision of the Decimal operations as
         specified by the context.
     """
-    if places is not None and \
-       (places < 0 or not isinstance(places, six.integer_types)):
-        raise SizeValueError(
-           places,
-           "places",
-           "must be None or a non-negative integer value"
-        )
+    _check_places(places)
 
     places = len(non_repeating) + len(repeating) if places is None else places
 
@@ -126,7 +137,14 @@ def get_string_info(magnitude, places):
     2. -1 if the value is negative, otherwise 1
     3. the string representing the numbers to the left of the radix
     4. the string representing the numbers to the right of the radix
+
+    If places is not None, only the digits that are displayed are
+    computed, so the cost does not depend on the length of the repeating
+    part of the decimal representation. The value is rounded to the
+    nearest, and down on a tie.
     """
+    if places is not None:
+        return _get_bounded_string_info(magnitude, places)
 
     radix_num = get_decimal_info(magnitude)
     (left, right) = convert_magnitude(
@@ -135,6 +153,43 @@ def get_string_info(magnitude, places):
        radix_num.repeating,
        places=places
     )
-    exact = \
-       Fraction(radix_num.sign * Fraction("%s.%s" % (left, right))) == magnitude
-    return (exact, radix_num.sign, left, right)
+    return (
+       is_exact_decimal(magnitude, places),
+       radix_num.sign,
+       left,
+       right
+    )
+
+def _get_bounded_string_info(magnitude, places):
+    """
+    Get information about the string that represents this magnitude
+    using exactly ``places`` digits to the right of the radix.
+
+    :param Fraction magnitude: the magnitude
+    :param int places: the number of places after the decimal pt
+    :returns: a tuple with string information
+    :rtypes: tuple of bool * int * str * str
+
+    The components of the result are the same as for get_string_info().
+    """
+    if isinstance(magnitude, float):
+        raise SizeValueError(
+           magnitude,
+           "magnitude",
+           "must not be a float"
+        )
+    _check_places(places)
+
+    magnitude = Fraction(magnitude)
+    sign = -1 if magnitude < 0 else 1
+
+    scale = 10 ** places
+    (digits, exact) = round_scaled(
+       abs(magnitude.numerator),
+       magnitude.denominator,
+       scale
+    )
+
+    (left, right) = divmod(digits, scale)
+    right = str(right).zfill(places) if places != 0 else ""
+    return (exact, sign, str(left), right)
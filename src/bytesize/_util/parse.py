@@ -0,0 +1,85 @@
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Parsing of human-readable sizes, e.g., "10 GiB" or "1.5MB". """
+
+import string
+
+from fractions import Fraction
+
+from .._constants import ALL_UNITS
+from .._errors import SizeValueError
+
+
+def _build_suffix_tables():
+    """ Build tables mapping every accepted unit suffix to its unit.
+
+        :returns: a table of abbreviations and a table of names
+        :rtype: tuple of dict * dict
+
+        An abbreviation may be written in any case, but the 'B' that
+        follows it, if present, must be upper case, since 'b' is usually
+        taken to mean bits. Names, e.g., "kibibytes", are matched
+        without regard to case.
+    """
+    abbreviations = dict()
+    names = dict()
+    for unit in ALL_UNITS:
+        abbr = unit.abbr
+        for variant in set([abbr, abbr.lower(), abbr.upper()]):
+            abbreviations[variant] = unit
+            abbreviations[variant + "B"] = unit
+        names[unit.prefix + "byte"] = unit
+        names[unit.prefix + "bytes"] = unit
+    return (abbreviations, names)
+
+_ABBREVIATIONS, _NAMES = _build_suffix_tables()
+
+_LETTERS = string.ascii_letters
+
+def parse_size(text):
+    """ Parse a human-readable size into a number and a unit.
+
+        :param str text: the text, e.g., "10 GiB", "1.5MB", "512k"
+        :returns: the number and the unit
+        :rtype: tuple of (int or Fraction) * Unit
+        :raises SizeValueError: if text can not be parsed
+
+        The number may be any string accepted by Fraction, and may be
+        separated from the unit by whitespace. If there is no unit the
+        number is in bytes.
+    """
+    stripped = text.strip()
+    number = stripped.rstrip(_LETTERS)
+    suffix = stripped[len(number):]
+
+    unit = _ABBREVIATIONS.get(suffix)
+    if unit is None:
+        unit = _NAMES.get(suffix.lower())
+        if unit is None:
+            raise SizeValueError(text, "value", "unrecognized unit")
+
+    try:
+        return (int(number), unit)
+    except ValueError:
+        pass
+
+    try:
+        return (Fraction(number), unit)
+    except ValueError:
+        raise SizeValueError(text, "value", "unrecognized number")
@@ -0,0 +1,158 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" A sketch of a stream of values for approximating quantiles. """
+
+import random
+
+
+class QuantileSketch(object):
+    """
+    A KLL sketch, which approximates the quantiles of a stream of values
+    in memory which grows only logarithmically with the number of values.
+
+    The sketch is a stack of compactors. Values are added to the bottom
+    compactor. A compactor that is full is sorted and every other value,
+    starting from a random offset, is promoted to the compactor above,
+    where each value stands for twice as many values as it did below.
+    Compactors higher in the stack are allowed more values, so the error
+    in a rank is dominated by the few compactions at the top.
+
+    Sketches of different streams can be merged, giving a sketch of the
+    concatenation of the streams.
+    """
+
+    __slots__ = ('_compactors', '_k', '_max_size', '_size')
+
+    _SHRINK = 2.0 / 3.0
+    """ Ratio of the capacity of a compactor to that of the one above. """
+
+    def __init__(self, k=200):
+        """
+        Initializer.
+
+        :param int k: capacity of the top compactor, governs accuracy
+        """
+        self._k = k
+        self._compactors = [[]]
+        self._size = 0
+        self._max_size = self._maxSize()
+
+    def __len__(self):
+        return sum((len(c) << h) for (h, c) in enumerate(self._compactors))
+
+    def _capacity(self, level):
+        """
+        Get the capacity of a compactor.
+
+        :param int level: the level of the compactor in the stack
+        :returns: the largest number of values it holds before compacting
+        :rtype: int
+        """
+        depth = len(self._compactors) - level - 1
+        return int(self._k * self._SHRINK ** depth) + 2
+
+    def _maxSize(self):
+        """
+        Get the total capacity of the compactors.
+
+        :returns: the largest number of values held before compacting
+        :rtype: int
+        """
+        return sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def _compress(self):
+        """
+        Compact compactors until the values held fit in the sketch.
+        """
+        while self._size >= self._max_size:
+            for (level, compactor) in enumerate(self._compactors):
+                if len(compactor) >= self._capacity(level):
+                    if level + 1 == len(self._compactors):
+                        self._compactors.append([])
+                        self._max_size = self._maxSize()
+                    compactor.sort()
+                    # Keep the smallest value back if there are an odd
+                    # number, so that the rest can be paired off.
+                    start = len(compactor) % 2
+                    offset = start + random.getrandbits(1)
+                    self._compactors[level + 1].extend(compactor[offset::2])
+                    del compactor[start:]
+                    break
+            self._size = sum(len(c) for c in self._compactors)
+
+    def add(self, value):
+        """
+        Add a value to the sketch.
+
+        :param value: the value, comparable with the other values
+        """
+        self._compactors[0].append(value)
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def merge(self, other):
+        """
+        Add all the values in another sketch to this sketch.
+
+        :param QuantileSketch other: the other sketch, unchanged
+        """
+        # pylint: disable=protected-access
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append([])
+        self._max_size = self._maxSize()
+        for (compactor, values) in zip(self._compactors, other._compactors):
+            compactor.extend(values)
+        self._size = sum(len(c) for c in self._compactors)
+        self._compress()
+
+    def quantiles(self, fractions):
+        """
+        Approximate the quantiles of the values added to the sketch.
+
+        :param fractions: the fractions of the values, each in [0, 1]
+        :type fractions: sequence of a precise numeric type
+        :returns: for each fraction, the least value which is at least
+           that fraction of the values, approximately
+        :rtype: list of value, or None if the sketch is empty
+        """
+        weighted = sorted(
+           (value, 1 << level) for (level, compactor) in \
+              enumerate(self._compactors) for value in compactor
+        )
+        if weighted == []:
+            return [None for _ in fractions]
+
+        total = sum(weight for (_, weight) in weighted)
+        targets = sorted((f * total, i) for (i, f) in enumerate(fractions))
+
+        result = [None for _ in fractions]
+        targets = iter(targets)
+        (target, index) = next(targets, (None, None))
+        rank = 0
+        for (value, weight) in weighted:
+            rank += weight
+            while index is not None and target <= rank:
+                result[index] = value
+                (target, index) = next(targets, (None, None))
+        while index is not None:
+            result[index] = weighted[-1][0]
+            (target, index) = next(targets, (None, None))
+        return result
@@ -0,0 +1,138 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tables for choosing the unit in which to display a magnitude. """
+
+from fractions import Fraction
+
+from .._constants import BINARY_UNITS
+from .._constants import BinaryUnits
+from .._constants import DECIMAL_UNITS
+from .._constants import DecimalUnits
+
+
+class UnitTable(object):
+    """
+    Table for choosing the smallest unit in which a magnitude has an
+    absolute value less than FACTOR * min_value.
+
+    The limits on the magnitude for successive units differ by a factor
+    of at least 1000, so at most one limit lies between consecutive
+    powers of 2. The table records for each positive bit length of the
+    integral part of a magnitude the unit that a magnitude of that bit
+    length must at least have and the limit for that unit. Choosing a
+    unit then costs one comparison. Magnitudes less than one byte are
+    compared with every limit.
+    """
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ('_units', '_limits', '_bounds')
+
+    def __init__(self, binary_units, min_value):
+        """
+        Initializer.
+
+        :param bool binary_units: binary units if True, else SI
+        :param min_value: Lower bound for value
+        :type min_value: A precise numeric type
+        """
+        (units, self._units) = (BinaryUnits, BINARY_UNITS) \
+           if binary_units else (DecimalUnits, DECIMAL_UNITS)
+
+        limits = []
+        for unit in self._units[:-1]:
+            limit = Fraction(min_value) * units.FACTOR * int(unit)
+            limits.append(
+               limit.numerator if limit.denominator == 1 else limit
+            )
+        self._limits = tuple(limits)
+
+        bounds = []
+        index = self._index(0)
+        while index < len(self._limits):
+            bounds.append(index)
+            index = self._index(2 ** len(bounds) // 2)
+        self._bounds = tuple(bounds)
+
+    def _index(self, magnitude):
+        """
+        Find the index of the unit by comparing with every limit.
+
+        :param magnitude: a non-negative magnitude
+        :returns: the index of the unit
+        :rtype: int
+        """
+        return len([l for l in self._limits if l <= magnitude])
+
+    @property
+    def limits(self):
+        """
+        :returns: the limit on the magnitude for each unit but the last
+        :rtype: tuple of int or Fraction
+        """
+        return self._limits
+
+    @property
+    def units(self):
+        """
+        :returns: all the units in the table, smallest first
+        :rtype: tuple of unit
+        """
+        return self._units
+
+    def select(self, magnitude):
+        """
+        Select the index of the unit for magnitude.
+
+        :param magnitude: the magnitude in bytes
+        :type magnitude: int or Fraction
+        :returns: the index of the unit in units
+        :rtype: int
+        """
+        magnitude = abs(magnitude)
+        # Several limits may be less than one byte, so the bound for
+        # bit length 0 does not determine the unit.
+        if magnitude < 1:
+            return self._index(magnitude)
+        length = int(magnitude).bit_length()
+        if length >= len(self._bounds):
+            return len(self._limits)
+        index = self._bounds[length]
+        return index + 1 if magnitude >= self._limits[index] else index
+
+_TABLES = dict()
+_MAX_TABLES = 64
+
+def get_unit_table(binary_units, min_value):
+    """
+    Get a table for choosing units.
+
+    :param bool binary_units: binary units if True, else SI
+    :param min_value: Lower bound for value
+    :type min_value: A precise numeric type
+    :returns: the table for these parameters
+    :rtype: :class:`UnitTable`
+    """
+    key = (binary_units, min_value)
+    table = _TABLES.get(key)
+    if table is None:
+        if len(_TABLES) >= _MAX_TABLES:
+            _TABLES.clear()
+        table = _TABLES[key] = UnitTable(binary_units, min_value)
+    return table
@@ -0,0 +1,119 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Encoding of magnitudes as variable length integers.
+
+    A magnitude is encoded as a record of one or two unsigned LEB128
+    varints, i.e., seven bits to a byte, least significant first, with
+    the high bit set in every byte but the last.
+
+    The first varint is the zigzag encoded numerator, i.e., 2n for
+    n >= 0 and -2n - 1 for n < 0, shifted left one bit. The low bit is
+    set if the magnitude is fractional, in which case the second varint
+    is the denominator. An integral magnitude less than 32 in absolute
+    value takes one byte.
+"""
+
+import six
+
+from .._errors import SizeValueError
+
+FORMAT_VERSION = 1
+""" The version of the encoding, which precedes any encoded Sizes. """
+
+
+if six.PY3:
+    def _byte(view, index):
+        """ Get the byte at index in view as an int. """
+        return view[index]
+else: # pragma: no cover
+    def _byte(view, index):
+        """ Get the byte at index in view as an int. """
+        return ord(view[index])
+
+def write_varint(value, buf):
+    """ Append a non-negative int to buf as a varint.
+
+        :param int value: the value, at least 0
+        :param bytearray buf: the buffer
+    """
+    while value > 0x7f:
+        buf.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+def read_varint(view, offset):
+    """ Read a varint.
+
+        :param memoryview view: the data
+        :param int offset: the offset of the varint
+        :returns: the value and the offset of the byte that follows it
+        :rtype: tuple of int * int
+        :raises SizeValueError: if the data ends within the varint
+    """
+    value = 0
+    shift = 0
+    while True:
+        try:
+            byte = _byte(view, offset)
+        except IndexError:
+            raise SizeValueError(offset, "offset", "data ends in a varint")
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return (value, offset)
+        shift += 7
+
+def write_magnitude(magnitude, buf):
+    """ Append a magnitude to buf as a record.
+
+        :param magnitude: the magnitude
+        :type magnitude: int or Fraction
+        :param bytearray buf: the buffer
+    """
+    if isinstance(magnitude, six.integer_types):
+        (numerator, flag) = (magnitude, 0)
+    else:
+        (numerator, flag) = (magnitude.numerator, 1)
+    zigzag = numerator << 1 if numerator >= 0 else (-numerator << 1) - 1
+    write_varint((zigzag << 1) | flag, buf)
+    if flag:
+        write_varint(magnitude.denominator, buf)
+
+def read_magnitude(view, offset):
+    """ Read a record.
+
+        :param memoryview view: the data
+        :param int offset: the offset of the record
+        :returns: the numerator, the denominator, and the offset of the
+           byte that follows the record
+        :rtype: tuple of int * int * int
+        :raises SizeValueError: if the record is malformed
+
+        The denominator of an integral magnitude is 1.
+    """
+    (first, offset) = read_varint(view, offset)
+    zigzag = first >> 1
+    numerator = zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+    if not first & 1:
+        return (numerator, 1, offset)
+    (denominator, offset) = read_varint(view, offset)
+    if denominator < 2:
+        raise SizeValueError(denominator, "denominator", "must exceed 1")
+    return (numerator, denominator, offset)
@@ -0,0 +1,129 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for aligning Sizes. """
+
+from fractions import Fraction
+
+import unittest
+
+from hypothesis import given
+from hypothesis import strategies
+from hypothesis import Settings
+
+from bytesize import B
+from bytesize import KiB
+from bytesize import MiB
+from bytesize import ROUND_DOWN
+from bytesize import ROUND_UP
+from bytesize import Size
+from bytesize import UNITS
+from bytesize import alignDown
+from bytesize import alignUp
+from bytesize import alignedChunks
+from bytesize import isAligned
+
+from bytesize._errors import SizeValueError
+
+from .utils import SIZE_STRATEGY
+
+ALIGNMENT_STRATEGY = strategies.one_of(
+   strategies.sampled_from(UNITS()),
+   strategies.builds(Size, strategies.integers(min_value=1, max_value=2 ** 30)),
+   strategies.builds(
+      Size,
+      strategies.fractions(min_value=Fraction(1, 2 ** 10), max_value=2 ** 30)
+   )
+)
+
+
+class AlignTestCase(unittest.TestCase):
+    """ Test aligning Sizes. """
+
+    @given(
+       SIZE_STRATEGY,
+       ALIGNMENT_STRATEGY,
+       settings=Settings(max_examples=50)
+    )
+    def testRoundTo(self, size, alignment):
+        """ Test that aligning is the same as rounding. """
+        down = alignDown(size, alignment)
+        up = alignUp(size, alignment)
+        self.assertEqual(down, size.roundTo(alignment, ROUND_DOWN))
+        self.assertEqual(up, size.roundTo(alignment, ROUND_UP))
+        self.assertTrue(isAligned(down, alignment))
+        self.assertTrue(isAligned(up, alignment))
+        self.assertEqual(isAligned(size, alignment), down == size)
+
+    def testExamples(self):
+        """ Test some examples. """
+        self.assertEqual(alignUp(Size(1), Size(512)), Size(512))
+        self.assertEqual(alignDown(Size(-1), Size(512)), Size(-512))
+        self.assertEqual(alignUp(Size(1000), Size(3)), Size(1002))
+        self.assertFalse(isAligned(Size(3, KiB), Size(2, KiB)))
+        self.assertTrue(isAligned(Size(4, KiB), Size(2, KiB)))
+
+    @given(
+       SIZE_STRATEGY,
+       strategies.integers(min_value=0, max_value=50),
+       ALIGNMENT_STRATEGY,
+       settings=Settings(max_examples=30)
+    )
+    def testChunks(self, start, length, alignment):
+        """ Test that chunks cover the range without crossing boundaries. """
+        step = Size(1, alignment)
+        end = start + length * step
+        chunks = list(alignedChunks(start, end, alignment))
+        if length == 0:
+            self.assertEqual(chunks, [])
+            return
+        self.assertEqual(chunks[0][0], start)
+        self.assertEqual(chunks[-1][1], end)
+        for ((_, upper), (lower, _)) in zip(chunks, chunks[1:]):
+            self.assertEqual(upper, lower)
+            self.assertTrue(isAligned(upper, alignment))
+        for (lower, upper) in chunks:
+            self.assertLess(lower, upper)
+            self.assertEqual(
+               alignDown(lower, alignment),
+               alignUp(upper, alignment) - step
+            )
+
+    def testChunkExamples(self):
+        """ Test splitting a range into chunks. """
+        self.assertEqual(
+           list(alignedChunks(Size(512), Size(3, MiB), MiB)),
+           [
+              (Size(512), Size(1, MiB)),
+              (Size(1, MiB), Size(2, MiB)),
+              (Size(2, MiB), Size(3, MiB))
+           ]
+        )
+        self.assertEqual(list(alignedChunks(Size(2), Size(1), B)), [])
+
+    def testExceptions(self):
+        """ Test exceptions. """
+        with self.assertRaises(SizeValueError):
+            alignUp(Size(1), Size(0))
+        with self.assertRaises(SizeValueError):
+            alignDown(Size(1), Size(-1))
+        with self.assertRaises(SizeValueError):
+            isAligned(1, KiB)
+        with self.assertRaises(SizeValueError):
+            alignedChunks(Size(0), 1, KiB)
@@ -0,0 +1,304 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for SizeArray. """
+
+from fractions import Fraction
+
+import unittest
+
+from hypothesis import given
+from hypothesis import strategies
+from hypothesis import Settings
+
+try:
+    import numpy
+except ImportError: # pragma: no cover
+    numpy = None
+
+from bytesize import Size
+from bytesize import KiB
+from bytesize import MiB
+from bytesize import ROUNDING_METHODS
+from bytesize import StrConfig
+from bytesize import UNITS
+
+from bytesize._array import SizeArray
+
+from bytesize._errors import SizeFractionalResultError
+from bytesize._errors import SizeNonsensicalBinOpError
+from bytesize._errors import SizeNonsensicalBinOpValueError
+from bytesize._errors import SizePowerResultError
+from bytesize._errors import SizeValueError
+
+from bytesize._config import SizeConfig
+
+from .utils import NUMBERS_STRATEGY
+from .utils import SIZE_STRATEGY
+
+SIZES_STRATEGY = strategies.lists(
+   strategies.one_of(
+      strategies.builds(
+         Size,
+         strategies.integers(min_value=-2 ** 64, max_value=2 ** 64)
+      ),
+      SIZE_STRATEGY
+   ),
+   max_size=8
+)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class ConstructionTestCase(unittest.TestCase):
+    """ Test constructing SizeArray objects. """
+
+    def testStorage(self):
+        """ Integral sizes in range are stored as int64. """
+        self.assertEqual(SizeArray([1, 2, 3]).magnitudes.dtype, numpy.int64)
+        self.assertEqual(SizeArray([]).magnitudes.dtype, numpy.int64)
+        self.assertEqual(SizeArray([2 ** 63]).magnitudes.dtype, object)
+        self.assertEqual(SizeArray(["0.5"]).magnitudes.dtype, object)
+        self.assertEqual(
+           SizeArray(numpy.arange(4), KiB).tolist(),
+           [Size(i, KiB) for i in range(4)]
+        )
+
+    def testExceptions(self):
+        """ Test exceptions. """
+        with self.assertRaises(SizeValueError):
+            SizeArray([1.2])
+        with self.assertRaises(SizeValueError):
+            SizeArray(SizeArray([1]), KiB)
+
+    def testStrict(self):
+        """ Fractional results are errors when STRICT. """
+        strict = SizeConfig.STRICT
+        SizeConfig.STRICT = True
+        try:
+            with self.assertRaises(SizeFractionalResultError):
+                SizeArray([1]) / 2 # pylint: disable=expression-not-assigned
+        finally:
+            SizeConfig.STRICT = strict
+
+    @given(SIZES_STRATEGY, settings=Settings(max_examples=20))
+    def testElements(self, sizes):
+        """ The elements are the sizes. """
+        array = SizeArray(sizes)
+        self.assertEqual(len(array), len(sizes))
+        self.assertEqual(array.tolist(), sizes)
+        self.assertEqual([array[i] for i in range(len(sizes))], sizes)
+        self.assertEqual(array[1:].tolist(), sizes[1:])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class OperationsTestCase(unittest.TestCase):
+    """ Test that operations agree with those on Size. """
+
+    def testExceptions(self):
+        """ Test that the Size rules are enforced. """
+        array = SizeArray([1, 2])
+        with self.assertRaises(SizePowerResultError):
+            array * Size(1) # pylint: disable=expression-not-assigned
+        with self.assertRaises(SizePowerResultError):
+            array * array # pylint: disable=pointless-statement
+        with self.assertRaises(SizePowerResultError):
+            array ** 2 # pylint: disable=pointless-statement
+        with self.assertRaises(SizeNonsensicalBinOpError):
+            array + 1 # pylint: disable=pointless-statement
+        with self.assertRaises(SizeNonsensicalBinOpError):
+            1 - array # pylint: disable=pointless-statement
+        with self.assertRaises(SizeNonsensicalBinOpError):
+            array < 1 # pylint: disable=pointless-statement
+        with self.assertRaises(SizeNonsensicalBinOpValueError):
+            array / 0 # pylint: disable=pointless-statement
+        with self.assertRaises(SizeNonsensicalBinOpValueError):
+            array // Size(0) # pylint: disable=expression-not-assigned
+        with self.assertRaises(SizeNonsensicalBinOpValueError):
+            array + SizeArray([1]) # pylint: disable=expression-not-assigned
+
+    def testOverflow(self):
+        """ Results too large for int64 are exact. """
+        array = SizeArray([2 ** 62, -(2 ** 62)])
+        self.assertEqual(
+           (array + array).tolist(),
+           [Size(2 ** 63), Size(-(2 ** 63))]
+        )
+        self.assertEqual(
+           (array * 4).tolist(),
+           [Size(2 ** 64), Size(-(2 ** 64))]
+        )
+        self.assertEqual(
+           array.roundTo(Size(3 * 2 ** 61), ROUNDING_METHODS()[-1]).tolist(),
+           [Size(3 * 2 ** 61), Size(0)]
+        )
+
+    @given(SIZES_STRATEGY, SIZE_STRATEGY, settings=Settings(max_examples=20))
+    def testWithSize(self, sizes, other):
+        """ Binary operations with a Size. """
+        array = SizeArray(sizes)
+        self.assertEqual((array + other).tolist(), [s + other for s in sizes])
+        self.assertEqual((array - other).tolist(), [s - other for s in sizes])
+        self.assertEqual(
+           list(array < other),
+           [s < other for s in sizes]
+        )
+        self.assertEqual(
+           list(array == other),
+           [s == other for s in sizes]
+        )
+        if other != Size(0):
+            self.assertEqual(list(array / other), [s / other for s in sizes])
+            self.assertEqual(list(array // other), [s // other for s in sizes])
+            self.assertEqual(
+               (array % other).tolist(),
+               [s % other for s in sizes]
+            )
+
+    @given(SIZES_STRATEGY, settings=Settings(max_examples=20))
+    def testWithSizeArray(self, sizes):
+        """ Binary operations with a SizeArray. """
+        array = SizeArray(sizes)
+        others = list(reversed(sizes))
+        other = SizeArray(others)
+        self.assertEqual(
+           (array + other).tolist(),
+           [s + o for (s, o) in zip(sizes, others)]
+        )
+        self.assertEqual(
+           (array - other).tolist(),
+           [s - o for (s, o) in zip(sizes, others)]
+        )
+        self.assertEqual(
+           list(array >= other),
+           [s >= o for (s, o) in zip(sizes, others)]
+        )
+
+    @given(
+       SIZES_STRATEGY,
+       NUMBERS_STRATEGY.filter(lambda x: x != 0),
+       settings=Settings(max_examples=20)
+    )
+    def testWithNumber(self, sizes, number):
+        """ Binary operations with a number. """
+        array = SizeArray(sizes)
+        self.assertEqual(
+           (array * number).tolist(),
+           [s * number for s in sizes]
+        )
+        self.assertEqual(
+           (number * array).tolist(),
+           [number * s for s in sizes]
+        )
+        self.assertEqual(
+           (array / number).tolist(),
+           [s / number for s in sizes]
+        )
+        self.assertEqual(
+           (array // number).tolist(),
+           [s // number for s in sizes]
+        )
+        self.assertEqual(
+           (array % number).tolist(),
+           [s % number for s in sizes]
+        )
+
+    @given(SIZES_STRATEGY, settings=Settings(max_examples=10))
+    def testUnary(self, sizes):
+        """ Unary operations. """
+        array = SizeArray(sizes)
+        self.assertEqual((-array).tolist(), [-s for s in sizes])
+        self.assertEqual(abs(array).tolist(), [abs(s) for s in sizes])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class NamedTestCase(unittest.TestCase):
+    """ Test that named methods agree with those on Size. """
+
+    @given(
+       SIZES_STRATEGY,
+       strategies.one_of(
+          strategies.sampled_from(UNITS()),
+          strategies.builds(
+             Size,
+             strategies.integers(min_value=0, max_value=2 ** 70)
+          ),
+          SIZE_STRATEGY.filter(lambda x: x.magnitude >= 0)
+       ),
+       strategies.sampled_from(ROUNDING_METHODS()),
+       settings=Settings(max_examples=50)
+    )
+    def testRoundTo(self, sizes, unit, rounding):
+        """ Test roundTo. """
+        self.assertEqual(
+           SizeArray(sizes).roundTo(unit, rounding).tolist(),
+           [s.roundTo(unit, rounding) for s in sizes]
+        )
+
+    def testRoundToLargeFactor(self):
+        """ Test roundTo with int64 magnitudes and a factor near 2 ** 63. """
+        sizes = [Size(2 ** 63 - 2), Size(5), Size(2 ** 62), Size(2 ** 62 - 1)]
+        for factor in (2 ** 63 - 1, 2 ** 62 + 1):
+            for rounding in ROUNDING_METHODS():
+                self.assertEqual(
+                   SizeArray(sizes).roundTo(Size(factor), rounding).tolist(),
+                   [s.roundTo(Size(factor), rounding) for s in sizes]
+                )
+
+    @given(
+       SIZES_STRATEGY,
+       strategies.sampled_from(UNITS()),
+       settings=Settings(max_examples=10)
+    )
+    def testConvertTo(self, sizes, unit):
+        """ Test convertTo. """
+        self.assertEqual(
+           list(SizeArray(sizes).convertTo(unit)),
+           [s.convertTo(unit) for s in sizes]
+        )
+
+    @given(
+       SIZES_STRATEGY,
+       strategies.builds(
+          StrConfig,
+          min_value=strategies.fractions(min_value=0, max_value=1024),
+          binary_units=strategies.booleans(),
+          exact_value=strategies.booleans(),
+          max_places=strategies.integers(min_value=0, max_value=8),
+          unit=strategies.sampled_from(UNITS() + [None])
+       ),
+       settings=Settings(max_examples=50)
+    )
+    def testComponents(self, sizes, config):
+        """ Test components and getStrings. """
+        array = SizeArray(sizes)
+        (values, units) = array.components(config)
+        self.assertEqual(
+           list(zip(values, units)),
+           [s.components(config) for s in sizes]
+        )
+        display = SizeConfig.DISPLAY_CONFIG
+        self.assertEqual(
+           array.getStrings(config, display),
+           [s.getString(config, display) for s in sizes]
+        )
+
+    def testDefaults(self):
+        """ Test that defaults are the current configuration. """
+        array = SizeArray([Fraction(1, 3), 1, 2, Size(1, MiB)])
+        self.assertEqual(array.getStrings(), [str(s) for s in array])
@@ -0,0 +1,109 @@
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for the render cache. """
+
+import unittest
+
+from bytesize import DisplayConfig
+from bytesize import KiB
+from bytesize import Size
+from bytesize import SizeConfig
+from bytesize import StrConfig
+from bytesize import disableRenderCache
+from bytesize import enableRenderCache
+from bytesize import getRenderCacheInfo
+
+from bytesize._errors import SizeValueError
+
+
+class RenderCacheTestCase(unittest.TestCase):
+    """ Test caching of string representations. """
+
+    def setUp(self):
+        self.str_config = SizeConfig.STR_CONFIG
+        enableRenderCache(maxsize=2)
+
+    def tearDown(self):
+        disableRenderCache()
+        SizeConfig.set_str_config(self.str_config)
+
+    def testCounters(self):
+        """
+        Test hits, misses, and evictions.
+        """
+        self.assertEqual(str(Size(1, KiB)), "1.00 KiB")
+        self.assertEqual(str(Size(1024)), "1.00 KiB")
+        str(Size(2))
+        str(Size(3))
+        info = getRenderCacheInfo()
+        self.assertEqual(
+           (info.hits, info.misses, info.evictions, info.currsize),
+           (1, 3, 1, 2)
+        )
+
+    def testLeastRecentlyUsed(self):
+        """
+        Test that the least recently used entry is evicted.
+        """
+        str(Size(1))
+        str(Size(2))
+        str(Size(1))
+        str(Size(3))
+        str(Size(1))
+        self.assertEqual(getRenderCacheInfo().hits, 2)
+
+    def testKeys(self):
+        """
+        Test that equal configurations share entries and others do not.
+        """
+        size = Size(1536)
+        config = StrConfig(max_places=0)
+        display = DisplayConfig(strip=True)
+        self.assertEqual(size.getString(config, display), "@1 KiB")
+        self.assertEqual(
+           size.getString(StrConfig(max_places=0), DisplayConfig(strip=True)),
+           "@1 KiB"
+        )
+        self.assertEqual(size.getString(config, DisplayConfig()), "@1 KiB")
+        self.assertEqual(
+           size.components(config),
+           size.components(StrConfig(max_places=0))
+        )
+        info = getRenderCacheInfo()
+        self.assertEqual((info.hits, info.misses), (2, 3))
+
+    def testInvalidation(self):
+        """
+        Test that setting the global configuration empties the cache.
+        """
+        self.assertEqual(str(Size(1536)), "1.50 KiB")
+        SizeConfig.set_str_config(StrConfig(max_places=0))
+        self.assertEqual(getRenderCacheInfo().currsize, 0)
+        self.assertEqual(str(Size(1536)), "@1 KiB")
+
+    def testDisabled(self):
+        """
+        Test that there is no information when the cache is disabled.
+        """
+        disableRenderCache()
+        self.assertIsNone(getRenderCacheInfo())
+        with self.assertRaises(SizeValueError):
+            enableRenderCache(0)
+        with self.assertRaises(SizeValueError):
+            enableRenderCache(True)
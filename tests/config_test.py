@@ -17,8 +17,13 @@
 # Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
 
 """ Test for configuration classes. """
+import copy
+import pickle
+import threading
 import unittest
 
+from decimal import Decimal
+
 from hypothesis import given
 from hypothesis import strategies
 from hypothesis import Settings
@@ -27,7 +32,9 @@ from bytesize._config import DisplayConfig
 from bytesize._config import InputConfig
 from bytesize._config import SizeConfig
 from bytesize._config import StrConfig
+from bytesize._config import _ThreadLocalVar
 
+from bytesize._constants import BinaryUnits
 from bytesize._constants import RoundingMethods
 from bytesize._constants import UNITS
 
@@ -50,6 +57,80 @@ class ConfigTestCase(unittest.TestCase):
         with self.assertRaises(SizeValueError):
             StrConfig(unit=2)
 
+    def testCopy(self):
+        """ Configuration objects can be copied and pickled. """
+        configs = [
+           StrConfig(max_places=3, min_value=10, binary_units=False),
+           DisplayConfig(strip=True, approx_symbol='~'),
+           InputConfig(method=RoundingMethods.ROUND_UP)
+        ]
+        for config in configs:
+            self.assertFalse(hasattr(config, '__dict__'))
+            self.assertEqual(str(copy.deepcopy(config)), str(config))
+            self.assertEqual(
+               str(pickle.loads(pickle.dumps(config))),
+               str(config)
+            )
+
+class InterningTestCase(unittest.TestCase):
+    """ Test that equal configurations are the same object. """
+
+    def testIdentity(self):
+        """ Equal configurations are identical and hash equally. """
+        self.assertIs(StrConfig(max_places=3), StrConfig(3, 1, True))
+        self.assertIs(DisplayConfig(), DisplayConfig(False, True, '@'))
+        self.assertIs(
+           InputConfig(),
+           InputConfig(method=RoundingMethods.ROUND_DOWN)
+        )
+        self.assertEqual(
+           {StrConfig(): 1, DisplayConfig(): 2}[StrConfig(2, 1)],
+           1
+        )
+        self.assertNotEqual(StrConfig(), StrConfig(binary_units=False))
+        self.assertNotEqual(StrConfig(), DisplayConfig())
+
+    def testTypes(self):
+        """ Values of different types are kept, but compare equal. """
+        config = StrConfig(min_value=Decimal("1.0"))
+        self.assertIsNot(config, StrConfig(min_value=1))
+        self.assertEqual(config, StrConfig(min_value=1))
+        self.assertEqual(hash(config), hash(StrConfig(min_value=1)))
+        self.assertEqual(str(config.min_value), "1.0")
+
+    def testValidation(self):
+        """ Validation is done once for each distinct configuration. """
+        # pylint: disable=protected-access
+        calls = []
+        validate = StrConfig.__dict__['_validate']
+        def counting_validate(cls, *values):
+            """ Count calls to _validate(). """
+            calls.append(None)
+            return validate.__func__(cls, *values)
+        StrConfig._validate = classmethod(counting_validate)
+        try:
+            configs = [
+               StrConfig(max_places=4099, unit=BinaryUnits.KiB)
+               for _ in range(3)
+            ]
+        finally:
+            StrConfig._validate = validate
+        self.assertEqual(len(calls), 1)
+        self.assertIs(configs[0], configs[2])
+
+    def testCopy(self):
+        """ Copies and unpickled configurations are identical. """
+        config = StrConfig(unit=BinaryUnits.MiB)
+        self.assertIs(copy.copy(config), config)
+        self.assertIs(pickle.loads(pickle.dumps(config)), config)
+        config = InputConfig(BinaryUnits.KiB, RoundingMethods.ROUND_UP)
+        self.assertIs(pickle.loads(pickle.dumps(config)), config)
+
+    def testUnhashable(self):
+        """ Unhashable values are rejected. """
+        with self.assertRaises(SizeValueError):
+            StrConfig(max_places=[2])
+
 class InputTestCase(unittest.TestCase):
     """ Exercise methods of input configuration classes. """
     # pylint: disable=too-few-public-methods
@@ -114,3 +195,59 @@ class SizeTestCase(unittest.TestCase):
         """ That that new input config is the correct one. """
         SizeConfig.set_input_config(config)
         self.assertEqual(str(config), str(SizeConfig.INPUT_CONFIG))
+
+class UsingTestCase(unittest.TestCase):
+    """ Test context-local configuration. """
+
+    def setUp(self):
+        self.str_config = SizeConfig.STR_CONFIG
+
+    def tearDown(self):
+        SizeConfig.set_str_config(self.str_config)
+
+    def testNesting(self):
+        """ Configurations are restored on exit, even on an exception. """
+        outer = StrConfig(max_places=0)
+        inner = StrConfig(max_places=1)
+        input_config = InputConfig(method=RoundingMethods.ROUND_UP)
+        with SizeConfig.using(str_config=outer):
+            self.assertIs(SizeConfig.STR_CONFIG, outer)
+            with self.assertRaises(RuntimeError):
+                with SizeConfig.using(inner, input_config=input_config):
+                    self.assertIs(SizeConfig.STR_CONFIG, inner)
+                    self.assertIs(SizeConfig.INPUT_CONFIG, input_config)
+                    raise RuntimeError()
+            self.assertIs(SizeConfig.STR_CONFIG, outer)
+            self.assertIsNot(SizeConfig.INPUT_CONFIG, input_config)
+        self.assertIs(SizeConfig.STR_CONFIG, self.str_config)
+
+    def testGlobal(self):
+        """ A context-local configuration overrides the global one. """
+        config = StrConfig(max_places=0)
+        with SizeConfig.using(str_config=config):
+            SizeConfig.set_str_config(StrConfig(max_places=1))
+            self.assertIs(SizeConfig.STR_CONFIG, config)
+        self.assertEqual(SizeConfig.STR_CONFIG.max_places, 1)
+
+    def testThreads(self):
+        """ A context-local configuration is invisible to other threads. """
+        seen = []
+        thread = threading.Thread(
+           target=lambda: seen.append(SizeConfig.STR_CONFIG)
+        )
+        with SizeConfig.using(str_config=StrConfig(max_places=0)):
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [self.str_config])
+
+    def testThreadLocalVar(self):
+        """ The substitute for ContextVar behaves the same way. """
+        local = _ThreadLocalVar('test', default=None)
+        token = local.set(1)
+        self.assertEqual(local.get(), 1)
+        thread = threading.Thread(target=lambda: local.set(2))
+        thread.start()
+        thread.join()
+        self.assertEqual(local.get(), 1)
+        local.reset(token)
+        self.assertIsNone(local.get())
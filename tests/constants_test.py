@@ -17,13 +17,20 @@
 # Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
 
 """ Test for constants classes. """
+import copy
+import pickle
 import unittest
 
+from bytesize._constants import ALL_UNITS
 from bytesize._constants import B
+from bytesize._constants import BINARY_UNITS
 from bytesize._constants import BinaryUnits
+from bytesize._constants import DECIMAL_UNITS
 from bytesize._constants import DecimalUnits
 from bytesize._constants import RoundingMethods
+from bytesize._constants import UNIT_SET
 from bytesize._constants import UNITS
+from bytesize._constants import UNITS_BY_ABBR
 
 class ConstantsTestCase(unittest.TestCase):
     """ Exercise methods of constants classes. """
@@ -42,3 +49,19 @@ class ConstantsTestCase(unittest.TestCase):
         self.assertTrue(set(DecimalUnits.UNITS()).issubset(set(UNITS())))
         self.assertTrue(set(BinaryUnits.UNITS()).issubset(set(UNITS())))
         self.assertTrue(B in UNITS())
+
+    def testTables(self):
+        """ The precomputed tables agree with the unit classes. """
+        self.assertEqual(list(ALL_UNITS), UNITS())
+        self.assertEqual(BINARY_UNITS, tuple([B] + BinaryUnits.UNITS()))
+        self.assertEqual(DECIMAL_UNITS, tuple([B] + DecimalUnits.UNITS()))
+        self.assertEqual(UNIT_SET, frozenset(UNITS()))
+        for unit in UNITS():
+            self.assertIs(UNITS_BY_ABBR[unit.abbr], unit)
+        self.assertIsNot(UNITS(), UNITS())
+
+    def testCopy(self):
+        """ Copying or unpickling a constant gives back the constant. """
+        for constant in UNITS() + RoundingMethods.METHODS():
+            self.assertIs(copy.deepcopy(constant), constant)
+            self.assertIs(pickle.loads(pickle.dumps(constant)), constant)
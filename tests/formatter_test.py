@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for formatting many Sizes. """
+
+from fractions import Fraction
+
+import unittest
+
+from hypothesis import given
+from hypothesis import strategies
+from hypothesis import Settings
+
+from bytesize import DisplayConfig
+from bytesize import Size
+from bytesize import SizeFormatter
+from bytesize import StrConfig
+from bytesize import UNITS
+from bytesize import formatSizes
+
+from .utils import SIZE_STRATEGY
+
+
+class FormatterTestCase(unittest.TestCase):
+    """ Test formatting Sizes. """
+
+    @given(
+       strategies.lists(SIZE_STRATEGY, max_size=5),
+       strategies.builds(
+          StrConfig,
+          min_value=strategies.fractions(min_value=0, max_value=1024),
+          binary_units=strategies.booleans(),
+          exact_value=strategies.booleans(),
+          max_places=strategies.integers(min_value=0, max_value=8),
+          unit=strategies.sampled_from(UNITS() + [None])
+       ),
+       strategies.builds(
+          DisplayConfig,
+          approx_symbol=strategies.sampled_from(['@', '~']),
+          show_approx_str=strategies.booleans(),
+          strip=strategies.booleans()
+       ),
+       settings=Settings(max_examples=100)
+    )
+    def testAgreement(self, sizes, config, display):
+        """ Results are the same as for Size.getString. """
+        self.assertEqual(
+           list(formatSizes(sizes, config, display)),
+           [s.getString(config, display) for s in sizes]
+        )
+
+    def testUnlimitedPlaces(self):
+        """ Results agree when all places are shown. """
+        config = StrConfig(max_places=None)
+        display = DisplayConfig(strip=True)
+        formatter = SizeFormatter(config, display)
+        for size in (Size(0x10001), Size(-3), Size(Fraction(1, 3))):
+            self.assertEqual(
+               formatter.format(size),
+               size.getString(config, display)
+            )
+
+    def testDefaults(self):
+        """ The current configuration is the default. """
+        sizes = [Size(0), Size(1024), Size(Fraction(-5, 3))]
+        self.assertEqual(list(formatSizes(sizes)), [str(s) for s in sizes])
@@ -0,0 +1,139 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for histograms of Sizes. """
+
+import json
+import pickle
+import unittest
+
+from hypothesis import given
+from hypothesis import strategies
+from hypothesis import Settings
+
+from bytesize import B
+from bytesize import KiB
+from bytesize import MB
+from bytesize import Size
+from bytesize import SizeConfig
+from bytesize import SizeHistogram
+from bytesize import StrConfig
+
+from bytesize._constants import BinaryUnits
+from bytesize._constants import DecimalUnits
+
+from bytesize._errors import SizeValueError
+
+from .utils import SIZE_STRATEGY
+
+
+class HistogramTestCase(unittest.TestCase):
+    """ Test histograms of Sizes. """
+
+    @given(
+       strategies.lists(SIZE_STRATEGY, max_size=20),
+       strategies.booleans(),
+       strategies.integers(min_value=1, max_value=4),
+       settings=Settings(max_examples=30)
+    )
+    def testBuckets(self, sizes, binary_units, significant):
+        """ Test that every size is counted in a bucket that holds it. """
+        histogram = SizeHistogram(sizes, binary_units, significant)
+        buckets = histogram.buckets()
+        self.assertEqual(histogram.count, len(sizes))
+        self.assertEqual(sum(c for (_, _, c) in buckets), len(sizes))
+        for size in sizes:
+            value = Size(int(size))
+            self.assertTrue(any(
+               (lower <= value < upper) if upper > Size(0) else \
+                  (lower < value <= upper)
+               for (lower, upper, _) in buckets
+            ))
+
+    def testUnitBounds(self):
+        """ Test that units are bucket bounds with one significant digit. """
+        units = [(True, BinaryUnits.UNITS()), (False, DecimalUnits.UNITS())]
+        for (binary_units, unit_list) in units:
+            histogram = SizeHistogram(
+               (Size(1, u) for u in unit_list),
+               binary_units
+            )
+            self.assertEqual(
+               [lower for (lower, _, _) in histogram.buckets()],
+               [Size(1, u) for u in unit_list]
+            )
+
+    @given(
+       strategies.lists(SIZE_STRATEGY, max_size=20),
+       strategies.lists(SIZE_STRATEGY, max_size=20),
+       settings=Settings(max_examples=20)
+    )
+    def testMerge(self, sizes1, sizes2):
+        """ Test that merging is the same as adding all the sizes. """
+        histogram = SizeHistogram(sizes1)
+        histogram.merge(pickle.loads(pickle.dumps(SizeHistogram(sizes2))))
+        self.assertEqual(
+           histogram.asDict(),
+           SizeHistogram(sizes1 + sizes2).asDict()
+        )
+        with self.assertRaises(SizeValueError):
+            histogram.merge(SizeHistogram(binary_units=False))
+
+    def testDict(self):
+        """ Test conversion to and from JSON. """
+        histogram = SizeHistogram(
+           [Size(3, KiB), Size(-7), Size(0), Size(2, MB)],
+           binary_units=False,
+           significant=2
+        )
+        values = json.loads(json.dumps(histogram.asDict()))
+        self.assertEqual(
+           SizeHistogram.fromDict(values).asDict(),
+           histogram.asDict()
+        )
+        with self.assertRaises(SizeValueError):
+            SizeHistogram.fromDict({'counts' : []})
+
+    def testLabels(self):
+        """ Test that labels are formatted as by getString. """
+        histogram = SizeHistogram([Size(1536), Size(1, KiB), Size(5, B)])
+        config = StrConfig(max_places=0)
+        display = SizeConfig.DISPLAY_CONFIG
+        self.assertEqual(
+           histogram.labels(config),
+           [
+              (
+                 "%s - %s" % \
+                    (lower.getString(config, display),
+                     upper.getString(config, display)),
+                 count
+              ) for (lower, upper, count) in histogram.buckets()
+           ]
+        )
+        self.assertEqual(
+           [count for (_, count) in histogram.labels()],
+           [1, 2]
+        )
+
+    def testExceptions(self):
+        """ Test exceptions. """
+        with self.assertRaises(SizeValueError):
+            SizeHistogram(significant=0)
+        with self.assertRaises(SizeValueError):
+            SizeHistogram([1])
@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for importing the bytesize package. """
+
+import ast
+import os
+import subprocess
+import sys
+import unittest
+
+import bytesize
+
+
+class ImportTestCase(unittest.TestCase):
+    """ Test that the public interface is imported on demand. """
+
+    @unittest.skipIf(sys.version_info < (3, 7), "requires module __getattr__")
+    def testLazy(self):
+        """ Test that submodules are not imported until they are used. """
+        statement = "; ".join([
+           "import sys",
+           "import bytesize",
+           "assert 'bytesize._size' not in sys.modules",
+           "from bytesize import Size",
+           "assert 'bytesize._size' in sys.modules",
+           "assert 'numpy' not in sys.modules",
+           "assert 'bytesize._array' not in sys.modules"
+        ])
+        environment = dict(os.environ)
+        environment['PYTHONPATH'] = os.pathsep.join(sys.path)
+        subprocess.check_call(
+           [sys.executable, "-c", statement],
+           env=environment
+        )
+
+    def testNames(self):
+        """ Test that every public name can be got. """
+        for name in bytesize.__all__:
+            self.assertIsNotNone(getattr(bytesize, name))
+            self.assertIn(name, dir(bytesize))
+        self.assertIs(bytesize.KiB, bytesize.UNITS()[1])
+        with self.assertRaises(AttributeError):
+            getattr(bytesize, "NOT_A_NAME")
+
+    def testStatic(self):
+        """ Test that the imports for static checkers match the exports. """
+        # pylint: disable=protected-access
+        with open(bytesize.__file__) as source:
+            tree = ast.parse(source.read())
+        (block,) = [
+           node for node in tree.body if isinstance(node, ast.If) and \
+              getattr(node.test, 'id', None) == '_STATIC'
+        ]
+        names = dict()
+        for node in block.body:
+            if isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    names[alias.name] = (node.module, alias.name)
+            else:
+                (target,) = node.targets
+                (module, _) = names[node.value.value.id]
+                names[target.id] = \
+                   (module, "%s.%s" % (node.value.value.id, node.value.attr))
+        for (name, (module, path)) in bytesize._EXPORTS.items():
+            self.assertEqual(names.get(name), (module, path))
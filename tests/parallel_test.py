@@ -0,0 +1,148 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for converting Sizes in a pool of processes. """
+
+from fractions import Fraction
+
+import unittest
+
+try:
+    import numpy
+except ImportError: # pragma: no cover
+    numpy = None
+
+from bytesize import DisplayConfig
+from bytesize import GiB
+from bytesize import InputConfig
+from bytesize import KiB
+from bytesize import MiB
+from bytesize import ROUND_DOWN
+from bytesize import ROUND_UP
+from bytesize import Size
+from bytesize import SizeConfig
+from bytesize import StrConfig
+from bytesize import formatSizes
+from bytesize import getSizesFromInput
+from bytesize import parallelFormatSizes
+from bytesize import parallelGetSizesFromInput
+from bytesize import parallelRoundSizes
+from bytesize import roundSizes
+
+from bytesize._errors import SizeFractionalResultError
+from bytesize._errors import SizeValueError
+
+from bytesize._parallel import _parse_chunk
+
+SIZES = [Size(n * 997, KiB) for n in range(-50, 50)] + \
+   [Size(Fraction(1, 3)), Size(2 ** 70), Size(1, GiB)]
+
+
+class ParallelTestCase(unittest.TestCase):
+    """ Test that parallel conversion matches serial conversion. """
+
+    def testFormat(self):
+        """
+        Test formatting, with the caller's configuration.
+        """
+        config = StrConfig(max_places=0, binary_units=False)
+        display = DisplayConfig(show_approx_str=False)
+        self.assertEqual(
+           list(parallelFormatSizes(SIZES, config, display, 2, 7)),
+           list(formatSizes(SIZES, config, display))
+        )
+
+        str_config = SizeConfig.STR_CONFIG
+        SizeConfig.set_str_config(config)
+        try:
+            self.assertEqual(
+               list(parallelFormatSizes(iter(SIZES), chunksize=10)),
+               [str(s) for s in SIZES]
+            )
+        finally:
+            SizeConfig.set_str_config(str_config)
+
+    def testRound(self):
+        """
+        Test rounding.
+        """
+        self.assertEqual(
+           list(parallelRoundSizes(SIZES, MiB, ROUND_UP, 2, 7)),
+           list(roundSizes(SIZES, MiB, ROUND_UP))
+        )
+        self.assertEqual(list(parallelRoundSizes([], MiB, ROUND_UP)), [])
+
+    def testParse(self):
+        """
+        Test parsing, with the caller's configuration.
+        """
+        values = ["%d KiB" % n for n in range(100)] + [12345, "1.5 GiB"]
+        config = InputConfig(MiB, ROUND_DOWN)
+        self.assertEqual(
+           list(parallelGetSizesFromInput(values, config=config, chunksize=9)),
+           list(getSizesFromInput(values, config=config))
+        )
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def testArray(self):
+        """
+        Test that a SizeArray is split into chunks.
+        """
+        from bytesize import SizeArray
+        array = SizeArray(SIZES)
+        self.assertEqual(
+           list(parallelRoundSizes(array, KiB, ROUND_DOWN, 2, 7)),
+           list(roundSizes(SIZES, KiB, ROUND_DOWN))
+        )
+
+    def testStrict(self):
+        """
+        Test that the caller's value of STRICT is used by the workers.
+        """
+        config = InputConfig(KiB, ROUND_DOWN)
+        strict = SizeConfig.STRICT
+        try:
+            self.assertEqual(_parse_chunk(["0.5"], False, None, config), [0])
+            with self.assertRaises(SizeFractionalResultError):
+                _parse_chunk(["0.5"], True, None, config)
+
+            SizeConfig.STRICT = True
+            with self.assertRaises(SizeFractionalResultError):
+                list(parallelGetSizesFromInput(["0.5"], max_workers=1))
+        finally:
+            SizeConfig.STRICT = strict
+
+    def testExceptions(self):
+        """
+        Test that bad arguments raise exceptions before any work is done.
+        """
+        with self.assertRaises(SizeValueError):
+            parallelRoundSizes(SIZES, MiB, None)
+        with self.assertRaises(SizeValueError):
+            parallelFormatSizes(SIZES, chunksize=0)
+        with self.assertRaises(SizeValueError):
+            parallelFormatSizes(SIZES, max_workers=0)
+        with self.assertRaises(SizeValueError):
+            parallelFormatSizes(SIZES, chunksize=True)
+        with self.assertRaises(SizeValueError):
+            parallelFormatSizes(SIZES, max_workers=True)
+        with self.assertRaises(SizeValueError):
+            list(parallelFormatSizes([Size(0), 0], max_workers=1))
+        with self.assertRaises(SizeValueError):
+            list(parallelGetSizesFromInput(["12 bogus"], max_workers=1))
@@ -0,0 +1,164 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for profiling operations on Sizes. """
+
+import threading
+import unittest
+
+from bytesize import KiB
+from bytesize import MiB
+from bytesize import ROUND_UP
+from bytesize import Size
+from bytesize import disableProfiling
+from bytesize import enableProfiling
+from bytesize import getProfile
+from bytesize import profiling
+from bytesize import resetProfile
+
+from bytesize import _size
+
+
+class ProfileTestCase(unittest.TestCase):
+    """ Test counting and timing operations. """
+
+    def setUp(self):
+        resetProfile()
+
+    def tearDown(self):
+        disableProfiling()
+        resetProfile()
+
+    def testCounts(self):
+        """ Test that calls are counted while profiling is enabled. """
+        # pylint: disable=expression-not-assigned,pointless-statement
+        size = Size(1, KiB)
+        enableProfiling()
+        enableProfiling()
+        size + size
+        size.roundTo(MiB, ROUND_UP)
+        str(size)
+        disableProfiling()
+        size + size
+        profile = getProfile()
+        self.assertEqual(profile["Size.__add__"].calls, 1)
+        self.assertEqual(profile["Size.roundTo"].calls, 1)
+        self.assertEqual(profile["Size.getString"].calls, 1)
+        self.assertEqual(profile["_util.misc.get_string_info"].calls, 1)
+        self.assertGreaterEqual(profile["Size.roundTo"].seconds, 0)
+        self.assertNotIn("Size.__init__", profile)
+
+    def testRestored(self):
+        """ Test that disabling restores the original functions. """
+        (add, get_string_info) = (Size.__add__, _size.get_string_info)
+        enableProfiling()
+        self.assertIsNot(Size.__add__, add)
+        self.assertIsNot(_size.get_string_info, get_string_info)
+        disableProfiling()
+        self.assertIs(Size.__add__, add)
+        self.assertIs(_size.get_string_info, get_string_info)
+
+    def testContext(self):
+        """ Test that the context manager profiles only its block. """
+        # pylint: disable=expression-not-assigned
+        enableProfiling()
+        Size(1) + Size(2)
+        with profiling() as profile:
+            Size(1) + Size(2)
+            Size(3) - Size(2)
+        self.assertEqual(profile["Size.__add__"].calls, 1)
+        self.assertEqual(profile["Size.__sub__"].calls, 1)
+        self.assertEqual(profile["Size.__init__"].calls, 4)
+        self.assertEqual(getProfile()["Size.__add__"].calls, 2)
+
+    def testContextEnables(self):
+        """ Test that the context manager enables profiling for its block. """
+        # pylint: disable=expression-not-assigned
+        add = Size.__add__
+        with profiling() as profile:
+            Size(1) + Size(2)
+        self.assertIs(Size.__add__, add)
+        self.assertEqual(profile["Size.__add__"].calls, 1)
+        self.assertEqual(getProfile()["Size.__add__"].calls, 1)
+        resetProfile()
+        self.assertEqual(getProfile(), dict())
+
+    def testOverlappingBlocks(self):
+        """
+        Test that blocks in different threads count only their own
+        operations, and that profiling stays enabled until both end.
+        """
+        # pylint: disable=expression-not-assigned
+        add = Size.__add__
+        (a_entered, a_exited) = (threading.Event(), threading.Event())
+        profiles = dict()
+
+        def run_a():
+            """ Enter before B, and exit while B is in its block. """
+            with profiling() as profile:
+                a_entered.set()
+                Size(1) + Size(2)
+                b_entered.wait()
+            profiles['a'] = profile
+            a_exited.set()
+
+        def run_b():
+            """ Enter after A, and add only after A has exited. """
+            a_entered.wait()
+            with profiling() as profile:
+                b_entered.set()
+                a_exited.wait()
+                Size(1) + Size(2)
+                Size(3) + Size(4)
+            profiles['b'] = profile
+
+        b_entered = threading.Event()
+        threads = [threading.Thread(target=f) for f in (run_a, run_b)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(profiles['a']["Size.__add__"].calls, 1)
+        self.assertEqual(profiles['b']["Size.__add__"].calls, 2)
+        self.assertEqual(getProfile()["Size.__add__"].calls, 3)
+        self.assertIs(Size.__add__, add)
+
+    def testConcurrentEnable(self):
+        """
+        Test that enabling in many threads at once wraps each operation
+        once, and that no counts are lost.
+        """
+        # pylint: disable=expression-not-assigned
+        start = threading.Event()
+
+        def run():
+            """ Enable profiling, then add many times. """
+            start.wait()
+            enableProfiling()
+            for _ in range(1000):
+                Size(1) + Size(2)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(getProfile()["Size.__add__"].calls, 8000)
@@ -0,0 +1,112 @@
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for reading Sizes from columns of text. """
+
+import unittest
+
+from six import StringIO
+
+from bytesize import B
+from bytesize import InputConfig
+from bytesize import KiB
+from bytesize import MiB
+from bytesize import ROUND_UP
+from bytesize import Size
+from bytesize import readSizes
+from bytesize import totalSizes
+
+from bytesize._errors import SizeValueError
+
+
+DU = """4\t./a
+1024\t./b
+
+12\t./c
+"""
+
+INVENTORY = """disk,sda,10 GiB
+disk,sdb,512 MiB
+part,sda1,1.5KiB
+"""
+
+class ReadSizesTestCase(unittest.TestCase):
+    """ Test reading Sizes from columns. """
+
+    def testDu(self):
+        """
+        Test reading du output, where values have no units.
+        """
+        sizes = list(readSizes(StringIO(DU), units=KiB))
+        self.assertEqual(sizes, [Size(4, KiB), Size(1, MiB), Size(12, KiB)])
+
+    def testColumn(self):
+        """
+        Test reading a column of values with units.
+        """
+        sizes = readSizes(INVENTORY.splitlines(), column=-1, separator=",")
+        self.assertEqual(
+           list(sizes),
+           [Size(10 * 1024, MiB), Size(512, MiB), Size(1536)]
+        )
+
+    def testRounding(self):
+        """
+        Test that the input configuration is used.
+        """
+        config = InputConfig(MiB, ROUND_UP)
+        sizes = list(readSizes(["1KiB", "1MiB"], config=config))
+        self.assertEqual(sizes, [Size(1, MiB), Size(1, MiB)])
+
+    def testGenerator(self):
+        """
+        Test that lines are consumed only as needed.
+        """
+        def lines():
+            """ Generate lines, the last one bad. """
+            yield "1KiB"
+            raise AssertionError()
+        self.assertEqual(next(readSizes(lines())), Size(1, KiB))
+
+    def testExceptions(self):
+        """
+        Test that bad values raise an exception.
+        """
+        with self.assertRaises(SizeValueError):
+            list(readSizes(["1KiB", "oneKiB"]))
+        with self.assertRaises(IndexError):
+            list(readSizes(["1KiB"], column=3))
+
+class TotalSizesTestCase(unittest.TestCase):
+    """ Test totals of Sizes in columns. """
+
+    def testTotal(self):
+        """
+        Test that the total is the sum of the Sizes.
+        """
+        self.assertEqual(
+           totalSizes(StringIO(DU), units=KiB),
+           sum(readSizes(StringIO(DU), units=KiB), Size(0))
+        )
+        self.assertEqual(totalSizes(StringIO(DU), units=B), Size(1040))
+
+    def testEmpty(self):
+        """
+        Test that the total of no Sizes is 0.
+        """
+        self.assertEqual(totalSizes([]), Size(0))
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for encoding Sizes as bytes. """
+
+from fractions import Fraction
+
+import mmap
+import unittest
+
+try:
+    import numpy
+except ImportError: # pragma: no cover
+    numpy = None
+
+from hypothesis import given
+from hypothesis import strategies
+from hypothesis import Settings
+
+from bytesize import GiB
+from bytesize import Size
+from bytesize import decodeSizes
+from bytesize import encodeSizes
+
+from bytesize._errors import SizeValueError
+
+from .utils import SIZE_STRATEGY
+
+
+class SizeBytesTestCase(unittest.TestCase):
+    """ Test encoding a single Size. """
+
+    @given(SIZE_STRATEGY, settings=Settings(max_examples=100))
+    def testRoundTrip(self, s):
+        """
+        Test that decoding the encoding of a size yields the size.
+        """
+        self.assertEqual(Size.fromBytes(s.toBytes()), s)
+        self.assertEqual(Size.fromBytes(bytearray(s.toBytes())), s)
+
+    def testLength(self):
+        """
+        Test the lengths of some encodings.
+        """
+        self.assertEqual(Size(0).toBytes(), b"\x01\x00")
+        self.assertEqual(len(Size(31).toBytes()), 2)
+        self.assertEqual(len(Size(-32).toBytes()), 2)
+        self.assertEqual(len(Size(32).toBytes()), 3)
+        self.assertEqual(len(Size(1, GiB).toBytes()), 6)
+        self.assertEqual(Size(Fraction(1, 3)).toBytes(), b"\x01\x05\x03")
+
+    def testExceptions(self):
+        """
+        Test that malformed data raises an exception.
+        """
+        for data in (b"", b"\x02\x00", b"\x01", b"\x01\x80", b"\x01\x00\x00"):
+            with self.assertRaises(SizeValueError):
+                Size.fromBytes(data)
+        # a fractional record with denominator 1
+        with self.assertRaises(SizeValueError):
+            Size.fromBytes(b"\x01\x05\x01")
+
+
+class SizesBytesTestCase(unittest.TestCase):
+    """ Test encoding many Sizes. """
+
+    @given(strategies.lists(SIZE_STRATEGY), settings=Settings(max_examples=50))
+    def testRoundTrip(self, sizes):
+        """
+        Test that decoding the encoding of sizes yields the sizes.
+        """
+        self.assertEqual(list(decodeSizes(encodeSizes(sizes))), sizes)
+        self.assertEqual(
+           list(decodeSizes(encodeSizes(s for s in sizes))),
+           sizes
+        )
+
+    def testMemoryMapped(self):
+        """
+        Test decoding from a memory map.
+        """
+        sizes = [Size(n) for n in range(1000)] + [Size(Fraction(1, 3))]
+        data = encodeSizes(sizes)
+        region = mmap.mmap(-1, len(data))
+        try:
+            region.write(data)
+            self.assertEqual(list(decodeSizes(region)), sizes)
+        finally:
+            region.close()
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def testArray(self):
+        """
+        Test that a SizeArray is encoded like a list of its Sizes.
+        """
+        from bytesize import SizeArray
+        sizes = [Size(n * 1024 ** 3) for n in range(-3, 4)]
+        for values in (sizes, sizes + [Size(Fraction(1, 3))]):
+            array = SizeArray(values)
+            self.assertEqual(encodeSizes(array), encodeSizes(values))
+            self.assertEqual(list(decodeSizes(encodeSizes(array))), values)
+
+    def testExceptions(self):
+        """
+        Test that bad arguments and malformed data raise exceptions.
+        """
+        with self.assertRaises(SizeValueError):
+            encodeSizes([Size(0), 0])
+        for data in (b"", b"XSZ\x01\x00", b"BSZ", b"BSZ\x02\x00", b"BSZ\x01"):
+            with self.assertRaises(SizeValueError):
+                decodeSizes(data)
+        for data in (b"BSZ\x01\x02\x00", b"BSZ\x01\x01\x00\x00"):
+            with self.assertRaises(SizeValueError):
+                list(decodeSizes(data))
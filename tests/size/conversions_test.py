@@ -89,9 +89,7 @@ class ConversionTestCase(unittest.TestCase):
         self.assertEqual(int(match.group('val')), int(s))
 
     def testDeepCopy(self):
-        """ Test that deepcopy is different but equal. """
+        """ Test that deepcopy of an immutable Size is the Size itself. """
         s1 = Size(0)
-        s2 = copy.deepcopy(s1)
-        self.assertEqual(s1, s2)
-        s1._magnitude += 1
-        self.assertNotEqual(s1, s2)
+        self.assertIs(copy.deepcopy(s1), s1)
+        self.assertIs(copy.copy(s1), s1)
@@ -26,6 +26,7 @@ import unittest
 
 from hypothesis import given
 from hypothesis import Settings
+from hypothesis import strategies
 
 from bytesize import Size
 from bytesize import B
@@ -137,6 +138,31 @@ class AdditionTestCase(unittest.TestCase):
         """ Test addition. """
         self.assertEqual(s1 + s2, Size(s1.magnitude + s2.magnitude))
 
+class SumTestCase(unittest.TestCase):
+    """ Test Size.sum. """
+
+    def testExceptions(self):
+        """ Any non-size element raises an exception. """
+        with self.assertRaises(SizeNonsensicalBinOpError):
+            Size.sum([Size(0), 2])
+
+    def testEmpty(self):
+        """ The total of no sizes is 0. """
+        self.assertEqual(Size.sum([]), Size(0))
+        self.assertEqual(Size.sum(iter([])), Size(0))
+
+    @given(
+       strategies.lists(SIZE_STRATEGY),
+       settings=Settings(max_examples=20)
+    )
+    def testSum(self, sizes):
+        """ Test that Size.sum is the same as sum. """
+        self.assertEqual(Size.sum(sizes), sum(sizes, Size(0)))
+        self.assertEqual(
+           Size.sum(s for s in sizes),
+           sum(sizes, Size(0))
+        )
+
 
 class DivmodTestCase(unittest.TestCase):
     """ Test divmod. """
@@ -18,6 +18,8 @@
 
 """ Tests for behavior of Size objects. """
 
+import copy
+import pickle
 import unittest
 
 from decimal import Decimal
@@ -74,6 +76,54 @@ class ConstructionTestCase(unittest.TestCase):
            Size(Fraction(1, 2), MiB)
         )
 
+    def testMagnitude(self):
+        """ Test that magnitude is a Fraction whether integral or not. """
+        half = Size(1) / 2
+        self.assertIsInstance(Size(1024).magnitude, Fraction)
+        self.assertIsInstance(half.magnitude, Fraction)
+        self.assertEqual(half.magnitude, Fraction(1, 2))
+        self.assertEqual(half + half, Size(1))
+        self.assertEqual(hash(half + half), hash(Size(1)))
+        self.assertEqual(hash(half * 4), hash(Size(Fraction(4, 2))))
+
+class CopyTestCase(unittest.TestCase):
+    """ Test copying and pickling Size objects. """
+
+    def testCopy(self):
+        """ Copies and unpickled Sizes are equal to the original. """
+        for s in (Size(0), Size(-12, MiB), Size(Fraction(1, 3), KiB)):
+            self.assertEqual(copy.deepcopy(s), s)
+            self.assertEqual(copy.copy(s), s)
+            self.assertEqual(pickle.loads(pickle.dumps(s)), s)
+            self.assertEqual(
+               hash(pickle.loads(pickle.dumps(s))),
+               hash(s)
+            )
+
+    def testPickleSize(self):
+        """ Pickles hold just the numerator and denominator. """
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertLess(len(pickle.dumps(Size(0), protocol)), 60)
+            s = pickle.loads(pickle.dumps(Size(Fraction(1, 3)), protocol))
+            self.assertEqual(s.magnitude, Fraction(1, 3))
+            s = pickle.loads(pickle.dumps(Size(1, MiB), protocol))
+            self.assertIsInstance(s._magnitude, int)
+
+    def testPickleStrict(self):
+        """ Fractional Sizes unpickle even when STRICT. """
+        third = Size(Fraction(1, 3))
+        data = pickle.dumps(third)
+        strict = SizeConfig.STRICT
+        SizeConfig.STRICT = True
+        try:
+            self.assertEqual(pickle.loads(data), third)
+        finally:
+            SizeConfig.STRICT = strict
+
+    def testNoDict(self):
+        """ Size objects have no per-instance dict. """
+        self.assertFalse(hasattr(Size(0), '__dict__'))
+
 class DisplayTestCase(unittest.TestCase):
     """ Test formatting Size for display. """
 
@@ -285,3 +335,6 @@ class ComputationTestCase(unittest.TestCase):
         SizeConfig.STRICT = True
         with self.assertRaises(SizeFractionalResultError):
             Size(Fraction(1, 2))
+        with self.assertRaises(SizeFractionalResultError):
+            Size(1) / 2 # pylint: disable=expression-not-assigned
+        self.assertEqual(Size(2) / 2, Size(1))
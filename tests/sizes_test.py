@@ -22,15 +22,30 @@ from fractions import Fraction
 import unittest
 
 from hypothesis import given
+from hypothesis import strategies
 from hypothesis import Settings
 
 from bytesize import getSizeFromInput
+from bytesize import getSizesFromInput
+from bytesize import roundSizes
 from bytesize import B
+from bytesize import GiB
 from bytesize import InputConfig
+from bytesize import KB
+from bytesize import KiB
+from bytesize import MB
+from bytesize import MiB
 from bytesize import ROUND_DOWN
+from bytesize import ROUND_UP
+from bytesize import ROUNDING_METHODS
+from bytesize import Size
 from bytesize import SizeConfig
+from bytesize import UNITS
+
+from bytesize._errors import SizeValueError
 
 from .utils import NUMBERS_STRATEGY
+from .utils import SIZE_STRATEGY
 
 
 class GetSizeFromInputTestCase(unittest.TestCase):
@@ -53,3 +68,130 @@ class GetSizeFromInputTestCase(unittest.TestCase):
         res = getSizeFromInput(n)
         self.assertLessEqual(res.magnitude, Fraction(n))
         self.assertEqual(Fraction(res.magnitude).denominator, 1)
+
+class ParseTestCase(unittest.TestCase):
+    """
+    Test getting size from human-readable input.
+    """
+
+    def setUp(self):
+        self._input_config = SizeConfig.INPUT_CONFIG
+        SizeConfig.set_input_config(InputConfig(B, ROUND_DOWN))
+
+    def tearDown(self):
+        SizeConfig.set_input_config(self._input_config)
+
+    def testExamples(self):
+        """
+        Test some typical inputs.
+        """
+        self.assertEqual(getSizeFromInput("10 GiB"), Size(10, GiB))
+        self.assertEqual(getSizeFromInput("1.5MB"), Size(Fraction(3, 2), MB))
+        self.assertEqual(getSizeFromInput("512k"), Size(512, KB))
+        self.assertEqual(getSizeFromInput("512K"), Size(512, KB))
+        self.assertEqual(getSizeFromInput("  4 kiB "), Size(4, KiB))
+        self.assertEqual(getSizeFromInput("3 Mebibytes"), Size(3, MiB))
+        self.assertEqual(getSizeFromInput("1 byte"), Size(1))
+        self.assertEqual(getSizeFromInput("12B"), Size(12))
+        self.assertEqual(getSizeFromInput("-1/2 KiB"), Size(-512))
+
+    @given(
+       NUMBERS_STRATEGY,
+       strategies.sampled_from(UNITS()),
+       strategies.sampled_from(["", " ", "  "]),
+       settings=Settings(max_examples=30)
+    )
+    def testUnits(self, n, unit, space):
+        """
+        Test that every abbreviation and prefix is understood.
+        """
+        expected = getSizeFromInput(n, unit)
+        for suffix in (unit.abbr, str(unit), unit.prefix + "bytes"):
+            value = getSizeFromInput("%s%s%s" % (n, space, suffix))
+            self.assertEqual(value, expected)
+
+    def testRounding(self):
+        """
+        Test that input configuration is used.
+        """
+        config = InputConfig(KiB, ROUND_UP)
+        value = getSizeFromInput("1.5 KB", config=config)
+        self.assertEqual(value, Size(2, KiB))
+
+    def testExceptions(self):
+        """
+        Test that bad input raises an exception.
+        """
+        for text in ["", "GiB", "10 Gb", "10 gibibits", "1.2.3 KiB", "nan"]:
+            with self.assertRaises(SizeValueError):
+                getSizeFromInput(text)
+
+class BatchTestCase(unittest.TestCase):
+    """
+    Test rounding and reading many sizes at once.
+    """
+
+    @given(
+       strategies.lists(SIZE_STRATEGY, max_size=10),
+       strategies.one_of(
+          strategies.sampled_from(UNITS()),
+          strategies.builds(
+             Size,
+             strategies.fractions(min_value=0, max_value=2 ** 40)
+          )
+       ),
+       strategies.sampled_from(ROUNDING_METHODS()),
+       settings=Settings(max_examples=50)
+    )
+    def testRoundSizes(self, sizes, unit, rounding):
+        """
+        Test that roundSizes is the same as roundTo for every size.
+        """
+        self.assertEqual(
+           list(roundSizes(sizes, unit, rounding)),
+           [s.roundTo(unit, rounding) for s in sizes]
+        )
+
+    @given(
+       strategies.lists(NUMBERS_STRATEGY, max_size=10),
+       strategies.sampled_from(UNITS()),
+       strategies.builds(
+          InputConfig,
+          strategies.sampled_from(UNITS()),
+          strategies.sampled_from(ROUNDING_METHODS())
+       ),
+       settings=Settings(max_examples=20)
+    )
+    def testGetSizesFromInput(self, values, units, config):
+        """
+        Test that getSizesFromInput is the same as getSizeFromInput.
+        """
+        self.assertEqual(
+           list(getSizesFromInput(values, units, config)),
+           [getSizeFromInput(v, units, config) for v in values]
+        )
+
+    def testStrings(self):
+        """
+        Test that strings may include their units.
+        """
+        self.assertEqual(
+           list(getSizesFromInput(["1 KiB", "3MB", 7])),
+           [Size(1024), Size(3 * 1000 ** 2), Size(7)]
+        )
+        self.assertEqual(
+           list(getSizesFromInput(iter(["1.5 KiB"]), config=InputConfig(KiB))),
+           [Size(1, KiB)]
+        )
+
+    def testExceptions(self):
+        """
+        Test exceptions.
+        """
+        with self.assertRaises(SizeValueError):
+            roundSizes([], Size(-1), ROUND_UP)
+        with self.assertRaises(SizeValueError):
+            roundSizes([], KiB, None)
+        with self.assertRaises(SizeValueError):
+            list(roundSizes([1], KiB, ROUND_UP))
+        self.assertEqual(list(roundSizes([Size(3)], Size(0), ROUND_UP)), [Size(0)])
@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# Copyright (C) 2015  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+""" Tests for statistics of many Sizes. """
+
+from fractions import Fraction
+
+import pickle
+import unittest
+
+from hypothesis import given
+from hypothesis import strategies
+from hypothesis import Settings
+
+from bytesize import KiB
+from bytesize import Size
+from bytesize import SizeStats
+
+from bytesize._errors import SizeValueError
+
+from bytesize._util.sketch import QuantileSketch
+
+from .utils import SIZE_STRATEGY
+
+
+class StatsTestCase(unittest.TestCase):
+    """ Test accumulating statistics. """
+
+    @given(
+       strategies.lists(SIZE_STRATEGY, min_size=1, max_size=20),
+       settings=Settings(max_examples=20)
+    )
+    def testExact(self, sizes):
+        """ Test exact statistics against direct computation. """
+        stats = SizeStats(sizes)
+        magnitudes = [s.magnitude for s in sizes]
+        mean = sum(magnitudes) / len(magnitudes)
+        self.assertEqual(stats.count, len(sizes))
+        self.assertEqual(stats.total, sum(sizes, Size(0)))
+        self.assertEqual(stats.min, min(sizes))
+        self.assertEqual(stats.max, max(sizes))
+        self.assertEqual(stats.mean, Size(mean))
+        self.assertEqual(
+           stats.variance,
+           sum((m - mean) ** 2 for m in magnitudes) / len(magnitudes)
+        )
+
+    @given(
+       strategies.lists(SIZE_STRATEGY, max_size=20),
+       strategies.lists(SIZE_STRATEGY, max_size=20),
+       settings=Settings(max_examples=20)
+    )
+    def testMerge(self, sizes1, sizes2):
+        """ Test that merging is the same as adding all the sizes. """
+        stats = SizeStats(sizes1)
+        stats.merge(pickle.loads(pickle.dumps(SizeStats(sizes2))))
+        expected = SizeStats(sizes1 + sizes2)
+        self.assertEqual(stats.count, expected.count)
+        self.assertEqual(stats.total, expected.total)
+        self.assertEqual(stats.min, expected.min)
+        self.assertEqual(stats.max, expected.max)
+        self.assertEqual(stats.variance, expected.variance)
+        self.assertEqual(stats.quantile(Fraction(1, 2)), expected.quantile(0.5))
+
+    def testEmpty(self):
+        """ Test statistics of no sizes. """
+        stats = SizeStats()
+        self.assertEqual(stats.count, 0)
+        self.assertEqual(stats.total, Size(0))
+        self.assertIsNone(stats.min)
+        self.assertIsNone(stats.mean)
+        self.assertIsNone(stats.variance)
+        self.assertIsNone(stats.quantile(0.5))
+        self.assertEqual(str(stats), "SizeStats(count=0)")
+
+    def testExceptions(self):
+        """ Test exceptions. """
+        with self.assertRaises(SizeValueError):
+            SizeStats([1])
+        with self.assertRaises(SizeValueError):
+            SizeStats([Size(1)]).quantile(Fraction(3, 2))
+
+    def testQuantiles(self):
+        """ Test approximate quantiles of many sizes. """
+        stats = SizeStats((Size(i, KiB) for i in range(100000)), k=200)
+        self.assertEqual(stats.quantile(0), Size(0))
+        self.assertEqual(stats.quantile(1), Size(99999, KiB))
+        for fraction in (Fraction(1, 2), Fraction(95, 100), Fraction(99, 100)):
+            rank = stats.quantile(fraction).convertTo(KiB)
+            self.assertLess(abs(rank - fraction * 100000), 2000)
+
+    def testStr(self):
+        """ Test that the results are displayed as Sizes. """
+        stats = SizeStats([Size(1, KiB), Size(3, KiB)])
+        self.assertEqual(
+           str(stats),
+           "SizeStats(count=2, min=%s, mean=%s, max=%s)" % \
+              (Size(1, KiB), Size(2, KiB), Size(3, KiB))
+        )
+
+class SketchTestCase(unittest.TestCase):
+    """ Test the quantile sketch. """
+
+    def testBounded(self):
+        """ Test that the sketch is small, but stands for every value. """
+        sketch = QuantileSketch(k=50)
+        for value in range(50000):
+            sketch.add(value)
+        self.assertEqual(len(sketch), 50000)
+        # pylint: disable=protected-access
+        self.assertLess(sketch._size, 500)
+
+    def testSmall(self):
+        """ Test that quantiles are exact until the sketch compacts. """
+        sketch = QuantileSketch()
+        for value in range(10):
+            sketch.add(value)
+        self.assertEqual(sketch.quantiles([0, 0.5, 1]), [0, 4, 9])
@@ -26,12 +26,17 @@ from hypothesis import given
 from hypothesis import strategies
 from hypothesis import Settings
 
+from bytesize._constants import B
+from bytesize._constants import BinaryUnits
+from bytesize._constants import DecimalUnits
 from bytesize._constants import RoundingMethods
 from bytesize._errors import SizeValueError
 from bytesize._util.math_util import get_repeating_fraction
+from bytesize._util.math_util import is_exact_decimal
 from bytesize._util.math_util import round_fraction
 from bytesize._util.misc import get_string_info
 from bytesize._util.misc import long_decimal_division
+from bytesize._util.units import get_unit_table
 
 from .utils import NUMBERS_STRATEGY
 
@@ -62,6 +67,55 @@ class FormatTestCase(unittest.TestCase):
         self.assertEqual(sign * Fraction("%s.%s" % (left, right)), x)
         self.assertTrue(exact)
 
+    @given(
+       strategies.fractions(),
+       strategies.integers(min_value=0, max_value=10),
+       settings=Settings(max_examples=50)
+    )
+    def testRounding(self, x, places):
+        """ The value shown is the nearest, rounding down on a tie. """
+        (exact, sign, left, right) = get_string_info(x, places=places)
+        value = Fraction("%s.%s" % (left, right or "0"))
+        error = abs(x) - value
+        self.assertEqual(sign, -1 if x < 0 else 1)
+        self.assertEqual(len(right), places)
+        self.assertEqual(exact, error == 0)
+        self.assertLessEqual(abs(error), Fraction(1, 2 * 10 ** places))
+        if abs(error) == Fraction(1, 2 * 10 ** places):
+            self.assertGreater(error, 0)
+
+    def testLongPeriod(self):
+        """ Few places of a value with a very long period are quick. """
+        x = Fraction(1, 2 ** 20 * 999983) - 2
+        self.assertEqual(
+           get_string_info(x, places=12),
+           (False, -1, "1", "999999999999")
+        )
+
+
+class IsExactDecimalTestCase(unittest.TestCase):
+    """ Test checking exactness of decimal representation. """
+
+    def testValues(self):
+        """ Test some known values. """
+        self.assertTrue(is_exact_decimal(Fraction(1, 8), None))
+        self.assertTrue(is_exact_decimal(Fraction(1, 8), 3))
+        self.assertFalse(is_exact_decimal(Fraction(1, 8), 2))
+        self.assertFalse(is_exact_decimal(Fraction(1, 3), None))
+        self.assertTrue(is_exact_decimal(Decimal("-2.5"), 1))
+        self.assertTrue(is_exact_decimal(7, 0))
+
+    @given(
+       strategies.fractions(),
+       strategies.integers(min_value=0, max_value=10),
+       settings=Settings(max_examples=50)
+    )
+    def testAgreement(self, x, places):
+        """ Agrees with the exactness of the value's string information. """
+        self.assertEqual(
+           is_exact_decimal(x, places),
+           get_string_info(x, places=places)[0]
+        )
 
 class RoundingTestCase(unittest.TestCase):
     """ Test rounding of fraction. """
@@ -208,3 +262,99 @@ class GetRepeatingFractionTestCase(unittest.TestCase):
             get_repeating_fraction(-1, 1)
         with self.assertRaises(SizeValueError):
             get_repeating_fraction(3, 2)
+
+    def testValues(self):
+        """
+        Test some known values.
+        """
+        self.assertEqual(get_repeating_fraction(0, 7), ([], 0))
+        self.assertEqual(get_repeating_fraction(1, 8), ([1, 2, 5], 0))
+        self.assertEqual(get_repeating_fraction(2, 4), ([5], 0))
+        self.assertEqual(get_repeating_fraction(1, 6), ([1, 6], 1))
+        self.assertEqual(get_repeating_fraction(1, 7), ([1, 4, 2, 8, 5, 7], 6))
+        self.assertEqual(get_repeating_fraction(7, 12), ([5, 8, 3], 1))
+        self.assertEqual(get_repeating_fraction(3, 3), ([10], 0))
+
+    def testLongPeriod(self):
+        """
+        A denominator with a long period is handled quickly.
+        """
+        (digits, repeat_len) = get_repeating_fraction(1, 2 ** 5 * 999983)
+        self.assertEqual(len(digits) - repeat_len, 5)
+        self.assertEqual(repeat_len, 999982)
+
+    @given(
+       strategies.integers(min_value=1, max_value=4000),
+       strategies.integers(min_value=0),
+       settings=Settings(max_examples=50)
+    )
+    def testReconstruction(self, denominator, numerator):
+        """
+        The digits and the repeat length give back the original value.
+        """
+        numerator = numerator % denominator
+        (digits, repeat_len) = get_repeating_fraction(numerator, denominator)
+        non_repeating_len = len(digits) - repeat_len
+        non_repeating = \
+           int("".join(str(d) for d in digits[:non_repeating_len]) or "0")
+        repeating = \
+           int("".join(str(d) for d in digits[non_repeating_len:]) or "0")
+        value = Fraction(non_repeating, 10 ** non_repeating_len)
+        if repeat_len != 0:
+            value += Fraction(
+               repeating,
+               10 ** non_repeating_len * (10 ** repeat_len - 1)
+            )
+        self.assertEqual(value, Fraction(numerator, denominator))
+
+
+class UnitTableTestCase(unittest.TestCase):
+    """
+    Test selecting units with a unit table.
+    """
+
+    @given(
+       strategies.one_of(
+          strategies.integers(),
+          strategies.fractions(),
+          strategies.builds(
+             lambda n, e: n * 2 ** e,
+             strategies.integers(min_value=-1024, max_value=1024),
+             strategies.integers(min_value=0, max_value=90)
+          )
+       ),
+       strategies.booleans(),
+       strategies.fractions(min_value=0, max_value=1024),
+       settings=Settings(max_examples=100)
+    )
+    def testSelection(self, magnitude, binary_units, min_value):
+        """
+        Selects the smallest unit for which the value is less than
+        FACTOR * min_value, or the largest unit if there is none.
+        """
+        units = BinaryUnits if binary_units else DecimalUnits
+        candidates = [B] + units.UNITS()
+        limit = units.FACTOR * min_value
+        expected = next(
+           (u for u in candidates if abs(Fraction(magnitude, int(u))) < limit),
+           candidates[-1]
+        )
+        table = get_unit_table(binary_units, min_value)
+        self.assertEqual(table.units[table.select(magnitude)], expected)
+
+    def testSubByte(self):
+        """
+        Selects units correctly for magnitudes less than one byte when
+        several limits are less than one byte.
+        """
+        table = get_unit_table(True, Fraction(1, 2 ** 40))
+        self.assertEqual(table.units[table.select(Fraction(1, 2 ** 31))], B)
+        self.assertEqual(
+           table.units[table.select(Fraction(1, 2 ** 15))],
+           BinaryUnits.MiB
+        )
+        self.assertEqual(
+           table.units[table.select(-Fraction(1, 2 ** 5))],
+           BinaryUnits.GiB
+        )
+